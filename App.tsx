@@ -1,7 +1,7 @@
 
 import React, { useState, useEffect } from 'react';
 import { Phase, Teacher, Specialization, Subject, ClassInfo, Assignment, SchoolInfo, Message, CalendarEvent, DailyScheduleItem, SubscriptionInfo, Student, Admin, ScheduleSettingsData, EntityType } from './types';
-import { INITIAL_SPECIALIZATIONS, INITIAL_SUBJECTS } from './constants';
+import { INITIAL_SPECIALIZATIONS } from './constants';
 import { MessageArchiveProvider } from './components/messaging/MessageArchiveContext';
 
 import Dashboard from './components/Dashboard';
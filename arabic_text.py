@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Arabic text normalization shared by the plan readers and classifiers.
+
+Two levels, both memoized per distinct value and returning interned strings:
+
+clean(value)
+    NFKC (presentation forms, non-breaking spaces), tatweel and diacritics
+    removed, whitespace collapsed. Applied once at ingest by plan_reader, so
+    it must keep the text displayable as-is.
+
+fold(value)
+    clean() plus letter folding: أ/إ/آ/ٱ -> ا, ى -> ي, ة -> ه. Only used as a
+    comparison key, never written to the generated files.
+
+contains(text, *words) is the substring test the classifiers use instead of
+`word in text`, so 'الأولى' and 'الاولى' or 'الثانوية' and 'الثانويه' match.
+"""
+
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+
+# التطويل والتشكيل (الفتحة .. السكون، الألف الخنجرية، علامات القرآن الصغيرة)
+STRIP_RE = re.compile(r"[\u0640\u064B-\u065F\u0670\u06D6-\u06ED]")
+
+FOLD_TABLE = str.maketrans({
+    'أ': 'ا',
+    'إ': 'ا',
+    'آ': 'ا',
+    'ٱ': 'ا',
+    'ى': 'ي',
+    'ة': 'ه',
+})
+
+
+@lru_cache(maxsize=None)
+def _clean(text):
+    text = unicodedata.normalize('NFKC', text)
+    text = STRIP_RE.sub('', text)
+    return sys.intern(' '.join(text.split()))
+
+
+def clean(value):
+    """Display-safe normalization; None and empty cells give None."""
+    if value is None:
+        return None
+    text = _clean(str(value))
+    return text or None
+
+
+@lru_cache(maxsize=None)
+def _fold(text):
+    return sys.intern(_clean(text).translate(FOLD_TABLE))
+
+
+def fold(value):
+    """Comparison key: clean() plus alef / yaa / taa marbuta folding."""
+    if value is None:
+        return ''
+    return _fold(str(value))
+
+
+def contains(text, *words):
+    """True if any of `words` occurs in `text`, compared on fold() keys."""
+    key = fold(text)
+    return any(fold(word) in key for word in words)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batch generation of study plans from several workbooks.
+
+Each source is a workbook, a directory (searched recursively for *.xlsx) or
+a glob pattern. Workbooks are parsed in parallel in a process pool, and every
+plan key is namespaced with the workbook's year and region:
+
+    plans/الرياض/الخطط الدراسية 1447هـ.xlsx  ->  sp_1447_الرياض_<phase>_<dept>_<grade>
+
+The year is the 4-digit number in the file name; the region is whatever is
+left of the file name after the title and the year, or else the workbook's
+sub-directory below the source directory.
+
+A workbook that fails to parse is reported and skipped; the others are still
+merged, and the plans already in the output under the failed workbook's
+namespace are kept as they are. The output is updated with the same
+incremental writer as generate_study_plans.py, so unchanged plans stay
+byte-identical. It defaults to a separate file because study_plans_config.ts
+refers to the bare keys in study_plans.ts.
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from generate_study_plans import build_plans, key_part, read_text, update_plans_text, write_if_changed
+from plan_cache import load_plan_rows
+
+OUTPUT_FILE = "study_plans_batch.ts"
+
+YEAR_RE = re.compile(r"(\d{4})\s*هـ?")
+# عناوين الملفات المعتادة لا تدخل في اسم المنطقة
+TITLE_WORDS = ("الخطط الدراسية", "خطة المقررات الدراسية")
+
+
+def discover_workbooks(sources):
+    """Return [(path, namespace)] sorted by path, without duplicates."""
+    found = OrderedDict()
+    for source in sources:
+        if os.path.isdir(source):
+            paths = glob.glob(os.path.join(source, "**", "*.xlsx"), recursive=True)
+            root = source
+        else:
+            paths = glob.glob(source) or [source]
+            root = None
+        for path in sorted(paths):
+            # ملفات القفل التي ينشئها Excel أثناء فتح الملف
+            if os.path.basename(path).startswith("~$"):
+                continue
+            found.setdefault(os.path.normpath(path), workbook_namespace(path, root))
+    return list(found.items())
+
+
+def workbook_namespace(path, root=None):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    match = YEAR_RE.search(stem)
+    year = match.group(1) if match else ''
+
+    region = YEAR_RE.sub(' ', stem)
+    for title in TITLE_WORDS:
+        region = region.replace(title, ' ')
+    region = key_part(region)
+    if not region and root is not None:
+        parent = os.path.relpath(os.path.dirname(path), root)
+        if parent != os.curdir:
+            region = key_part(parent.replace(os.sep, ' '))
+
+    return '_'.join(part for part in (year, region) if part)
+
+
+def parse_workbook(path, namespace):
+    """Worker: return (plans, row count, seconds) for one workbook."""
+    started = time.perf_counter()
+    rows = load_plan_rows(path)
+    plans = build_plans(rows, namespace)
+    return plans, len(rows), time.perf_counter() - started
+
+
+def key_owner(key, namespaces):
+    """The namespace whose prefix matches `key` longest ('' owns bare sp_ keys)."""
+    owners = [ns for ns in namespaces if key.startswith(f"sp_{ns}_" if ns else "sp_")]
+    return max(owners, key=len) if owners else None
+
+
+def run_batch(workbooks, workers=None):
+    """
+    Parse workbooks in parallel. Returns (merged plans, failures) where
+    failures is [(path, message)]; plans are merged in workbook order.
+    """
+    results = {}
+    failures = []
+
+    # المساحة المكررة تعني أن خطتين ستحملان نفس المفاتيح
+    owners = {}
+    jobs = []
+    for path, namespace in workbooks:
+        if namespace in owners:
+            failures.append((path, f"نفس السنة/المنطقة '{namespace}' مستخدمة في {owners[namespace]}"))
+        else:
+            owners[namespace] = path
+            jobs.append((path, namespace))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [(path, namespace, pool.submit(parse_workbook, path, namespace)) for path, namespace in jobs]
+        for path, namespace, future in futures:
+            try:
+                plans, row_count, seconds = future.result()
+            except Exception as e:
+                failures.append((path, f"{type(e).__name__}: {e}"))
+                print(f"  ✗ {path}: {type(e).__name__}: {e}")
+                continue
+            results[path] = plans
+            print(f"  ✓ {path} [{namespace or '-'}]: {row_count} صف، {len(plans)} خطة ({seconds:.2f} ث)")
+
+    merged = OrderedDict()
+    for path, _ in jobs:
+        merged.update(results.get(path, {}))
+    return merged, failures
+
+
+def main(sources, output=OUTPUT_FILE, workers=None, dry_run=False):
+    workbooks = discover_workbooks(sources)
+    if not workbooks:
+        print("✗ لم يتم العثور على ملفات Excel")
+        return 1
+
+    print(f"✓ عدد الملفات: {len(workbooks)}")
+    started = time.perf_counter()
+    plans, failures = run_batch(workbooks, workers)
+    print(f"✓ عدد الخطط: {len(plans)} ({time.perf_counter() - started:.2f} ث)")
+
+    # خطط الملفات التي فشلت تبقى كما هي بدلاً من حذفها
+    failed_paths = {path for path, _ in failures}
+    namespaces = {namespace for _, namespace in workbooks}
+    failed = {namespace for path, namespace in workbooks if path in failed_paths} - \
+        {namespace for path, namespace in workbooks if path not in failed_paths}
+
+    text = read_text(output)
+    new_text, changed, added, removed = update_plans_text(
+        text, plans, keep=lambda key: key_owner(key, namespaces) in failed)
+    if not dry_run:
+        write_if_changed(output, text, new_text)
+    unchanged = len(plans) - len(changed) - len(added)
+    print(f"✓ {output}: بدون تغيير: {unchanged} | معدلة: {len(changed)} | جديدة: {len(added)} | محذوفة: {len(removed)}"
+          + (" (بدون كتابة)" if dry_run else ""))
+
+    for path, message in failures:
+        print(f"  ! فشل: {path}: {message}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="توليد الخطط الدراسية من عدة ملفات Excel بالتوازي")
+    parser.add_argument('sources', nargs='+', help="ملفات أو مجلدات أو أنماط glob")
+    parser.add_argument('-o', '--output', default=OUTPUT_FILE)
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="عدد العمليات (الافتراضي: عدد المعالجات)")
+    parser.add_argument('--dry-run', action='store_true', help="عرض النتيجة بدون كتابة الملف")
+    args = parser.parse_args()
+    sys.exit(main(args.sources, args.output, args.workers, args.dry_run))
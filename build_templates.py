@@ -1,111 +1,83 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import openpyxl
+from arabic_text import contains
+from grades import grade_code as shared_grade_code
+from plan_cache import load_plan_rows
 
-# فتح ملف Excel
+# ملف Excel
 excel_file = "خطة المقررات الدراسية 1447هـ.xlsx"
-workbook = openpyxl.load_workbook(excel_file)
-worksheet = workbook.active
 
-# قراءة البيانات
+# قراءة البيانات (من الذاكرة المؤقتة إن لم يتغير الملف)
 data = []
-for row in worksheet.iter_rows(min_row=2, values_only=True):
-    # التأكد من أن الصف ليس فارغاً
-    if row[0] is not None and row[0] != "المرحلة":
-        # تخطي أسطر الرؤساء الإضافية
-        if row[0] == "الصف الدراسي":
-            continue
-        
-        # تنظيف المسافات الزائدة من كل الأعمدة
-        phase = str(row[0]).strip() if row[0] else None
-        grade = ' '.join(str(row[1]).split()) if row[1] else None  # تنظيف المسافات المتعددة
-        subject = str(row[2]).strip() if row[2] else None
-        periods = int(row[3]) if row[3] and isinstance(row[3], int) else 0
-        
-        if phase and grade and subject:
-            data.append({
-                'phase': phase,
-                'grade': grade,
-                'subject': subject,
-                'periods': periods
-            })
+for row in load_plan_rows(excel_file):
+    if row.phase and row.grade and row.subject:
+        data.append({
+            'phase': row.phase,
+            'grade': row.grade,
+            'subject': row.subject,
+            'periods': row.periods or 0
+        })
 
 print(f"✓ تم قراءة {len(data)} مادة من Excel\n")
 
 # تحديد نوع المرحلة
 def get_phase_type(phase_name):
-    if 'ابتدائي' in phase_name:
+    if contains(phase_name, 'ابتدائي'):
         return 'ELEMENTARY'
-    elif 'متوسط' in phase_name:
+    elif contains(phase_name, 'متوسط'):
         return 'MIDDLE'
-    elif 'ثانوي' in phase_name:
+    elif contains(phase_name, 'ثانوي'):
         return 'HIGH'
     return 'ELEMENTARY'
 
 # استخراج الشعبة من اسم المرحلة
 def get_department(phase_name):
-    if 'تحفيظ' in phase_name:
+    if contains(phase_name, 'تحفيظ'):
         return 'تحفيظ'
-    elif 'حاسب' in phase_name or 'هندسة' in phase_name:
+    elif contains(phase_name, 'حاسب', 'هندسة'):
         return 'حاسب وهندسة'
-    elif 'صحة' in phase_name or 'حياة' in phase_name:
+    elif contains(phase_name, 'صحة', 'حياة'):
         return 'صحة وحياة'
-    elif 'إدارة' in phase_name or 'أعمال' in phase_name:
+    elif contains(phase_name, 'إدارة', 'أعمال'):
         return 'إدارة أعمال'
-    elif 'شرعي' in phase_name:
+    elif contains(phase_name, 'شرعي'):
         return 'شرعي'
     else:
         return 'عام'
 
 # تحويل اسم الصف إلى كود
 def get_grade_code(grade_name):
-    grade_clean = grade_name.strip().replace('  ', ' ')
-    
-    if 'الصف الأول' in grade_clean and '/' not in grade_clean:
-        return 'grade1'
-    elif 'الصف الثاني' in grade_clean and '/' not in grade_clean:
-        return 'grade2'
-    elif 'الصف الثالث' in grade_clean and '/' not in grade_clean:
-        return 'grade3'
-    elif 'الصفوف العليا' in grade_clean or '4-6' in grade_clean:
-        return 'upper'
-    elif 'والثاني والثالث' in grade_clean:
-        return 'grades123'
-    elif 'والثاني' in grade_clean:
-        return 'grades12'
-    elif 'والثالث' in grade_clean:
-        return 'grades23'
-    else:
-        return 'mixed'
+    # المحلل المشترك في grades.py: grade1 .. grade6, grades123, upper, ...
+    return shared_grade_code(grade_name) or 'mixed'
 
 # إنشاء اسم export
 def make_export_name(phase_name, grade_code):
     phase_type = get_phase_type(phase_name).lower()
     
     # استخراج المسار/الشعبة
-    if 'مسار عام' in phase_name:
+    if contains(phase_name, 'مسار عام'):
         path = 'general'
-    elif 'مسار حاسب' in phase_name:
+    elif contains(phase_name, 'مسار حاسب'):
         path = 'cs_eng'
-    elif 'مسار صحة' in phase_name:
+    elif contains(phase_name, 'مسار صحة'):
         path = 'health'
-    elif 'مسار إدارة' in phase_name:
+    elif contains(phase_name, 'مسار إدارة'):
         path = 'business'
-    elif 'مسار شرعي' in phase_name:
+    elif contains(phase_name, 'مسار شرعي'):
         path = 'islamic'
-    elif 'تحفيظ' in phase_name:
+    elif contains(phase_name, 'تحفيظ'):
         path = 'quran'
     else:
         path = 'general'
     
     # استخراج السنة من الثانوية
     year = ''
-    if 'الأولى' in phase_name:
+    if contains(phase_name, 'الأولى'):
         year = 'y1'
-    elif 'الثانية' in phase_name:
+    elif contains(phase_name, 'الثانية'):
         year = 'y2'
-    elif 'الثالثة' in phase_name:
+    elif contains(phase_name, 'الثالثة'):
         year = 'y3'
     
     # بناء الاسم
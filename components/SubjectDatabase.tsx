@@ -1,6 +1,6 @@
-import React, { useState, useMemo } from 'react';
+import React, { useState, useMemo, useEffect } from 'react';
 import { Phase, Subject, Specialization } from '../types';
-import { DETAILED_TEMPLATES } from '../constants';
+import { loadAllStudyPlans } from '../study_plan_chunks';
 import { 
   Database, CheckCircle2, School, GraduationCap, Building, Plus, X, 
   BookOpen, Sparkles, LayoutGrid, CalendarDays, ArrowRight, Eye, Info 
@@ -30,20 +30,30 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
     semester: 1 as 1 | 2
   });
 
+  // الخطط تحمّل عند فتح الصفحة وليس عند بدء التطبيق
+  const [templates, setTemplates] = useState<Record<string, Subject[]>>({});
+  useEffect(() => {
+    let cancelled = false;
+    loadAllStudyPlans()
+      .then(plans => { if (!cancelled) setTemplates(plans); })
+      .catch(() => { if (!cancelled) alert('تعذر تحميل الخطط الدراسية، تحقق من الاتصال وحاول مرة أخرى'); });
+    return () => { cancelled = true; };
+  }, []);
+
   const activeTemplates = useMemo(() => {
-    return Object.keys(DETAILED_TEMPLATES).filter(key => {
-      const templateIds = DETAILED_TEMPLATES[key].map(s => s.id);
+    return Object.keys(templates).filter(key => {
+      const templateIds = templates[key].map(s => s.id);
       return subjects.some(s => templateIds.includes(s.id));
     });
-  }, [subjects]);
+  }, [subjects, templates]);
 
   const isPlanActive = (planKey: string) => {
-    const templateIds = DETAILED_TEMPLATES[planKey]?.map(s => s.id) || [];
+    const templateIds = templates[planKey]?.map(s => s.id) || [];
     return subjects.some(s => templateIds.includes(s.id));
   };
 
   const handleAdoptPlan = (key: string) => {
-    const template = DETAILED_TEMPLATES[key];
+    const template = templates[key];
     if (!template) return;
 
     // 1. Add subjects to global list
@@ -96,7 +106,7 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
 
   const handleRemovePlan = (key: string) => {
     if (confirm(`تحذير: سيتم حذف كافة مواد هذه الخطة من النظام. هل أنت متأكد؟`)) {
-      const templateIds = new Set(DETAILED_TEMPLATES[key].map(s => s.id));
+      const templateIds = new Set(templates[key].map(s => s.id));
       setSubjects(prev => prev.filter(s => !templateIds.has(s.id)));
       
       // Also remove from grade mapping to keep clean
@@ -115,7 +125,7 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
   const handleAdoptDivision = (divisionKeys: string[]) => {
     setSubjects(prev => {
       const existingIds = new Set(prev.map(s => s.id));
-      const allSubjects = divisionKeys.flatMap(key => DETAILED_TEMPLATES[key] || []);
+      const allSubjects = divisionKeys.flatMap(key => templates[key] || []);
       const filteredSubjects = allSubjects.filter(s => !existingIds.has(s.id));
       return [...prev, ...filteredSubjects];
     });
@@ -125,7 +135,7 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
         const nextMap = { ...prev };
         
         divisionKeys.forEach(planKey => {
-            const template = DETAILED_TEMPLATES[planKey];
+            const template = templates[planKey];
             if (!template) return;
             
             const gradeNames = ['الأول', 'الثاني', 'الثالث', 'الرابع', 'الخامس', 'السادس'];
@@ -159,7 +169,7 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
   
   const handleRemoveDivision = (divisionKeys: string[]) => {
     if (confirm('تحذير: سيتم حذف كافة مواد هذا القسم من النظام ومن الصفوف. هل أنت متأكد؟')) {
-      const allSubjectIds = new Set(divisionKeys.flatMap(key => DETAILED_TEMPLATES[key]?.map(s => s.id) || []));
+      const allSubjectIds = new Set(divisionKeys.flatMap(key => templates[key]?.map(s => s.id) || []));
       setSubjects(prev => prev.filter(s => !allSubjectIds.has(s.id)));
       
       setGradeSubjectMap(prev => {
@@ -175,7 +185,7 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
   };
   
   const isDivisionActive = (divisionKeys: string[]): boolean => {
-    const allSubjectIds = divisionKeys.flatMap(key => DETAILED_TEMPLATES[key]?.map(s => s.id) || []);
+    const allSubjectIds = divisionKeys.flatMap(key => templates[key]?.map(s => s.id) || []);
     return allSubjectIds.some(id => subjects.some(s => s.id === id));
   };
   
@@ -209,7 +219,7 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
 
   const renderPlanPreview = () => {
     if (!viewingPlan) return null;
-    const template = DETAILED_TEMPLATES[viewingPlan];
+    const template = templates[viewingPlan];
     const isHighSchool = viewingPlan.includes('excel_1447_high_');
     const isActive = isPlanActive(viewingPlan);
 
@@ -337,7 +347,7 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
                        grade={String(grade)}
                        planKey={`excel_1447_elem_gen_الصف_${['الأول', 'الثاني', 'الثالث', 'الرابع', 'الخامس', 'السادس'][grade - 1]}`}
                        isActive={isPlanActive(`excel_1447_elem_gen_الصف_${['الأول', 'الثاني', 'الثالث', 'الرابع', 'الخامس', 'السادس'][grade - 1]}`)}
-                       subjectCount={DETAILED_TEMPLATES[`excel_1447_elem_gen_الصف_${['الأول', 'الثاني', 'الثالث', 'الرابع', 'الخامس', 'السادس'][grade - 1]}`]?.length || 0}
+                       subjectCount={templates[`excel_1447_elem_gen_الصف_${['الأول', 'الثاني', 'الثالث', 'الرابع', 'الخامس', 'السادس'][grade - 1]}`]?.length || 0}
                        onView={() => setViewingPlan(`excel_1447_elem_gen_الصف_${['الأول', 'الثاني', 'الثالث', 'الرابع', 'الخامس', 'السادس'][grade - 1]}`)}
                        color="emerald"
                      />
@@ -366,7 +376,7 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
                        grade={String(grade)}
                        planKey={`excel_1447_elem_quran_الصف_${['الأول', 'الثاني', 'الثالث', 'الرابع', 'الخامس', 'السادس'][grade - 1]}`}
                        isActive={isPlanActive(`excel_1447_elem_quran_الصف_${['الأول', 'الثاني', 'الثالث', 'الرابع', 'الخامس', 'السادس'][grade - 1]}`)}
-                       subjectCount={DETAILED_TEMPLATES[`excel_1447_elem_quran_الصف_${['الأول', 'الثاني', 'الثالث', 'الرابع', 'الخامس', 'السادس'][grade - 1]}`]?.length || 0}
+                       subjectCount={templates[`excel_1447_elem_quran_الصف_${['الأول', 'الثاني', 'الثالث', 'الرابع', 'الخامس', 'السادس'][grade - 1]}`]?.length || 0}
                        onView={() => setViewingPlan(`excel_1447_elem_quran_الصف_${['الأول', 'الثاني', 'الثالث', 'الرابع', 'الخامس', 'السادس'][grade - 1]}`)}
                        color="amber"
                      />
@@ -400,7 +410,7 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
                        grade={String(grade)}
                        planKey={`excel_1447_mid_gen_الصف_${['الأول', 'الثاني', 'الثالث'][grade - 1]}`}
                        isActive={isPlanActive(`excel_1447_mid_gen_الصف_${['الأول', 'الثاني', 'الثالث'][grade - 1]}`)}
-                       subjectCount={DETAILED_TEMPLATES[`excel_1447_mid_gen_الصف_${['الأول', 'الثاني', 'الثالث'][grade - 1]}`]?.length || 0}
+                       subjectCount={templates[`excel_1447_mid_gen_الصف_${['الأول', 'الثاني', 'الثالث'][grade - 1]}`]?.length || 0}
                        onView={() => setViewingPlan(`excel_1447_mid_gen_الصف_${['الأول', 'الثاني', 'الثالث'][grade - 1]}`)}
                        color="blue"
                      />
@@ -429,7 +439,7 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
                        grade={String(grade)}
                        planKey={`excel_1447_mid_quran_الصف_${['الأول', 'الثاني', 'الثالث'][grade - 1]}`}
                        isActive={isPlanActive(`excel_1447_mid_quran_الصف_${['الأول', 'الثاني', 'الثالث'][grade - 1]}`)}
-                       subjectCount={DETAILED_TEMPLATES[`excel_1447_mid_quran_الصف_${['الأول', 'الثاني', 'الثالث'][grade - 1]}`]?.length || 0}
+                       subjectCount={templates[`excel_1447_mid_quran_الصف_${['الأول', 'الثاني', 'الثالث'][grade - 1]}`]?.length || 0}
                        onView={() => setViewingPlan(`excel_1447_mid_quran_الصف_${['الأول', 'الثاني', 'الثالث'][grade - 1]}`)}
                        color="amber"
                      />
@@ -451,7 +461,7 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
                   </div>
 
                   {[1, 2, 3].map(gradeNum => {
-                    const gradeTemplates = Object.keys(DETAILED_TEMPLATES)
+                    const gradeTemplates = Object.keys(templates)
                       .filter(key => key.includes(`excel_1447_high_grade_${gradeNum}_pathway_`))
                       .sort();
                     
@@ -517,9 +527,9 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
                         </div>
                         
                         <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
-                            {Object.entries(pathwayGroups).map(([pathway, templates]) => {
-                            const semesterOne = templates.filter(t => t.includes('_sem_1'));
-                            const semesterTwo = templates.filter(t => t.includes('_sem_2'));
+                            {Object.entries(pathwayGroups).map(([pathway, pathwayKeys]) => {
+                            const semesterOne = pathwayKeys.filter(t => t.includes('_sem_1'));
+                            const semesterTwo = pathwayKeys.filter(t => t.includes('_sem_2'));
                             
                             return (
                                 <div key={pathway} className={`rounded-xl p-4 border ${colors.bg} ${colors.border} hover:shadow-md transition-all`}>
@@ -533,7 +543,7 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
                                         <p className={`text-[9px] font-bold uppercase tracking-wide mb-2 ${colors.text} opacity-60`}>الفصل الأول</p>
                                         <div className="flex flex-col gap-1.5">
                                         {semesterOne.map(key => {
-                                            const subjects = DETAILED_TEMPLATES[key] || [];
+                                            const subjects = templates[key] || [];
                                             const active = isPlanActive(key);
                                             return (
                                             <div key={key} className="flex items-center gap-1.5">
@@ -568,7 +578,7 @@ const SubjectDatabase: React.FC<Props> = ({ subjects, setSubjects, specializatio
                                         <p className={`text-[9px] font-bold uppercase tracking-wide mb-2 ${colors.text} opacity-60`}>الفصل الثاني</p>
                                         <div className="flex flex-col gap-1.5">
                                         {semesterTwo.map(key => {
-                                            const subjects = DETAILED_TEMPLATES[key] || [];
+                                            const subjects = templates[key] || [];
                                             const active = isPlanActive(key);
                                             return (
                                             <div key={key} className="flex items-center gap-1.5">
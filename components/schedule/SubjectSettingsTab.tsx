@@ -166,10 +166,10 @@ export default function SubjectSettingsTab({ subjects, constraints, gradeSubject
                     <div className="flex gap-2 mt-1">
                       <span className="text-[10px] bg-blue-50 text-blue-600 px-2.5 py-0.5 rounded-full font-bold">النصاب: {selectedSubject.periodsPerClass} حصة</span>
                       <span className="text-[10px] bg-emerald-50 text-emerald-600 px-2.5 py-0.5 rounded-full font-bold">
-                        الحد اليومي: {getMaxDailyPeriodsForSubject(selectedSubject.periodsPerClass, weekDays)} حصة
+                        الحد اليومي: {getMaxDailyPeriodsForSubject(selectedSubject.periodsPerClass, weekDays, selectedSubject.id)} حصة
                       </span>
                       <span className="text-[10px] bg-slate-50 text-slate-500 px-2.5 py-0.5 rounded-full font-bold">
-                        {describeDistribution(selectedSubject.periodsPerClass, weekDays)}
+                        {describeDistribution(selectedSubject.periodsPerClass, weekDays, selectedSubject.id)}
                       </span>
                     </div>
                   </div>
@@ -1,8 +1,10 @@
 import React, { useState, useMemo, useEffect, useRef } from 'react';
 import { X, Book, GraduationCap, Building, School, Activity, Star, Check, Printer, Eye, ChevronDown, ChevronLeft, Info, CheckCircle2 } from 'lucide-react';
-import { Phase, SchoolInfo } from '../../types';
+import { Phase, SchoolInfo, Subject } from '../../types';
 import { STUDY_PLANS_CONFIG, StudyPlanDepartment, StudyPlanEntry } from '../../study_plans_config';
-import { DETAILED_TEMPLATES } from '../../constants';
+import { loadStudyPlan, loadStudyPlans } from '../../study_plan_chunks';
+
+const PLAN_LOAD_ERROR = 'تعذر تحميل الخطة الدراسية، تحقق من الاتصال وحاول مرة أخرى';
 
 // ── Print CSS ────────────────────────────────────────────────────────────────
 const PRINT_CSS = `
@@ -60,7 +62,7 @@ const getPhaseIcon = (phase: Phase) => {
 interface StudyPlansModalProps {
   isOpen: boolean;
   onClose: () => void;
-  onApprovePlan: (phase: Phase, departmentId: string, planKeys: string[], periodsOverride?: Record<string, number>) => void;
+  onApprovePlan: (phase: Phase, departmentId: string, planKeys: string[], periodsOverride?: Record<string, number>) => void | Promise<void>;
   schoolPhases: Phase[];
   activeSchoolId: string;
   onSchoolChange: (id: string) => void;
@@ -119,7 +121,17 @@ const StudyPlansModal: React.FC<StudyPlansModalProps> = ({
     if (selectedSubDept) setSelectedPlanKey(selectedSubDept.plans[0]?.key ?? null);
   }, [selectedSubId]);
 
-  const previewSubjects = selectedPlanKey ? (DETAILED_TEMPLATES[selectedPlanKey] ?? []) : [];
+  // تحميل الخطة المعروضة فقط (وحدة مرحلتها من study_plan_chunks)
+  const [previewSubjects, setPreviewSubjects] = useState<Subject[]>([]);
+  useEffect(() => {
+    let cancelled = false;
+    setPreviewSubjects([]);
+    if (!selectedPlanKey) return;
+    loadStudyPlan(selectedPlanKey)
+      .then(subjects => { if (!cancelled) setPreviewSubjects(subjects); })
+      .catch(() => { if (!cancelled) alert(PLAN_LOAD_ERROR); });
+    return () => { cancelled = true; };
+  }, [selectedPlanKey]);
   const totalPeriods = previewSubjects.reduce((s, x) => s + (x.periodsPerClass ?? 0), 0);
 
   // Whether this is the HS masarat dept that requires semester selection
@@ -149,7 +161,7 @@ const StudyPlansModal: React.FC<StudyPlansModalProps> = ({
         return next;
       });
     }
-  }, [selectedPlanKey, isKindergarten]);
+  }, [previewSubjects, isKindergarten]);
 
   const kgTotal = isKindergarten ? previewSubjects.reduce((s, x) => s + (kgPeriods[x.id] ?? 0), 0) : totalPeriods;
 
@@ -171,11 +183,21 @@ const StudyPlansModal: React.FC<StudyPlansModalProps> = ({
     }
   };
 
-  const handlePrint = (mode: 'plan' | 'dept') => {
+  const handlePrint = async (mode: 'plan' | 'dept') => {
     injectPrintCSS();
     const el = document.getElementById('sp-modal-print');
     if (!el || !selectedCategory || !selectedDepartment) return;
 
+    let plans: Record<string, Subject[]> = {};
+    if (mode === 'dept') {
+      try {
+        plans = await loadStudyPlans(collectAllKeys(selectedDepartment));
+      } catch {
+        alert(PLAN_LOAD_ERROR);
+        return;
+      }
+    }
+
     const TH = 'border:1px solid #e2e8f0;padding:8px 12px;text-align:right;background:#ede9fe;font-weight:900;-webkit-print-color-adjust:exact;print-color-adjust:exact;';
     const TD = 'border:1px solid #e2e8f0;padding:7px 12px;text-align:right;';
 
@@ -199,10 +221,10 @@ const StudyPlansModal: React.FC<StudyPlansModalProps> = ({
       if (selectedDepartment.subDepartments?.length) {
         selectedDepartment.subDepartments.forEach(sd => {
           content += `<h3 style="${SECTION}">${sd.name}</h3>`;
-          sd.plans.forEach(plan => { content += buildTable(plan.label, DETAILED_TEMPLATES[plan.key] || []); });
+          sd.plans.forEach(plan => { content += buildTable(plan.label, plans[plan.key] || []); });
         });
       } else {
-        selectedDepartment.plans.forEach(plan => { content += buildTable(plan.label, DETAILED_TEMPLATES[plan.key] || []); });
+        selectedDepartment.plans.forEach(plan => { content += buildTable(plan.label, plans[plan.key] || []); });
       }
     }
     content += '</div>';
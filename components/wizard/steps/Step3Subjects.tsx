@@ -1,6 +1,6 @@
 ﻿import React, { useState, useMemo, useEffect } from 'react';
 import { Phase, Subject, SchoolInfo } from '../../../types';
-import { DETAILED_TEMPLATES } from '../../../constants';
+import { loadStudyPlans } from '../../../study_plan_chunks';
 import { STUDY_PLANS_CONFIG } from '../../../study_plans_config';
 import {
   Plus, Trash2, Printer, Search, Eye, Download, Info, School, Building, GraduationCap, BookOpen, Layers, CheckCircle2, X, Edit2, Check, Copy, List, Sparkles, ArrowRight, Table, Grid
@@ -119,12 +119,20 @@ const Step3Subjects: React.FC<Props> = ({ subjects, setSubjects, schoolInfo, gra
 
   // --- Actions ---
 
-  const handleApprovePlan = (phase: Phase, departmentId: string, planKeys: string[], periodsOverride?: Record<string, number>) => {
+  const handleApprovePlan = async (phase: Phase, departmentId: string, planKeys: string[], periodsOverride?: Record<string, number>): Promise<void> => {
       const newSubjects: Subject[] = [];
       const newMapUpdates: Record<string, string[]> = {};
+      // تحميل خطط المرحلة المطلوبة فقط (study_plan_chunks)
+      let loadedPlans: Record<string, Subject[]>;
+      try {
+          loadedPlans = await loadStudyPlans(planKeys);
+      } catch {
+          alert('تعذر تحميل الخطة الدراسية، تحقق من الاتصال وحاول مرة أخرى');
+          return;
+      }
 
       planKeys.forEach(key => {
-          const templates = DETAILED_TEMPLATES[key] || [];
+          const templates = loadedPlans[key] || [];
           // Add subjects
           templates.forEach(t => {
              const subject = periodsOverride?.[t.id] !== undefined
@@ -898,12 +906,12 @@ const SubjectConstraintsModal: React.FC<SubjectConstraintsModalProps> = ({
                                 <div>
                                     <div className="text-xs font-bold text-slate-400 mb-1">الحد اليومي</div>
                                     <div className="text-base font-black text-slate-700">
-                                        {getMaxDailyPeriodsForSubject(selectedSubjectExample.periodsPerClass, weekDays)} حصة
+                                        {getMaxDailyPeriodsForSubject(selectedSubjectExample.periodsPerClass, weekDays, selectedSubjectExample.id)} حصة
                                     </div>
                                 </div>
                                 <div className="pt-3 border-t border-slate-200">
                                     <div className="text-[11px] font-bold text-slate-500 leading-relaxed">
-                                        {describeDistribution(selectedSubjectExample.periodsPerClass, weekDays)}
+                                        {describeDistribution(selectedSubjectExample.periodsPerClass, weekDays, selectedSubjectExample.id)}
                                     </div>
                                 </div>
                             </div>
@@ -1,5 +1,4 @@
-import { Phase, Specialization, Subject } from "./types";
-import { STUDY_PLANS } from './study_plans';
+import { Phase, Specialization } from "./types";
 
 export const INITIAL_SPECIALIZATIONS: Specialization[] = [
   { id: "1", name: "الدراسات الإسلامية" },
@@ -29,31 +28,7 @@ export const INITIAL_SPECIALIZATIONS: Specialization[] = [
   { id: "99", name: "أخرى" }
 ];
 
-export const DETAILED_TEMPLATES: Record<string, Subject[]> = {
-  ...STUDY_PLANS,
-};
-
-// دالة مساعدة لجمع جميع المواد من DETAILED_TEMPLATES
-function getAllSubjectsFromTemplates(): Subject[] {
-  const allSubjects: Subject[] = [];
-  const seen = new Set<string>();
-  
-  // جمع جميع المواد من DETAILED_TEMPLATES
-  for (const template of Object.values(DETAILED_TEMPLATES)) {
-    if (Array.isArray(template)) {
-      for (const subject of template) {
-        if (!seen.has(subject.id)) {
-          allSubjects.push(subject);
-          seen.add(subject.id);
-        }
-      }
-    }
-  }
-  
-  return allSubjects;
-}
-
-export const INITIAL_SUBJECTS: Subject[] = getAllSubjectsFromTemplates();
+// الخطط الدراسية لا تستورد هنا: تحمّل عند الطلب من study_plan_chunks (loadStudyPlans)
 
 export const PHASE_CONFIG = {
   [Phase.ELEMENTARY]: { grades: 6 },
@@ -1,9 +1,16 @@
 import pandas as pd
 
+from plan_sections import segment_rows
+
 try:
     df = pd.read_excel('خطة المقررات الدراسية 1447هـ.xlsx', sheet_name='ورقة1', header=None)
-    # Slice rows 15 to 60
-    subset = df.iloc[15:60]
+    sections = segment_rows(enumerate(df.itertuples(index=False, name=None), start=1))
+    # Elementary/middle tables (المرحلة | الصف الدراسي | ...) with their header rows
+    rows = []
+    for s in sections:
+        if s.schema == 'stage':
+            rows += ([s.header_row - 1] if s.header_row else []) + list(range(s.start_row - 1, s.end_row))
+    subset = df.iloc[rows]
     # Save to CSV
     subset.to_csv('excel_dump.csv', index=True, header=False)
     print("Dumped to excel_dump.csv")
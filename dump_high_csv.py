@@ -1,9 +1,16 @@
 import pandas as pd
 
+from plan_sections import segment_rows
+
 try:
     df = pd.read_excel('خطة المقررات الدراسية 1447هـ.xlsx', sheet_name='ورقة1', header=None)
-    # Estimate High School rows - let's dump a chunk
-    subset = df.iloc[70:250]
+    sections = segment_rows(enumerate(df.itertuples(index=False, name=None), start=1))
+    # High school tables (الصف الدراسي | الفصل | ...) with their header rows
+    rows = []
+    for s in sections:
+        if s.schema == 'high':
+            rows += ([s.header_row - 1] if s.header_row else []) + list(range(s.start_row - 1, s.end_row))
+    subset = df.iloc[rows]
     subset.to_csv('excel_dump_high.csv', index=True, header=False)
     print("Dumped high school chunk to excel_dump_high.csv")
 except Exception as e:
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Semester duty roster (المناوبة اليومية) with the rules of
+generateSmartDutyAssignment() (utils/dutyUtils.ts).
+
+generateSmartDutyAssignment() re-filters the dates of every week and
+re-scores every staff member for every date, looking teachers up with
+find() and keeping the "justice counters" in a plain object. Here:
+
+- each staff member's day is precomputed once: the last busy period per
+  day from an OccupancyGrid of the timetable, the same score as the TS
+  (+100 ends in the last period, +50 one before, -20 ends early, +5 no
+  lessons, +80 admins), and eligibility. A teacher whose manual earlyExit
+  leaves before the end of the day cannot stay for duty that day;
+- each week is one assignment problem, duty positions x staff, solved
+  exactly with the Hungarian method. The cost puts the duty count first
+  and the day score second, so each week takes the staff with the fewest
+  duties and then seats them on their best days;
+- a staff member serves at most once a week.
+
+Semester dates are exact: hijri_calendar reads Hijri start, end and
+holiday dates with the Umm al-Qura table instead of the TS's
+`hijriYear + 579`.
+
+Because every week picks the least-used eligible staff, the final counts
+are min-max: staff eligible all semester end at most one duty apart from
+each other, existingCounts included.
+
+The output has the TS shape: assignments, weekAssignments, alerts,
+newCounts. Alerts include the early-exit check of getEarlyExitStaff() and
+days that could not be filled.
+
+    python duty_roster.py duty.json -o roster.json
+
+duty.json holds the TS arguments: {"teachers", "admins", "exclusions",
+"settings": DutySettings, "scheduleSettings", "schoolInfo",
+"existingCounts", "countPerDay"}.
+"""
+
+import argparse
+import sys
+import time
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple
+
+import numpy as np
+
+from hijri_calendar import semester_days
+from occupancy import OccupancyGrid
+from timetable_solver import load_input, write_json
+
+DAYS = ['sunday', 'monday', 'tuesday', 'wednesday', 'thursday']
+DAY_NAMES = {
+    'sunday': 'الأحد',
+    'monday': 'الإثنين',
+    'tuesday': 'الثلاثاء',
+    'wednesday': 'الأربعاء',
+    'thursday': 'الخميس',
+}
+DEFAULT_PERIODS = 7
+DEFAULT_WEEKS = 18
+
+VP_ROLES = ['وكيل', 'وكيلة', 'وكيل الشؤون التعليمية', 'وكيل الشؤون المدرسية']
+GUARD_ROLES = ['حارس', 'حارسة']
+ELIGIBLE_ADMIN_ROLES = ['موجه طلابي', 'رائد نشاط', 'محضر مختبر', 'مساعد إداري']
+
+# درجات اليوم كما في generateSmartDutyAssignment
+LAST_PERIOD_SCORE = 100
+BEFORE_LAST_SCORE = 50
+EARLY_SCORE = -20
+NO_LESSONS_SCORE = 5
+ADMIN_SCORE = 80
+
+
+class DutyDate(NamedTuple):
+    date: str              # YYYY-MM-DD أو '' عند غياب تواريخ الفصل
+    dayKey: str
+    weekId: str
+    weekName: str
+
+
+# ===== التوقيت والتواريخ =====
+
+def timing_config(school_info):
+    return school_info.get('timing') or {
+        'activeDays': list(DAYS),
+        'periodCounts': {day: DEFAULT_PERIODS for day in DAYS},
+    }
+
+
+def current_semester(school_info):
+    semesters = school_info.get('semesters') or []
+    return next((s for s in semesters if s.get('isCurrent')), semesters[0] if semesters else None)
+
+
+def generic_weeks(active_days, weeks):
+    return [DutyDate('', day, f"week-{w}", f"الأسبوع {w}") for w in range(1, weeks + 1) for day in active_days]
+
+
+def duty_dates(school_info):
+    # type: (dict) -> List[DutyDate]
+    """generateDutyDates(): school days of the current semester, Hijri dates read with Umm al-Qura."""
+    active_days = timing_config(school_info).get('activeDays') or list(DAYS)
+    semester = current_semester(school_info)
+    if not semester or not semester.get('startDate') or not semester.get('endDate'):
+        return generic_weeks(active_days, 1)
+    try:
+        days = semester_days(semester['startDate'], semester['endDate'], active_days, semester.get('holidays') or [])
+    except ValueError:
+        # تاريخ غير صالح أو تاريخ هجري خارج جدول أم القرى: أسابيع بلا تواريخ كما في الواجهة
+        return generic_weeks(active_days, semester.get('weeksCount') or DEFAULT_WEEKS)
+    dates = [DutyDate(day.date, day.dayKey, f"week-{day.week}", f"الأسبوع {day.week}") for day in days]
+    return dates or generic_weeks(active_days, semester.get('weeksCount') or DEFAULT_WEEKS)
+
+
+# ===== الطاقم والأهلية =====
+
+def available_staff(teachers, admins, exclusions, settings):
+    """getAvailableStaffForDuty(): [(id, name, type, role, phone)] as dicts."""
+    excluded = {e['staffId'] for e in exclusions or [] if e.get('isExcluded')}
+    duty_admins = [a for a in admins if (a.get('role') or '') in ELIGIBLE_ADMIN_ROLES]
+    exclude_teachers = settings.get('autoExcludeTeachersWhen5Admins') and len(duty_admins) >= 5
+
+    staff = []
+    if not exclude_teachers:
+        staff += [{'id': t['id'], 'name': t.get('name', ''), 'type': 'teacher', 'phone': t.get('phone')}
+                  for t in teachers if t['id'] not in excluded]
+    for a in admins:
+        role = a.get('role') or ''
+        if a['id'] in excluded:
+            continue
+        if settings.get('excludeVicePrincipals') and any(r in role for r in VP_ROLES):
+            continue
+        if settings.get('excludeGuards') and any(r in role for r in GUARD_ROLES):
+            continue
+        staff.append({'id': a['id'], 'name': a.get('name', ''), 'type': 'admin', 'role': role, 'phone': a.get('phone')})
+    return staff
+
+
+def last_periods(timetable, staff_ids, days, period_counts):
+    """(staff, days) last busy period of each day within periodCounts[day], 0 when free."""
+    periods = max([period_counts.get(day) or DEFAULT_PERIODS for day in days] or [DEFAULT_PERIODS])
+    grid = OccupancyGrid.from_timetable(timetable, days, periods, teacher_ids=staff_ids)
+    limits = np.array([(1 << (period_counts.get(day) or DEFAULT_PERIODS)) - 1 for day in days], dtype=np.uint64)
+    words = grid.teachers[:len(staff_ids)] & limits
+    last = np.zeros(words.shape, dtype=np.int64)
+    for period in range(1, periods + 1):
+        last = np.where(words >> np.uint64(period - 1) & np.uint64(1) != 0, period, last)
+    return last
+
+
+def early_exit_staff(last, teachers, days, period_counts):
+    """getEarlyExitStaff(): teachers whose latest period in the whole week is 2+ before the end."""
+    general_max = max(period_counts.values() or [DEFAULT_PERIODS])
+    latest = last[:len(teachers)].max(axis=1, initial=0)
+    return [(teacher['id'], int(latest[t])) for t, teacher in enumerate(teachers)
+            if 0 < latest[t] < general_max - 1]
+
+
+def day_scores(staff, last, days, period_counts, teacher_constraints):
+    """(scores, eligible, last period) per staff member and day."""
+    day_max = np.array([period_counts.get(day) or DEFAULT_PERIODS for day in days], dtype=np.int64)
+    scores = np.select(
+        [last == day_max, last == day_max - 1, last > 0],
+        [LAST_PERIOD_SCORE, BEFORE_LAST_SCORE, EARLY_SCORE], NO_LESSONS_SCORE)
+    eligible = np.ones(last.shape, dtype=bool)
+    last = last.copy()
+    for s, member in enumerate(staff):
+        if member['type'] == 'admin':
+            scores[s] = ADMIN_SCORE
+            last[s] = day_max
+            continue
+        constraint = teacher_constraints.get(member['id']) or {}
+        if constraint.get('earlyExitMode') != 'auto':
+            for day, exit_period in (constraint.get('earlyExit') or {}).items():
+                # يغادر قبل نهاية الدوام فلا يبقى للمناوبة
+                if day in days and exit_period < day_max[days.index(day)]:
+                    eligible[s, days.index(day)] = False
+    return scores, eligible, last
+
+
+# ===== الإسناد =====
+
+def min_cost_assignment(cost):
+    """
+    Hungarian method (Jonker-Volgenant potentials) for an n x m cost matrix
+    with n <= m; returns the column of each row. Inner loops are over NumPy
+    rows, so a week of 20 positions x 150 staff takes a few milliseconds.
+    """
+    n, m = cost.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    match = np.zeros(m + 1, dtype=np.int64)      # الصف المسند لكل عمود (1-based، 0 فارغ)
+    way = np.zeros(m + 1, dtype=np.int64)
+    for i in range(1, n + 1):
+        match[0] = i
+        j0 = 0
+        min_v = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = match[j0]
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            free = ~used[1:]
+            better = free & (reduced < min_v[1:])
+            min_v[1:][better] = reduced[better]
+            way[1:][better] = j0
+            candidates = np.where(free, min_v[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+            u[match[used]] += delta
+            v[used] -= delta
+            min_v[1:][free] -= delta
+            j0 = j1
+            if match[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+    columns = np.full(n, -1, dtype=np.int64)
+    assigned = np.nonzero(match[1:])[0]
+    columns[match[1:][assigned] - 1] = assigned
+    return columns
+
+
+def generate_roster(teachers, admins, exclusions, settings, schedule_settings, school_info,
+                    existing_counts=None, count_per_day=None):
+    # type: (list, list, list, dict, dict, dict, Dict[str, int], int) -> dict
+    """generateSmartDutyAssignment() for the whole semester; see the module docstring."""
+    started = time.perf_counter()
+    timing = timing_config(school_info)
+    days = list(timing.get('activeDays') or DAYS)
+    period_counts = timing.get('periodCounts') or {}
+    dates = duty_dates(school_info)
+    staff = available_staff(teachers, admins, exclusions or [], settings)
+    staff_per_day = count_per_day or settings.get('suggestedCountPerDay') or 1
+    timetable = schedule_settings.get('timetable') or {}
+    constraints = {tc['teacherId']: tc for tc in schedule_settings.get('teacherConstraints') or []}
+
+    # حساب واحد لكل فرد ولكل يوم
+    ids = [member['id'] for member in staff]
+    last = last_periods(timetable, ids, days, period_counts)
+    scores, eligible, last = day_scores(staff, last, days, period_counts, constraints)
+    counts = np.array([(existing_counts or {}).get(staff_id, 0) for staff_id in ids], dtype=np.int64)
+
+    alerts = []
+    excluded = {e['staffId'] for e in exclusions or [] if e.get('isExcluded')}
+    teacher_last = last_periods(timetable, [t['id'] for t in teachers], days, period_counts)
+    names = {t['id']: t.get('name', '') for t in teachers}
+    for teacher_id, latest in early_exit_staff(teacher_last, teachers, days, period_counts):
+        if teacher_id not in excluded:
+            alerts.append(f"المعلم {names[teacher_id]} ينتهي جدوله مبكراً جداً طوال الأسبوع "
+                          f"(أقصى حصة له هي {latest}). يوصى بمراجعة إسناده يدوياً.")
+
+    weeks = OrderedDict()
+    for info in dates:
+        weeks.setdefault(info.weekId, []).append(info)
+
+    # العدد أولاً ثم درجة اليوم: وزن العدد يفوق أي فرق ممكن في مجموع الدرجات
+    spread = int(scores.max(initial=0) - scores.min(initial=0)) + 1
+    week_assignments = []
+    for week_id, week_dates in weeks.items():
+        positions = [(k, info) for k, info in enumerate(week_dates)
+                     if info.dayKey in days for _ in range(staff_per_day)][:len(staff)]
+        by_date = [[] for _ in week_dates]
+        if positions:
+            weight = spread * len(positions) + 1
+            forbidden = weight * (int(counts.max(initial=0)) + len(weeks) + 2) * len(positions)
+            columns = [days.index(info.dayKey) for _, info in positions]
+            cost = weight * counts[None, :] - scores[:, columns].T
+            cost = np.where(eligible[:, columns].T, cost, forbidden).astype(float)
+            for (k, info), s in zip(positions, min_cost_assignment(cost)):
+                d = days.index(info.dayKey)
+                if s < 0 or not eligible[s, d]:
+                    continue
+                counts[s] += 1
+                member = staff[s]
+                by_date[k].append({
+                    'staffId': member['id'],
+                    'staffName': member['name'],
+                    'staffType': member['type'],
+                    'lastPeriod': int(last[s, d]),
+                    'isManual': False,
+                })
+
+        day_assignments = []
+        for info, staff_assignments in zip(week_dates, by_date):
+            if len(staff_assignments) < staff_per_day:
+                alerts.append(f"لم يكتمل عدد المناوبين يوم {DAY_NAMES.get(info.dayKey, info.dayKey)} "
+                              f"{info.date} ({info.weekName}): {len(staff_assignments)}/{staff_per_day}")
+            day_assignments.append({'day': info.dayKey, 'date': info.date, 'staffAssignments': staff_assignments})
+        week_assignments.append({
+            'weekId': week_id,
+            'weekName': week_dates[0].weekName,
+            'startDate': week_dates[0].date,
+            'endDate': week_dates[-1].date,
+            'dayAssignments': day_assignments,
+        })
+
+    new_counts = dict(existing_counts or {})
+    new_counts.update({staff_id: int(count) for staff_id, count in zip(ids, counts)})
+    return {
+        'assignments': [day for week in week_assignments for day in week['dayAssignments']],
+        'weekAssignments': week_assignments,
+        'alerts': alerts,
+        'newCounts': new_counts,
+        'stats': {
+            'staff': len(staff),
+            'weeks': len(weeks),
+            'dates': len(dates),
+            'duties': int(sum(len(day['staffAssignments']) for week in week_assignments
+                              for day in week['dayAssignments'])),
+            'minCount': int(counts.min()) if len(counts) else 0,
+            'maxCount': int(counts.max()) if len(counts) else 0,
+            'seconds': round(time.perf_counter() - started, 3),
+        },
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="توزيع المناوبة اليومية على الفصل الدراسي كاملاً بعدالة")
+    parser.add_argument('input', help="ملف JSON بمدخلات generateSmartDutyAssignment، أو - للقراءة من stdin")
+    parser.add_argument('-o', '--output', help="ملف النتيجة (الافتراضي: الطباعة)")
+    parser.add_argument('--per-day', type=int, help="عدد المناوبين في اليوم (الافتراضي: countPerDay أو suggestedCountPerDay)")
+    args = parser.parse_args()
+
+    data = load_input(args.input)
+    result = generate_roster(data.get('teachers') or [], data.get('admins') or [], data.get('exclusions') or [],
+                             data.get('settings') or {}, data.get('scheduleSettings') or {},
+                             data.get('schoolInfo') or {}, data.get('existingCounts') or {},
+                             args.per_day or data.get('countPerDay'))
+    write_json(result, args.output)
+    stats = result['stats']
+    print(f"✓ {stats['duties']} مناوبة | {stats['weeks']} أسبوع | {stats['staff']} فرد | "
+          f"لكل فرد: {stats['minCount']}-{stats['maxCount']} | {stats['seconds']} ث", file=sys.stderr)
+    for alert in result['alerts'][:20]:
+        print(f"  ✗ {alert}", file=sys.stderr)
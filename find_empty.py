@@ -1,26 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import openpyxl
+import argparse
 
-excel_file = "خطة المقررات الدراسية 1447هـ.xlsx"
-workbook = openpyxl.load_workbook(excel_file)
-worksheet = workbook.active
+from plan_validation import DEFAULT_WORKBOOK, format_table, load_rows, validate_rows
 
-print("الأسطر التي لا تحتوي على مادة في العمود الثالث:\n")
+parser = argparse.ArgumentParser(description="الأسطر التي لا تحتوي على مادة")
+parser.add_argument('workbook', nargs='?', default=DEFAULT_WORKBOOK)
+args = parser.parse_args()
 
-for row_num, row in enumerate(worksheet.iter_rows(min_row=2, values_only=True), start=2):
-    if row[0] is not None and row[0] != "المرحلة":
-        if row[2] is None or row[2] == "":
-            print(f"{row_num}: {row}")
+# الأسطر التي لا تحتوي على مادة، مع قيم الأعمدة الأخرى — انظر plan_validation.py
+report = validate_rows(load_rows(args.workbook), rule_ids=['missing_subject'])
 
-print("\n\nالأسطر التي تحتوي على قيمة في العمود الثالث لكن ربما عمود آخر:\n")
-count = 0
-for row_num, row in enumerate(worksheet.iter_rows(min_row=2, values_only=True), start=2):
-    if row[0] is not None and row[0] != "المرحلة" and (row[2] is None or row[2] == ""):
-        # تحقق من وجود أي قيمة في الأعمدة الأخرى
-        if any(val is not None for val in row):
-            print(f"{row_num}: Phase={row[0]}, Grade={row[1]}, Subject={row[2]}, Periods={row[3]}, Rest={row[4:]}")
-            count += 1
-
-print(f"\nالعدد الكلي للأسطر الفارغة: {count}")
+print(format_table(report))
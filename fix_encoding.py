@@ -1,65 +1,209 @@
 #!/usr/bin/env python3
+# -*- coding: utf-8 -*-
 """
-Fix character encoding issues in Step3Subjects.tsx
-Replaces XML-encoded Arabic characters with proper UTF-8 encoding
+Repair mojibake in source files.
+
+Mojibake here is UTF-8 text that was decoded with a single-byte code page
+(cp1256 on Arabic Windows, or cp1252 / latin-1) and saved again as UTF-8:
+'عام' becomes 'ط¹ط§ظ…' (cp1256) or 'Ø¹Ø§Ù…' (cp1252). Instead of a table of
+known words, runs of characters that come from the code page's high half
+(0x80-0xFF) are matched with one compiled pattern per code page, encoded
+back to bytes and decoded as UTF-8. A run is only rewritten when the whole
+run decodes and the result is plausible text (Arabic letters, symbols and
+punctuation), so correct Arabic such as 'فقط؛' is left alone.
+
+Files are processed line by line (mojibake never spans a newline) and in
+parallel. --dry-run prints a unified diff instead of writing. A file that
+is not UTF-8 at all (e.g. saved as raw cp1256) is reported and skipped.
+
+    python fix_encoding.py                      # components/
+    python fix_encoding.py components utils --dry-run
+    python fix_encoding.py components/wizard/steps/Step3Subjects.tsx --entities
 """
 
+import argparse
+import difflib
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+DEFAULT_PATHS = ["components"]
+EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".json", ".css", ".html", ".md")
+
+# بالترتيب: يجرب cp1256 أولاً لأنه الأكثر شيوعاً مع ملفات عربية على ويندوز.
+# cp1252 يشمل latin-1 للبايتات غير المعرفة فيه (0x81, 0x8D, ...)
+CODECS = ("cp1256", "cp1252")
+
+# &#1575; / &#x627; — كيانات HTML للحروف العربية فقط
+ARABIC_ENTITY_RE = re.compile(r"&#(?:(\d+)|[xX]([0-9a-fA-F]+));")
+
+
+def high_half_table(codec):
+    """{character: byte} for the code page's 0x80-0xFF range, latin-1 as fallback."""
+    table = {}
+    for byte in range(0x80, 0x100):
+        try:
+            table[bytes([byte]).decode(codec)] = byte
+        except UnicodeDecodeError:
+            pass
+    for byte in range(0x80, 0x100):
+        table.setdefault(chr(byte), byte)
+    return table
 
-# Read the file
-file_path = r'c:\Users\fasoo\OneDrive\Desktop\مشاريع رقمية\متابع-تحديث\motabe-1.5\components\wizard\steps\Step3Subjects.tsx'
-
-with open(file_path, 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# Define replacements for common XML-encoded patterns
-replacements = {
-    # Department terms
-    'ط¹ط§ظ…': 'عام',
-    'طھط­ظپظٹط¸': 'تحفيظ',
-    'ط¢ط®ط±': 'آخر',
-    
-    # Phase terms
-    'ط§ظ„ط§ط¨طھط¯ط§ط¦ظٹط©': 'الابتدائية',
-    'ط§ظ„ط§ط¨طھط¯ط§ط¦ظٹ': 'الابتدائي',
-    'ط§ظ„ظ…طھظˆط³ط·ط©': 'المتوسطة',
-    'ط§ظ„ظ…طھظˆط³ط·': 'المتوسط',
-    'ط§ظ„ط«ط§ظ†ظˆظٹط©': 'الثانوية',
-    'ط§ظ„ط«ط§ظ†ظˆظٹ': 'الثانوي',
-    
-    # Grade terms
-    'ط§ظ„طµظپ': 'الصف',
-    'ط§ظ„ط£ظˆظ„': 'الأول',
-    'ط§ظ„ط«ط§ظ†ظٹ': 'الثاني',
-    'ط§ظ„ط«ط§ظ„ط«': 'الثالث',
-    'ط§ظ„ط±ط§ط¨ط¹': 'الرابع',
-    'ط§ظ„ط®ط§ظ…ط³': 'الخامس',
-    'ط§ظ„ط³ط§ط¯ط³': 'السادس',
-    
-    # Common phrases
-    'ط§ظ„طھط¹ظ„ظٹظ… ط§ظ„': 'التعليم ال',
-    'طھط­ظپظٹط¸ ط§ظ„ظ‚ط±ط¢ظ† ط§ظ„ظƒط±ظٹظ…': 'تحفيظ القرآن الكريم',
-    'ط®ط·ط©': 'خطة',
-    'ظ†ط¸ط§ظ… ط§ظ„ظ…ط³ط§ط±ط§طھ': 'نظام المسارات',
-    'ط§ط³طھط¹ط±ط¶ ظˆط§ط¹طھظ…ط¯ ط§ظ„ظ…ظˆط§ط¯ ظ„ظ„ظ…ط³ط§ط±ط§طھ ط§ظ„طھط®طµطµظٹط©': 'استعرض واعتمد المواد للمسارات التخصصية',
-    'ط·ط¨ط§ط¹ط© ط§ظ„': 'طباعة ال',
-    'ط·ط¨ط§ط¹ط© ظ‡ط°ظ‡ ط§ظ„': 'طباعة هذه ال',
-    'ظ…ط¹طھظ…ط¯ط©': 'معتمدة',
-    'ظ„ظ… ظٹطھظ… ط§ظ„ط§ط¹طھظ…ط§ط¯': 'لم يتم الاعتماد',
-    'ظ…ط§ط¯ط©': 'مادة',
-    'ظ…ط¹ط§ظٹظ†ط©': 'معاينة',
-    'ط·ط¨ط§ط¹ط©': 'طباعة',
-    'ط¥ظ„ط؛ط§ط، ط§ظ„ط§ط¹طھظ…ط§ط¯': 'إلغاء الاعتماد',
-    'ط§ط¹طھظ…ط§ط¯ ظ„ظ„ظƒظ„': 'اعتماد للكل',
+
+TABLES = {codec: high_half_table(codec) for codec in CODECS}
+
+# نمط واحد مترجم لكل ترميز: سلسلة من حرفين على الأقل من النصف الأعلى
+PATTERNS = {
+    codec: re.compile('[' + ''.join(re.escape(char) for char in table) + ']{2,}')
+    for codec, table in TABLES.items()
 }
 
-# Apply all replacements
-for old, new in replacements.items():
-    content = content.replace(old, new)
 
-# Write the fixed content back
-with open(file_path, 'w', encoding='utf-8') as f:
-    f.write(content)
+def plausible(text):
+    # حروف عربية أو رموز وعلامات ترقيم شائعة؛ ما عدا ذلك غالباً نص صحيح
+    for char in text:
+        code = ord(char)
+        if not (0x0621 <= code <= 0x065F or 0x0660 <= code <= 0x066D or code in (0x060C, 0x061B, 0x061F)
+                or 0x00A0 <= code <= 0x00FF or 0x2000 <= code <= 0x2BFF or code >= 0x1F300
+                # محددات الشكل (⚠️) وعلامة BOM
+                or 0xFE00 <= code <= 0xFE0F or code == 0xFEFF):
+            return False
+    return True
+
+
+def repair_run(run, codec):
+    """Return the repaired run, or the run unchanged if it is not mojibake."""
+    # السلسلة كاملة يجب أن تكون UTF-8 صالحاً: النص العربي الصحيح مثل 'فقط؛'
+    # قد يحوي تسلسلاً صالحاً جزئياً (ط؛ = D8 BA) لكنه لا يفك كاملاً
+    try:
+        decoded = bytes(TABLES[codec][char] for char in run).decode('utf-8')
+    except UnicodeError:
+        return run
+    return decoded if plausible(decoded) else run
+
+
+def repair_line(line, entities=False):
+    """Return (fixed line, number of replaced runs)."""
+    if entities and '&#' in line:
+        line = ARABIC_ENTITY_RE.sub(decode_entity, line)
+    if line.isascii():
+        return line, 0
+
+    # الترميز الذي يصلح أكبر عدد من المقاطع هو ترميز التشويه في هذا السطر
+    best, best_count = line, 0
+    for codec in CODECS:
+        count = 0
+
+        def replace(match):
+            nonlocal count
+            fixed = repair_run(match.group(), codec)
+            if fixed != match.group():
+                count += 1
+            return fixed
+
+        fixed = PATTERNS[codec].sub(replace, line)
+        if count > best_count:
+            best, best_count = fixed, count
+    return best, best_count
+
+
+def decode_entity(match):
+    code = int(match.group(1)) if match.group(1) else int(match.group(2), 16)
+    return chr(code) if 0x0600 <= code <= 0x06FF else match.group()
+
+
+def repair_file(path, dry_run=False, entities=False):
+    """
+    Return (path, replaced runs, diff text or None, error or None). A file
+    that is not valid UTF-8 is left untouched and reported in `error`.
+    """
+    count = 0
+    changed = False
+    old_lines, new_lines = [], []
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    dst = None
+
+    try:
+        with open(path, encoding='utf-8', newline='') as src:
+            dst = None if dry_run else open(tmp_path, 'w', encoding='utf-8', newline='')
+            try:
+                for line in src:
+                    fixed, n = repair_line(line, entities)
+                    if fixed != line:
+                        changed = True
+                    count += n
+                    if dry_run:
+                        old_lines.append(line)
+                        new_lines.append(fixed)
+                    else:
+                        dst.write(fixed)
+            finally:
+                if dst is not None:
+                    dst.close()
+    except BaseException as error:
+        # لا يبقى ملف مؤقت إذا توقفت القراءة في منتصف الملف
+        if dst is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        if isinstance(error, UnicodeDecodeError):
+            return path, 0, None, f"ليس UTF-8 (البايت 0x{error.object[error.start]:02X})"
+        raise
+
+    if dry_run:
+        diff = ''.join(difflib.unified_diff(old_lines, new_lines, path, path)) if changed else None
+        return path, count, diff, None
+
+    if changed:
+        os.replace(tmp_path, path)
+    else:
+        os.remove(tmp_path)
+    return path, count, None, None
+
+
+def iter_files(paths):
+    for path in paths:
+        if os.path.isfile(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d not in ('node_modules', '.git', 'dist'))
+            for name in sorted(files):
+                if name.endswith(EXTENSIONS):
+                    yield os.path.join(root, name)
+
+
+def main(paths, dry_run=False, entities=False, workers=None):
+    files = list(iter_files(paths))
+    total = 0
+    fixed_files = 0
+    skipped = 0
+    worker = partial(repair_file, dry_run=dry_run, entities=entities)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path, count, diff, error in pool.map(worker, files, chunksize=8):
+            if error:
+                skipped += 1
+                print(f"✗ {path}: {error}", file=sys.stderr)
+                continue
+            if diff:
+                sys.stdout.write(diff)
+            if count or diff:
+                fixed_files += 1
+                total += count
+                print(f"{'~' if dry_run else '✓'} {path}: {count}", file=sys.stderr)
+
+    action = "تحتاج إصلاحاً" if dry_run else "تم إصلاحها"
+    print(f"✅ {len(files)} ملف، {fixed_files} {action}، {total} مقطع"
+          + (f"، {skipped} تم تخطيها" if skipped else ""), file=sys.stderr)
+    return 1 if skipped else 0
+
 
-print("✅ Character encoding fixed successfully!")
-print(f"Applied {len(replacements)} replacements")
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="إصلاح النصوص العربية المشوهة الترميز (mojibake)")
+    parser.add_argument('paths', nargs='*', default=DEFAULT_PATHS, help="ملفات أو مجلدات")
+    parser.add_argument('--dry-run', action='store_true', help="عرض الفروقات بدون كتابة")
+    parser.add_argument('--entities', action='store_true', help="فك كيانات HTML للحروف العربية (&#1575;)")
+    parser.add_argument('-j', '--workers', type=int, default=None)
+    args = parser.parse_args()
+    sys.exit(main(args.paths, args.dry_run, args.entities, args.workers))
@@ -1,23 +1,21 @@
 # -*- coding: utf-8 -*-
-import openpyxl
 import re
 
+from plan_cache import load_plan_rows
+
 file_path = "خطة المقررات الدراسية 1447هـ.xlsx"
-wb = openpyxl.load_workbook(file_path, data_only=True)
-ws = wb.active
 
 # Dictionary to collect all data
 data_by_key = {}
 
 # Extract data
-for row_idx, row in enumerate(ws.iter_rows(min_row=2, max_row=ws.max_row, values_only=True), start=2):
-    if not row[0] or not row[2]:
+for row in load_plan_rows(file_path):
+    if not row.subject:
         continue
     
-    phase = str(row[0]).strip() if row[0] else ""
-    division = str(row[1]).strip() if row[1] else ""
-    subject = str(row[2]).strip() if row[2] else ""
-    periods = row[3] if row[3] else 0
+    phase = row.phase
+    # Second column: department in the 5-column layout, grade in the 4-column one
+    division = row.department or row.grade or ""
     
     key = f"{phase}|{division}"
     
@@ -25,8 +23,8 @@ for row_idx, row in enumerate(ws.iter_rows(min_row=2, max_row=ws.max_row, values
         data_by_key[key] = []
     
     data_by_key[key].append({
-        'name': subject,
-        'periods': int(periods) if isinstance(periods, (int, float)) else 0
+        'name': row.subject,
+        'periods': row.periods or 0
     })
 
 # Generate TypeScript code
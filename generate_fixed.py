@@ -1,81 +1,62 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import openpyxl
 import re
 
-# فتح ملف Excel
+from arabic_text import contains
+from grades import grade_code as shared_grade_code
+from plan_reader import iter_plan_rows
+
+# ملف Excel
 excel_file = "خطة المقررات الدراسية 1447هـ.xlsx"
-workbook = openpyxl.load_workbook(excel_file)
-worksheet = workbook.active
 
-# قراءة البيانات
+# قراءة البيانات (القارئ يتخطى الصفوف الفارغة والرؤوس)
 data = []
-for row_num, row in enumerate(worksheet.iter_rows(min_row=2, values_only=True), start=2):
-    if row[0] is not None and row[0] != "الصف الدراسي":  # تخطي الصفوف الفارغة والرؤوس
-        phase = str(row[0]).strip() if row[0] else None
-        division = str(row[1]).strip() if row[1] else None
-        grade = str(row[2]).strip() if row[2] else None
-        subject = str(row[3]).strip() if row[3] else None
-        periods = int(row[4]) if row[4] and str(row[4]).isdigit() else 0
-        
-        if phase and division and subject:
-            data.append({
-                'phase': phase,
-                'division': division,
-                'grade': grade,
-                'subject': subject,
-                'periods': periods
-            })
+for row in iter_plan_rows(excel_file):
+    if row.phase and row.department and row.subject:
+        data.append({
+            'phase': row.phase,
+            'division': row.department,
+            'grade': row.grade,
+            'subject': row.subject,
+            'periods': row.periods or 0
+        })
 
 print(f"✓ تم قراءة {len(data)} مادة من Excel\n")
 
 # تحديد ما إذا كانت الابتدائية أو المتوسطة أو الثانوية
 def get_phase_type(phase_name):
-    if 'ابتدائي' in phase_name:
+    if contains(phase_name, 'ابتدائي'):
         return 'ELEMENTARY'
-    elif 'متوسط' in phase_name:
+    elif contains(phase_name, 'متوسط'):
         return 'MIDDLE'
-    elif 'ثانوي' in phase_name:
+    elif contains(phase_name, 'ثانوي'):
         return 'HIGH'
     return 'ELEMENTARY'
 
 # دالة تحويل أسماء الصفوف إلى أرقام وكود
 def get_grade_code(grade_name, phase_name):
-    grade_name_lower = grade_name.lower()
-    
-    if 'أول' in grade_name or '1' in grade_name:
-        return 'grade_1'
-    elif 'ثاني' in grade_name or '2' in grade_name:
-        return 'grade_2'
-    elif 'ثالث' in grade_name or '3' in grade_name:
-        return 'grade_3'
-    elif 'رابع' in grade_name or '4' in grade_name:
-        return 'grade_4'
-    elif 'خامس' in grade_name or '5' in grade_name:
-        return 'grade_5'
-    elif 'سادس' in grade_name or '6' in grade_name:
-        return 'grade_6'
-    elif 'عليا' in grade_name or '4-6' in grade_name:
-        return 'grade_upper'
-    elif 'مشترك' in phase_name or 'المشتركة' in phase_name:
+    # المحلل المشترك في grades.py: grade1 .. grade6, grades123, upper, ...
+    code = shared_grade_code(grade_name)
+    if code:
+        return code
+    if contains(phase_name, 'مشترك', 'المشتركة'):
         return 'shared'
-    
     return 'unknown'
 
 # دالة تحويل اسم الشعبة إلى كود
 def get_division_code(division_name):
-    if 'عام' in division_name and 'تحفيظ' not in division_name:
+    if contains(division_name, 'عام') and not contains(division_name, 'تحفيظ'):
         return 'general'
-    elif 'تحفيظ' in division_name:
+    elif contains(division_name, 'تحفيظ'):
         return 'quran'
-    elif 'حاسب' in division_name or 'هندسة' in division_name:
+    elif contains(division_name, 'حاسب', 'هندسة'):
         return 'cs_eng'
-    elif 'صحة' in division_name or 'حياة' in division_name:
+    elif contains(division_name, 'صحة', 'حياة'):
         return 'health'
-    elif 'إدارة' in division_name or 'أعمال' in division_name:
+    elif contains(division_name, 'إدارة', 'أعمال'):
         return 'business'
-    elif 'شرعي' in division_name:
+    elif contains(division_name, 'شرعي'):
         return 'islamic'
     
     return 'general'
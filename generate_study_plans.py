@@ -0,0 +1,607 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Generate study_plans.ts / study_plans_config.ts from the plans workbook.
+
+Regeneration is incremental: plan keys (sp_<phase>_<dept>_<grade>) are
+diffed against the existing study_plans.ts, only plans whose subjects or
+periods changed are rewritten, and every untouched block (including manual
+edits to specializationIds) stays byte-identical. Subjects added to a plan
+by hand (ids outside the generated <key>_1..n numbering, e.g. <key>_0) are
+kept in place when their plan is rewritten. study_plans_config.ts is
+hand-curated, so only the entries of added or removed keys are touched.
+"""
+
+import argparse
+import json
+import os
+import re
+from collections import OrderedDict
+
+from plan_cache import load_plan_rows
+from specializations import specialization_ids
+
+EXCEL_FILE = "الخطط الدراسية 1447هـ.xlsx"
+PLANS_FILE = "study_plans.ts"
+CONFIG_FILE = "study_plans_config.ts"
+CHUNKS_DIR = "study_plan_chunks"
+STATS_FILE = "study_plan_stats.ts"
+
+# الأسبوع الدراسي الافتراضي للجدول المحسوب مسبقاً وفحص السعة
+WEEK_DAYS = 5
+PERIODS_PER_DAY = 7
+
+PHASE_ENUMS = {
+    'رياض أطفال': 'KINDERGARTEN',
+    'الابتدائية': 'ELEMENTARY',
+    'المتوسطة': 'MIDDLE',
+    'الثانوية': 'HIGH',
+}
+
+# تعليق يضاف للمواد التي لا يحدد ملف Excel عدد حصصها
+MANUAL_PERIODS_NOTE = ' // يحددها المستخدم'
+
+PLANS_HEADER = """import { Phase, Subject } from './types';
+
+/**
+ * الخطط الدراسية 1447هـ - مستوردة تلقائياً من ملف Excel
+ *
+ * المفتاح: معرّف الخطة (يتطابق مع planKeys في study_plans_config.ts)
+ */
+export const STUDY_PLANS: Record<string, Subject[]> = {
+"""
+
+BLOCK_RE = re.compile(
+    r"(?:^  // [^\n]*\n)?^  '(sp_[^']+)': \[\n.*?^  \],\n",
+    re.MULTILINE | re.DOTALL,
+)
+SUBJECT_RE = re.compile(
+    r"name: '((?:[^'\\]|\\.)*)', specializationIds: (\[[^\]]*\]), periodsPerClass: (\d+)"
+)
+SUBJECT_ID_RE = re.compile(r"^    \{ id: '((?:[^'\\]|\\.)*)',", re.MULTILINE)
+
+
+def key_part(text):
+    # المسافات تصبح "_" وتحذف الفواصل المنفردة مثل "-" و "/"
+    return '_'.join(token for token in text.split() if token not in ('-', '/'))
+
+
+def make_plan_key(phase, department, grade, namespace=''):
+    # namespace (السنة/المنطقة) يستخدم في وضع الدفعات لتمييز الملفات
+    prefix = f"sp_{namespace}_" if namespace else "sp_"
+    return f"{prefix}{key_part(phase)}_{key_part(department)}_{key_part(grade)}"
+
+
+def phase_enum(phase):
+    return PHASE_ENUMS.get(phase, 'OTHER')
+
+
+def ts_string(text):
+    return "'" + text.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def build_plans(rows, namespace=''):
+    """Group workbook rows into plans, keyed and ordered as in the sheet."""
+    plans = OrderedDict()
+    for row in rows:
+        if not (row.phase and row.department and row.grade and row.subject):
+            continue
+        key = make_plan_key(row.phase, row.department, row.grade, namespace)
+        if key not in plans:
+            plans[key] = {
+                'phase': row.phase,
+                'department': row.department,
+                'grade': row.grade,
+                'subjects': [],
+            }
+        plans[key]['subjects'].append((row.subject, row.periods))
+    return plans
+
+
+def fingerprint(subjects):
+    # ما يقارن بين الملف الحالي وملف Excel: اسم المادة وعدد الحصص فقط
+    return [(name, periods or 0) for name, periods in subjects]
+
+
+def is_manual_id(key, subject_id):
+    # render_block يرقم المواد <key>_1, <key>_2, ...؛ غير ذلك (مثل <key>_0) أضيف يدوياً
+    suffix = subject_id[len(key) + 1:]
+    return not (subject_id.startswith(key + '_') and suffix.isdigit() and int(suffix) > 0)
+
+
+def manual_lines(key, block):
+    """
+    Subjects added by hand to a plan block, as [(generated subjects before
+    it, line)]. The workbook cannot reproduce them, so they are carried over
+    when the block is rewritten.
+    """
+    manual = []
+    generated = 0
+    for line in block.splitlines(keepends=True):
+        match = SUBJECT_ID_RE.match(line)
+        if not match:
+            continue
+        if is_manual_id(key, unescape(match.group(1))):
+            manual.append((generated, line))
+        else:
+            generated += 1
+    return manual
+
+
+def render_block(key, plan, spec_ids, manual=()):
+    department = plan['department']
+    lines = [
+        f"  // {plan['phase']} | {department} | الصف: {plan['grade']}\n",
+        f"  '{key}': [\n",
+    ]
+    for i, (name, periods) in enumerate(plan['subjects'], start=1):
+        note = '' if periods is not None else MANUAL_PERIODS_NOTE
+        lines.append(
+            f"    {{ id: '{key}_{i}', name: {ts_string(name)}, "
+            f"specializationIds: {spec_ids.get(name) or json.dumps(specialization_ids(name))}, "
+            f"periodsPerClass: {periods or 0}, "
+            f"phases: [Phase.{phase_enum(plan['phase'])}], "
+            f"department: {ts_string(department)} }},{note}\n"
+        )
+    for position, line in reversed(manual):
+        lines.insert(2 + min(position, len(plan['subjects'])), line)
+    lines.append("  ],\n")
+    return ''.join(lines)
+
+
+def unescape(name):
+    return name.replace("\\'", "'").replace('\\\\', '\\')
+
+
+def parse_plans_file(text):
+    """
+    Split study_plans.ts into (prefix, blocks, suffix) where each block is
+    [key, block text, subjects, gap before the next block]. `subjects` are
+    the (name, periods) of the generated entries only, see manual_lines().
+    """
+    blocks = []
+    prefix_end = None
+    for match in BLOCK_RE.finditer(text):
+        if prefix_end is None:
+            prefix_end = match.start()
+        elif blocks:
+            blocks[-1][3] = text[blocks[-1][4]:match.start()]
+        key = match.group(1)
+        subjects = []
+        for line in match.group(0).splitlines():
+            subject_id = SUBJECT_ID_RE.match(line)
+            if subject_id and is_manual_id(key, unescape(subject_id.group(1))):
+                continue
+            subjects += [(unescape(name), int(periods)) for name, _, periods in SUBJECT_RE.findall(line)]
+        blocks.append([key, match.group(0), subjects, '', match.end()])
+
+    if not blocks:
+        index = text.rindex('};')
+        return text[:index], [], text[index:]
+    return text[:prefix_end], [block[:4] for block in blocks], text[blocks[-1][4]:]
+
+
+def known_spec_ids(blocks):
+    """
+    Reuse the specializationIds already assigned to a subject name; names
+    not in the file fall back to the shared rule table.
+    """
+    spec_ids = {}
+    for _, block, _, _ in blocks:
+        for name, ids, _ in SUBJECT_RE.findall(block):
+            spec_ids.setdefault(unescape(name), ids)
+    return spec_ids
+
+
+def update_plans_text(text, plans, keep=None):
+    """
+    Return (new text, changed keys, added keys, removed keys). Existing plans
+    missing from `plans` are removed unless keep(key) is true.
+    """
+    if not text:
+        text = PLANS_HEADER + "\n};\n"
+    prefix, blocks, suffix = parse_plans_file(text)
+    spec_ids = known_spec_ids(blocks)
+    existing = {block[0] for block in blocks}
+
+    # الخطط الجديدة تدرج بعد آخر خطة موجودة تسبقها في ترتيب ملف Excel
+    added = [key for key in plans if key not in existing]
+    inserts = {}
+    anchor = None
+    for key in plans:
+        if key in existing:
+            anchor = key
+        else:
+            inserts.setdefault(anchor, []).append(key)
+
+    entries = [[render_block(key, plans[key], spec_ids), "\n"] for key in inserts.get(None, [])]
+    changed, removed = [], []
+    for key, block, subjects, gap in blocks:
+        if key not in plans:
+            if keep is not None and keep(key):
+                entries.append([block, gap or "\n"])
+            else:
+                removed.append(key)
+            continue
+        if subjects != fingerprint(plans[key]['subjects']):
+            block = render_block(key, plans[key], spec_ids, manual_lines(key, block))
+            changed.append(key)
+        entries.append([block, gap or "\n"])
+        entries.extend([render_block(new_key, plans[new_key], spec_ids), "\n"]
+                       for new_key in inserts.get(key, []))
+
+    if entries:
+        # الخطة الأخيرة تليها نهاية الكائن مباشرة
+        entries[-1][1] = ''
+    body = ''.join(block + gap for block, gap in entries)
+    return prefix + body + suffix, changed, added, removed
+
+
+# ===== --split: وحدة لكل مرحلة تحمّل عند الطلب =====
+
+# نفس معرفات المراحل في STUDY_PLANS_CONFIG
+CHUNK_IDS = OrderedDict([
+    ('KINDERGARTEN', 'kindergarten'),
+    ('ELEMENTARY', 'elementary'),
+    ('MIDDLE', 'middle'),
+    ('HIGH', 'high'),
+    ('OTHER', 'other'),
+])
+
+PHASE_IN_BLOCK_RE = re.compile(r"phases: \[Phase\.(\w+)\]")
+
+SUBJECT_LINE_RE = re.compile(
+    r"\{ id: '((?:[^'\\]|\\.)*)', name: '((?:[^'\\]|\\.)*)', "
+    r"specializationIds: \[([^\]]*)\], periodsPerClass: (\d+), "
+    r"phases: \[Phase\.(\w+)\], department: '((?:[^'\\]|\\.)*)' \}"
+)
+
+CHUNK_HEADER = """import { EncodedPlan } from '../utils/studyPlanCodec';
+
+// مولد تلقائياً من study_plans.ts بواسطة generate_study_plans.py --split
+// جدول نصوص + مصفوفات أرقام، تفك في index.ts (الصيغة موضحة في utils/studyPlanCodec.ts)
+"""
+
+
+def encode_plans(blocks):
+    """Encode study_plans.ts blocks as (string table, plans), see utils/studyPlanCodec.ts."""
+    strings = OrderedDict()
+
+    def index(value):
+        return strings.setdefault(value, len(strings))
+
+    encoded = []
+    for key, block, _, _ in blocks:
+        subjects = SUBJECT_LINE_RE.findall(block)
+        if len(subjects) != block.count("{ id: "):
+            raise ValueError(f"صيغة مادة غير متوقعة في الخطة {key}")
+        phase = subjects[0][4] if subjects else 'OTHER'
+        department = unescape(subjects[0][5]) if subjects else ''
+        plan = [index(key), index(phase), index(department), []]
+        for subject_id, name, spec_ids, periods, _, _ in subjects:
+            suffix = unescape(subject_id)[len(key) + 1:]
+            plan[3].append(
+                [int(suffix) if suffix.isdigit() else suffix, index(unescape(name)), int(periods)]
+                + [index(spec.strip().strip('"')) for spec in spec_ids.split(',') if spec.strip()]
+            )
+        encoded.append(plan)
+    return list(strings), encoded
+
+
+def chunk_module_text(blocks):
+    strings, encoded = encode_plans(blocks)
+    lines = [CHUNK_HEADER, "export const STRINGS: string[] = [\n"]
+    lines += [f"  {ts_string(value)},\n" for value in strings]
+    lines += ["];\n", "\n", "export const PLANS: EncodedPlan[] = [\n"]
+    lines += [f"  {json.dumps(plan, ensure_ascii=False, separators=(',', ':'))},\n" for plan in encoded]
+    lines.append("];\n")
+    return ''.join(lines)
+
+
+def split_plans_text(text):
+    """Return ({chunk id: module text}, index.ts text) for study_plans.ts."""
+    _, blocks, _ = parse_plans_file(text)
+    chunks = OrderedDict()
+    chunk_of_key = OrderedDict()
+    for entry in blocks:
+        key, block = entry[0], entry[1]
+        match = PHASE_IN_BLOCK_RE.search(block)
+        chunk = CHUNK_IDS.get(match.group(1) if match else 'OTHER', 'other')
+        chunks.setdefault(chunk, []).append(entry)
+        chunk_of_key[key] = chunk
+
+    modules = OrderedDict(
+        (chunk, chunk_module_text(chunk_blocks))
+        for chunk, chunk_blocks in chunks.items()
+    )
+
+    chunk_ids = [chunk for chunk in CHUNK_IDS.values() if chunk in modules]
+    lines = [
+        "import { Subject } from '../types';\n",
+        "import { decodeStudyPlans, EncodedPlan } from '../utils/studyPlanCodec';\n",
+        "\n",
+        "// مولد تلقائياً بواسطة generate_study_plans.py --split\n",
+        "// كل مرحلة في وحدة مستقلة، فلا تحمّل إلا خطط المرحلة المطلوبة\n",
+        f"type PlanChunkId = {' | '.join(repr(chunk) for chunk in chunk_ids)};\n",
+        "\n",
+        "interface EncodedChunk {\n",
+        "  STRINGS: string[];\n",
+        "  PLANS: EncodedPlan[];\n",
+        "}\n",
+        "\n",
+        "const CHUNK_LOADERS: Record<PlanChunkId, () => Promise<EncodedChunk>> = {\n",
+    ]
+    lines += [f"  {chunk}: () => import('./{chunk}'),\n" for chunk in chunk_ids]
+    lines += [
+        "};\n",
+        "\n",
+        "// كل وحدة تفك مرة واحدة ثم يعاد استخدام النتيجة\n",
+        "const decodedChunks: Partial<Record<PlanChunkId, Promise<Record<string, Subject[]>>>> = {};\n",
+        "\n",
+        "const loadChunk = (chunk: PlanChunkId): Promise<Record<string, Subject[]>> => {\n",
+        "  if (!decodedChunks[chunk]) {\n",
+        "    decodedChunks[chunk] = CHUNK_LOADERS[chunk]().then(m => decodeStudyPlans(m.STRINGS, m.PLANS));\n",
+        "  }\n",
+        "  return decodedChunks[chunk]!;\n",
+        "};\n",
+        "\n",
+        "export const STUDY_PLAN_CHUNKS: Record<string, PlanChunkId> = {\n",
+    ]
+    lines += [f"  '{key}': '{chunk}',\n" for key, chunk in chunk_of_key.items()]
+    lines += [
+        "};\n",
+        "\n",
+        "export const loadStudyPlan = (key: string): Promise<Subject[]> => {\n",
+        "  const chunk = STUDY_PLAN_CHUNKS[key];\n",
+        "  if (!chunk) return Promise.resolve([]);\n",
+        "  return loadChunk(chunk).then(plans => plans[key] ?? []);\n",
+        "};\n",
+        "\n",
+        "export const loadStudyPlans = async (keys: string[]): Promise<Record<string, Subject[]>> => {\n",
+        "  const loaded = await Promise.all(keys.map(key => loadStudyPlan(key)));\n",
+        "  return Object.fromEntries(keys.map((key, i) => [key, loaded[i]]));\n",
+        "};\n",
+        "\n",
+        "// كل الخطط بترتيب study_plans.ts، للصفحات التي تعرض جميع الخطط\n",
+        "export const loadAllStudyPlans = (): Promise<Record<string, Subject[]>> =>\n",
+        "  loadStudyPlans(Object.keys(STUDY_PLAN_CHUNKS));\n",
+    ]
+    return modules, ''.join(lines)
+
+
+def write_chunks(plans_text, chunks_dir=CHUNKS_DIR):
+    modules, index_text = split_plans_text(plans_text)
+    os.makedirs(chunks_dir, exist_ok=True)
+
+    written = 0
+    for chunk, module_text in list(modules.items()) + [('index', index_text)]:
+        path = os.path.join(chunks_dir, f"{chunk}.ts")
+        written += write_if_changed(path, read_text(path), module_text)
+
+    # حذف وحدات المراحل التي لم تعد لها خطط
+    for chunk in CHUNK_IDS.values():
+        path = os.path.join(chunks_dir, f"{chunk}.ts")
+        if chunk not in modules and os.path.exists(path):
+            os.remove(path)
+    return modules, written
+
+
+# ===== --stats: توزيع الحصص محسوب مسبقاً لكل خطة =====
+
+# نفس قواعد utils/scheduleConstraints.ts
+
+def quota_distribution(periods, week_days=WEEK_DAYS):
+    """(single days, double days), as calculateQuotaDistribution()."""
+    if periods <= week_days:
+        return periods, 0
+    double_days = periods - week_days
+    return max(0, week_days - double_days), max(0, double_days)
+
+
+def max_daily_periods(periods, week_days=WEEK_DAYS):
+    """As getMaxDailyPeriodsForSubject()."""
+    return 1 if periods <= week_days else 2
+
+
+STATS_HEADER = """// مولد تلقائياً من study_plans.ts بواسطة generate_study_plans.py --stats
+// لكل خطة: مجموع الحصص الأسبوعية، وأكبر حد يومي، ولكل مادة (بلاحقة معرّفها بعد مفتاح الخطة):
+// [periodsPerClass, أيام الحصة الواحدة, أيام الحصتين, الحد اليومي]
+// يقرؤه calculateQuotaDistribution و getMaxDailyPeriodsForSubject (utils/scheduleConstraints.ts)
+
+export interface StudyPlanStats {
+  totalPeriods: number;
+  maxDaily: number;
+  subjects: Record<string, [number, number, number, number]>;
+  overCapacity?: true;   // المجموع أكبر من periodsPerDay × weekDays
+}
+"""
+
+
+def plan_stats(subjects, week_days=WEEK_DAYS):
+    """subjects: [(id suffix, periodsPerClass)] in plan order."""
+    rows = OrderedDict(
+        (suffix, [periods, *quota_distribution(periods, week_days), max_daily_periods(periods, week_days)])
+        for suffix, periods in subjects
+    )
+    return {
+        'totalPeriods': sum(periods for _, periods in subjects),
+        'maxDaily': max((row[3] for row in rows.values()), default=0),
+        'subjects': rows,
+    }
+
+
+def stats_text(plans_text, week_days=WEEK_DAYS, periods_per_day=PERIODS_PER_DAY):
+    """Return (stats module text, [(key, total)] for plans over the weekly capacity)."""
+    _, blocks, _ = parse_plans_file(plans_text)
+    capacity = week_days * periods_per_day
+    over = []
+    lines = [
+        STATS_HEADER, "\n",
+        f"export const PLAN_STATS_WEEK_DAYS = {week_days};\n",
+        f"export const PLAN_STATS_PERIODS_PER_DAY = {periods_per_day};\n",
+        "\n",
+        "export const STUDY_PLAN_STATS: Record<string, StudyPlanStats> = {\n",
+    ]
+    for key, block, _, _ in blocks:
+        subjects = [(unescape(subject_id)[len(key) + 1:], int(periods))
+                    for subject_id, _, _, periods, _, _ in SUBJECT_LINE_RE.findall(block)]
+        stats = plan_stats(subjects, week_days)
+        if stats['totalPeriods'] > capacity:
+            stats['overCapacity'] = True
+            over.append((key, stats['totalPeriods']))
+        fields = ', '.join(
+            f"{name}: {'true' if value is True else json.dumps(value, ensure_ascii=False, separators=(',', ':'))}"
+            for name, value in stats.items()
+        )
+        lines.append(f"  '{key}': {{ {fields} }},\n")
+    lines.append("};\n")
+    return ''.join(lines), over
+
+
+# ===== study_plans_config.ts =====
+
+def config_entry(indent, key, label):
+    return f"{indent}{{ key: '{key}', label: {ts_string(label)} }},\n"
+
+
+def find_category(lines, phase):
+    """Return (start, end) line range of the category for a phase enum."""
+    marker = f"    phase: Phase.{phase},\n"
+    if marker not in lines:
+        return None
+    start = lines.index(marker)
+    end = start
+    while end < len(lines) and lines[end] != "    departments: [\n":
+        end += 1
+    while end < len(lines) and lines[end] != "    ],\n":
+        end += 1
+    return start, end
+
+
+def find_plans_list(lines, start, end, node_id):
+    """Return the index of the closing '],' of the plans list of node_id."""
+    marker = re.compile(rf"^(\s+)id: '{re.escape(node_id)}',\n$")
+    for i in range(start, end):
+        match = marker.match(lines[i])
+        if not match:
+            continue
+        indent = match.group(1)
+        for j in range(i + 1, end):
+            if lines[j] == f"{indent}plans: [],\n":
+                lines[j] = f"{indent}plans: [\n"
+                lines.insert(j + 1, f"{indent}],\n")
+                return j + 1, indent + "    "
+            if lines[j] == f"{indent}plans: [\n":
+                k = j + 1
+                while lines[k] != f"{indent}],\n":
+                    k += 1
+                return k, indent + "    "
+    return None
+
+
+def update_config_text(text, plans, added, removed):
+    lines = text.splitlines(keepends=True)
+
+    removed_set = set(removed)
+    lines = [
+        line for line in lines
+        if not any(f"key: '{key}'" in line for key in removed_set)
+    ]
+
+    skipped = []
+    for key in added:
+        plan = plans[key]
+        category = find_category(lines, phase_enum(plan['phase']))
+        if category is None:
+            skipped.append(key)
+            continue
+        start, end = category
+
+        # القسم بالمعرف، ثم الصف (للمسارات الثانوية المتداخلة)، وإلا قسم جديد
+        target = (find_plans_list(lines, start, end, key_part(plan['department']))
+                  or find_plans_list(lines, start, end, key_part(plan['grade'])))
+        if target:
+            index, indent = target
+            lines.insert(index, config_entry(indent, key, plan['grade']))
+            continue
+
+        lines[end:end] = [
+            "      {\n",
+            f"        id: '{key_part(plan['department'])}',\n",
+            f"        name: {ts_string(plan['department'])},\n",
+            "        plans: [\n",
+            config_entry("          ", key, plan['grade']),
+            "        ],\n",
+            "      },\n",
+        ]
+
+    return ''.join(lines), skipped
+
+
+def read_text(path):
+    try:
+        with open(path, encoding='utf-8', newline='') as f:
+            return f.read()
+    except FileNotFoundError:
+        return ''
+
+
+def write_if_changed(path, old_text, new_text):
+    if new_text == old_text:
+        return False
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(new_text)
+    return True
+
+
+def main(excel_file=EXCEL_FILE, split=False, stats=False,
+         week_days=WEEK_DAYS, periods_per_day=PERIODS_PER_DAY):
+    plans = build_plans(load_plan_rows(excel_file))
+    print(f"✓ عدد الخطط في ملف Excel: {len(plans)}")
+
+    plans_text = read_text(PLANS_FILE)
+    new_plans_text, changed, added, removed = update_plans_text(plans_text, plans)
+    write_if_changed(PLANS_FILE, plans_text, new_plans_text)
+
+    config_text = read_text(CONFIG_FILE)
+    if config_text:
+        new_config_text, skipped = update_config_text(config_text, plans, added, removed)
+        write_if_changed(CONFIG_FILE, config_text, new_config_text)
+        for key in skipped:
+            print(f"  ! لا توجد مرحلة مطابقة في {CONFIG_FILE}: {key}")
+
+    unchanged = len(plans) - len(changed) - len(added)
+    print(f"✓ بدون تغيير: {unchanged} | معدلة: {len(changed)} | جديدة: {len(added)} | محذوفة: {len(removed)}")
+    for label, keys in (('معدلة', changed), ('جديدة', added), ('محذوفة', removed)):
+        for key in keys:
+            print(f"  {label}: {key}")
+    for key, block, _, _ in parse_plans_file(new_plans_text)[1]:
+        for _, line in manual_lines(key, block):
+            name = unescape(SUBJECT_RE.search(line).group(1))
+            print(f"  ! مادة مضافة يدوياً (ليست في Excel، تم الإبقاء عليها): {key}: {name}")
+
+    if split:
+        modules, written = write_chunks(new_plans_text)
+        print(f"✓ {CHUNKS_DIR}: {len(modules)} وحدات ({written} ملفات محدثة)")
+
+    if stats:
+        text, over = stats_text(new_plans_text, week_days, periods_per_day)
+        write_if_changed(STATS_FILE, read_text(STATS_FILE), text)
+        capacity = week_days * periods_per_day
+        print(f"✓ {STATS_FILE}: السعة الأسبوعية {periods_per_day} × {week_days} = {capacity}")
+        for key, total in over:
+            print(f"  ✗ تتجاوز السعة ({total} حصة): {key}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="توليد study_plans.ts من ملف Excel")
+    parser.add_argument('excel_file', nargs='?', default=EXCEL_FILE)
+    parser.add_argument('--split', action='store_true',
+                        help=f"كتابة وحدة مضغوطة لكل مرحلة في {CHUNKS_DIR}/ مع index.ts للتحميل عند الطلب")
+    parser.add_argument('--stats', action='store_true',
+                        help=f"كتابة {STATS_FILE}: مجموع الحصص وتوزيعها لكل خطة، مع فحص السعة الأسبوعية")
+    parser.add_argument('--week-days', type=int, default=WEEK_DAYS)
+    parser.add_argument('--periods-per-day', type=int, default=PERIODS_PER_DAY)
+    args = parser.parse_args()
+    main(args.excel_file, split=args.split, stats=args.stats,
+         week_days=args.week_days, periods_per_day=args.periods_per_day)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+One parser for grade expressions in the plan sheets.
+
+A grade cell may name one grade ("الصف الثالث", "الأول المتوسط"), several
+("الصف الأول والثاني والثالث", "الصف الأول / الثاني") or a group
+("الصفوف العليا (4-6)"). parse_grades() returns the canonical set of grade
+numbers for such a cell, memoized per normalized text (arabic_text.fold), and
+build_grade_index() inverts a column of cells into grade -> row positions so
+per-grade plans are built by lookup instead of rescanning the rows.
+"""
+
+import re
+from collections import defaultdict
+from functools import lru_cache
+from itertools import repeat
+
+from arabic_text import fold
+
+GRADE_NAMES = ('الأول', 'الثاني', 'الثالث', 'الرابع', 'الخامس', 'السادس')
+
+# المذكر والمؤنث: "الصف الأول" و "السنة الأولى"
+# المفاتيح بصيغة fold() لأن النص يطبع قبل المقارنة
+ORDINALS = {fold(name): number for number, name in enumerate(GRADE_NAMES, start=1)}
+ORDINALS.update({fold(name): number for number, name in enumerate(
+    ('الأولى', 'الثانية', 'الثالثة', 'الرابعة', 'الخامسة', 'السادسة'), start=1)})
+
+GROUPS = {
+    fold('الصفوف العليا'): (4, 5, 6),
+    fold('الصفوف الأولية'): (1, 2, 3),
+    fold('الصفوف الدنيا'): (1, 2, 3),
+}
+
+RANGE_RE = re.compile(r"(\d+)\s*-\s*(\d+)")
+TOKEN_SPLIT_RE = re.compile(r"[\s/،,()\-]+")
+
+
+@lru_cache(maxsize=1024)
+def _parse(text):
+    grades = set()
+    for group, numbers in GROUPS.items():
+        if group in text:
+            grades.update(numbers)
+
+    for start, end in RANGE_RE.findall(text):
+        grades.update(range(int(start), int(end) + 1))
+
+    for token in TOKEN_SPLIT_RE.split(text):
+        # "والثاني" -> "الثاني"
+        if token not in ORDINALS and token.startswith('و'):
+            token = token[1:]
+        if token in ORDINALS:
+            grades.add(ORDINALS[token])
+
+    return frozenset(grades)
+
+
+def parse_grades(text):
+    """Return the frozenset of grade numbers named by a grade cell."""
+    if not text:
+        return frozenset()
+    return _parse(fold(text))
+
+
+def grade_code(text):
+    """
+    Short code for a grade cell, shared by the template generators:
+    grade1..grade6, grades123, upper (4-6), grades12, ... or None.
+    """
+    grades = parse_grades(text)
+    if not grades:
+        return None
+    if len(grades) == 1:
+        return f"grade{next(iter(grades))}"
+    if grades == {4, 5, 6}:
+        return 'upper'
+    return 'grades' + ''.join(str(g) for g in sorted(grades))
+
+
+def build_grade_index(texts, fallbacks=None):
+    """
+    Return {grade: [positions]} for a column of grade cells, ordered by
+    grade. A cell naming no grade falls back to the matching entry of
+    `fallbacks` (e.g. the phase column) when given.
+    """
+    index = defaultdict(list)
+    for position, (text, fallback) in enumerate(zip(texts, fallbacks if fallbacks is not None else repeat(None))):
+        grades = parse_grades(text) or parse_grades(fallback)
+        for grade in grades:
+            index[grade].append(position)
+    return dict(sorted(index.items()))
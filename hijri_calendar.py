@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Umm al-Qura Hijri <-> Gregorian table and semester school-day tables.
+
+generateDutyDates() (utils/dutyUtils.ts) turns a Hijri semester date into
+a Gregorian one as `hijriYear + 579` with the same month and day, which can
+be weeks off. It then walks the semester one Date at a time on every call.
+
+The official Umm al-Qura calendar is stored here as one 12-bit word per
+Hijri year, 1440-1470هـ: bit m-1 is set when month m has 30 days. The
+table was taken from ICU's islamic-umalqura calendar and checked against
+announced month starts. At import the words expand into two NumPy arrays:
+
+- MONTH_STARTS: the Gregorian ordinal of the first day of every month;
+- DAY_MONTH: the month index of every day in the range.
+
+Both conversions are then one array index.
+
+semester_days() builds a whole semester in one vectorized step: weekday,
+active-day and holiday masks, and week numbers (a new week on every
+Sunday, as in the TS). semester_table() exports it as JSON for the
+frontend.
+
+    python hijri_calendar.py convert 1447-03-01 2025-08-24
+    python hijri_calendar.py table -o hijri_table.json
+    python hijri_calendar.py semester school.json -o semester.json
+"""
+
+import argparse
+import sys
+from datetime import date
+from typing import List, NamedTuple, Tuple
+
+import numpy as np
+
+from timetable_solver import load_input, write_json
+
+FIRST_YEAR = 1440
+LAST_YEAR = 1470
+EPOCH = date(2018, 9, 11)           # 1 محرم 1440
+
+# أطوال الأشهر لكل سنة: البت m-1 = 1 إذا كان الشهر m ثلاثين يوماً
+MONTH_BITS = (
+    0x2ba, 0x5b5, 0x5aa, 0xd55, 0xa9a, 0x92e, 0x26e, 0x55d, 0xada, 0x6d4,   # 1440-1449
+    0x6a5, 0xb27, 0xa4d, 0x4ad, 0x56d, 0xb5a, 0x754, 0xf49, 0xe92, 0xd26,   # 1450-1459
+    0xa56, 0x356, 0x6b5, 0xbaa, 0xb92, 0xb25, 0x68b, 0xa9b, 0x55a, 0xada,   # 1460-1469
+    0x5b4,                                                                  # 1470
+)
+
+MONTH_LENGTHS = 29 + ((np.array(MONTH_BITS, dtype=np.int64)[:, None] >> np.arange(12)) & 1).ravel()
+MONTH_STARTS = EPOCH.toordinal() + np.concatenate(([0], np.cumsum(MONTH_LENGTHS)))
+DAY_MONTH = np.repeat(np.arange(len(MONTH_LENGTHS), dtype=np.int16), MONTH_LENGTHS)
+FIRST_DAY = date.fromordinal(int(MONTH_STARTS[0]))
+LAST_DAY = date.fromordinal(int(MONTH_STARTS[-1]) - 1)
+
+HIJRI_MONTHS = ['محرم', 'صفر', 'ربيع الأول', 'ربيع الآخر', 'جمادى الأولى', 'جمادى الآخرة',
+                'رجب', 'شعبان', 'رمضان', 'شوال', 'ذو القعدة', 'ذو الحجة']
+DAY_KEYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']   # date.weekday()
+SCHOOL_WEEK = ('sunday', 'monday', 'tuesday', 'wednesday', 'thursday')
+
+
+class SemesterDay(NamedTuple):
+    date: str              # ميلادي YYYY-MM-DD
+    hijri: str             # هجري YYYY-MM-DD
+    dayKey: str
+    week: int
+
+
+# ===== التحويل =====
+
+def month_index(year, month):
+    if not FIRST_YEAR <= year <= LAST_YEAR or not 1 <= month <= 12:
+        raise ValueError(f"التاريخ الهجري {year}-{month:02d} خارج جدول أم القرى ({FIRST_YEAR}-{LAST_YEAR}هـ)")
+    return (year - FIRST_YEAR) * 12 + month - 1
+
+
+def month_length(year, month):
+    return int(MONTH_LENGTHS[month_index(year, month)])
+
+
+def hijri_to_gregorian(year, month, day):
+    # type: (int, int, int) -> date
+    i = month_index(year, month)
+    if not 1 <= day <= MONTH_LENGTHS[i]:
+        raise ValueError(f"اليوم {day} غير موجود في {HIJRI_MONTHS[month - 1]} {year}هـ")
+    return date.fromordinal(int(MONTH_STARTS[i]) + day - 1)
+
+
+def gregorian_to_hijri(day):
+    # type: (date) -> Tuple[int, int, int]
+    offset = day.toordinal() - int(MONTH_STARTS[0])
+    if not 0 <= offset < len(DAY_MONTH):
+        raise ValueError(f"التاريخ {day.isoformat()} خارج جدول أم القرى ({FIRST_DAY} - {LAST_DAY})")
+    i = int(DAY_MONTH[offset])
+    return FIRST_YEAR + i // 12, i % 12 + 1, day.toordinal() - int(MONTH_STARTS[i]) + 1
+
+
+def hijri_iso(year, month, day):
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def parse_date(text):
+    # type: (str) -> date
+    """YYYY-MM-DD as a Gregorian date; a year below 1800 is read as Hijri (Umm al-Qura)."""
+    try:
+        year, month, day = (int(part) for part in text.strip().split('-'))
+    except (AttributeError, ValueError):
+        raise ValueError(f"تاريخ غير صالح: {text!r} (المتوقع YYYY-MM-DD)")
+    if year < 1800:
+        return hijri_to_gregorian(year, month, day)
+    return date(year, month, day)
+
+
+def describe(day):
+    year, month, hijri_day = gregorian_to_hijri(day)
+    return f"{hijri_day} {HIJRI_MONTHS[month - 1]} {year}هـ"
+
+
+# ===== جداول الفصل الدراسي =====
+
+def holiday_dates(holidays):
+    # type: (list) -> List[date]
+    """Parsed holidays; a malformed one is skipped with a warning instead of failing the semester."""
+    dates = []
+    for holiday in holidays:
+        try:
+            dates.append(parse_date(holiday))
+        except ValueError as error:
+            print(f"  ! تم تجاهل عطلة: {error}", file=sys.stderr)
+    return dates
+
+
+def semester_days(start, end, active_days=SCHOOL_WEEK, holidays=()):
+    # type: (str, str, list, list) -> List[SemesterDay]
+    """
+    School days from `start` to `end` (Hijri or Gregorian strings),
+    skipping inactive days and `holidays`, numbered by week like
+    generateDutyDates(). Days outside the Umm al-Qura table have an empty
+    `hijri`.
+    """
+    first, last = parse_date(start).toordinal(), parse_date(end).toordinal()
+    ordinals = np.arange(first, last + 1)
+    weekdays = (ordinals - 1) % 7                                  # 0 = الإثنين كما في date.weekday()
+    keys = np.array(DAY_KEYS)[weekdays]
+    holiday_ordinals = [holiday.toordinal() for holiday in holiday_dates(holidays)]
+    open_days = np.isin(keys, list(active_days)) & ~np.isin(ordinals, holiday_ordinals)
+
+    # يبدأ أسبوع جديد كل أحد بعد أول يوم دراسي في التقويم (حتى لو كان إجازة)
+    week_days = np.nonzero(np.isin(keys, SCHOOL_WEEK))[0]
+    started = week_days[0] if len(week_days) else len(ordinals)
+    weeks = 1 + np.cumsum((keys == 'sunday') & (np.arange(len(ordinals)) > started))
+
+    # العمود الهجري للأيام داخل الجدول فقط، والباقي فارغ
+    offsets = ordinals - int(MONTH_STARTS[0])
+    inside = (offsets >= 0) & (offsets < len(DAY_MONTH))
+    months = np.full(len(ordinals), -1, dtype=np.int64)
+    months[inside] = DAY_MONTH[offsets[inside]]
+    hijri_days = ordinals - MONTH_STARTS[np.maximum(months, 0)] + 1
+
+    return [SemesterDay(date.fromordinal(int(ordinal)).isoformat(),
+                        hijri_iso(FIRST_YEAR + int(month) // 12, int(month) % 12 + 1, int(hijri_day)) if month >= 0 else '',
+                        str(key), int(week))
+            for ordinal, month, hijri_day, key, week
+            in zip(ordinals[open_days], months[open_days], hijri_days[open_days], keys[open_days], weeks[open_days])]
+
+
+def semester_table(semester, active_days=SCHOOL_WEEK):
+    """One SemesterInfo as {id, name, startDate, endDate, schoolDays, weeks: [...]} in both calendars."""
+    holidays = sorted(holiday.isoformat() for holiday in holiday_dates(semester.get('holidays') or []))
+    days = semester_days(semester['startDate'], semester['endDate'], active_days, holidays)
+    weeks = []
+    for day in days:
+        if not weeks or weeks[-1]['week'] != day.week:
+            weeks.append({'week': day.week, 'weekId': f"week-{day.week}", 'weekName': f"الأسبوع {day.week}", 'days': []})
+        weeks[-1]['days'].append({'date': day.date, 'hijri': day.hijri, 'dayKey': day.dayKey})
+    for week in weeks:
+        week.update(startDate=week['days'][0]['date'], endDate=week['days'][-1]['date'],
+                    hijriStart=week['days'][0]['hijri'], hijriEnd=week['days'][-1]['hijri'])
+    return {
+        'id': semester.get('id'),
+        'name': semester.get('name'),
+        'startDate': parse_date(semester['startDate']).isoformat(),
+        'endDate': parse_date(semester['endDate']).isoformat(),
+        'holidays': holidays,
+        'schoolDays': len(days),
+        'weeks': weeks,
+    }
+
+
+def lookup_table():
+    """The compact table for the frontend: month starts are EPOCH + cumulative lengths from monthBits."""
+    return {
+        'calendar': 'islamic-umalqura',
+        'firstYear': FIRST_YEAR,
+        'lastYear': LAST_YEAR,
+        'epoch': EPOCH.isoformat(),
+        'monthBits': list(MONTH_BITS),
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="تقويم أم القرى وجداول أيام الفصل الدراسي")
+    commands = parser.add_subparsers(dest='command', required=True)
+    convert = commands.add_parser('convert', help="تحويل تواريخ هجرية أو ميلادية (YYYY-MM-DD)")
+    convert.add_argument('dates', nargs='+')
+    table = commands.add_parser('table', help="تصدير جدول أم القرى بصيغة JSON")
+    table.add_argument('-o', '--output')
+    semester = commands.add_parser('semester', help="أيام وأسابيع الفصول من schoolInfo")
+    semester.add_argument('input', help="ملف JSON فيه schoolInfo أو SchoolInfo مباشرة")
+    semester.add_argument('-o', '--output')
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'convert':
+            for text in args.dates:
+                day = parse_date(text)
+                print(f"{text} → {day.isoformat()} | {hijri_iso(*gregorian_to_hijri(day))} | {describe(day)}")
+        elif args.command == 'table':
+            write_json(lookup_table(), args.output)
+        else:
+            data = load_input(args.input)
+            school_info = data.get('schoolInfo') or data
+            active_days = (school_info.get('timing') or {}).get('activeDays') or SCHOOL_WEEK
+            tables = [semester_table(s, active_days) for s in school_info.get('semesters') or []
+                      if s.get('startDate') and s.get('endDate')]
+            write_json(tables, args.output)
+            for t in tables:
+                print(f"✓ {t['name']}: {t['startDate']} → {t['endDate']} | {len(t['weeks'])} أسبوع | "
+                      f"{t['schoolDays']} يوم دراسي", file=sys.stderr)
+    except ValueError as error:
+        print(f"✗ {error}", file=sys.stderr)
+        sys.exit(1)
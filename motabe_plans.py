@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+motabe-plans: one entry point for the study-plan workbook tools.
+
+    python motabe_plans.py inspect  [workbook] [--rows N] [--sections]
+    python motabe_plans.py count    [workbook]
+    python motabe_plans.py dump     [workbook] [-o file.csv] [--phase P]
+    python motabe_plans.py validate [workbook] [--json] [--rules R ...] [--expected N]
+    python motabe_plans.py generate [workbook] [--split] [--stats]
+    python motabe_plans.py diff     [workbook]
+    python motabe_plans.py verify   [workbook] [--classifier]
+
+Every subcommand works on the same PlanRow list from plan_cache, so a
+workbook is parsed once and later commands only unpickle the cached rows.
+Heavy or unrelated modules (openpyxl, the generator) are imported inside
+the subcommand that needs them; at module level only the standard library
+and plan_cache are loaded.
+"""
+
+import argparse
+import sys
+
+from plan_cache import load_plan_rows
+
+DEFAULT_WORKBOOK = "الخطط الدراسية 1447هـ.xlsx"
+
+
+def short(value, width):
+    text = '' if value is None else str(value)
+    return text[:width].ljust(width)
+
+
+def cmd_inspect(args):
+    import zipfile
+
+    from plan_cache import sheet_parts
+
+    with zipfile.ZipFile(args.workbook) as archive:
+        parts, active = sheet_parts(archive)
+    print(f"الأوراق: {', '.join(parts)} (النشطة: {active})")
+
+    if args.sections:
+        from plan_sections import read_sections
+
+        for section in read_sections(args.workbook, args.sheet):
+            mapping = ', '.join(f"{field}={index}" for field, index in section.columns.items() if index is not None)
+            print(f"  {section.schema:12} رأس: {section.header_row or '-':>5} | "
+                  f"الأسطر {section.start_row}-{section.end_row} | {mapping}")
+
+    rows = load_plan_rows(args.workbook, args.sheet)
+    print(f"عدد الأسطر: {len(rows)}\n")
+    for row in rows[:args.rows]:
+        print(f"{row.row:5}. {short(row.phase, 12)} | {short(row.department, 20)} | "
+              f"{short(row.grade, 20)} | {short(row.subject, 30)} | {row.raw_periods}")
+
+    # ملخص الخطط: عدد المواد ومجموع الحصص لكل (مرحلة، قسم، صف)
+    summary = {}
+    for row in rows:
+        if row.subject:
+            entry = summary.setdefault((row.phase, row.department, row.grade), [0, 0])
+            entry[0] += 1
+            entry[1] += row.periods or 0
+    print(f"\nعدد الخطط: {len(summary)}")
+    for (phase, department, grade), (subjects, periods) in summary.items():
+        print(f"  {phase} | {department or '-'} | {grade}: {subjects} مادة، {periods} حصة")
+    return 0
+
+
+def cmd_count(args):
+    rows = load_plan_rows(args.workbook, args.sheet)
+    with_subject = sum(1 for row in rows if row.subject is not None)
+    print(f"إجمالي الأسطر (بدون الرأس): {len(rows)}")
+    print(f"إجمالي الأسطر التي تحتوي على مادة: {with_subject}")
+    return 0
+
+
+def cmd_dump(args):
+    import csv
+
+    from plan_reader import PlanRow
+
+    rows = load_plan_rows(args.workbook, args.sheet)
+    if args.phase:
+        rows = [row for row in rows if row.phase == args.phase]
+
+    out = open(args.output, 'w', encoding='utf-8-sig', newline='') if args.output else sys.stdout
+    try:
+        writer = csv.writer(out)
+        writer.writerow(PlanRow._fields)
+        writer.writerows(rows)
+    finally:
+        if args.output:
+            out.close()
+            print(f"✓ {len(rows)} سطر في {args.output}")
+    return 0
+
+
+def cmd_validate(args):
+    from plan_validation import format_json, format_table, load_rows, validate_rows
+
+    rows = load_rows(args.workbook, args.sheet)
+    report = validate_rows(rows, args.rules, args.expected)
+    if args.json:
+        print(format_json(report, workbook=args.workbook, sheet=args.sheet))
+    else:
+        print(format_table(report, min_severity=args.severity))
+    return 0 if report.ok else 1
+
+
+def cmd_generate(args):
+    import generate_study_plans
+
+    generate_study_plans.main(args.workbook, split=args.split, stats=args.stats)
+    return 0
+
+
+def cmd_diff(args):
+    from generate_study_plans import PLANS_FILE, build_plans, read_text, update_plans_text
+
+    plans = build_plans(load_plan_rows(args.workbook, args.sheet))
+    _, changed, added, removed = update_plans_text(read_text(PLANS_FILE), plans)
+    for label, keys in (('~', changed), ('+', added), ('-', removed)):
+        for key in keys:
+            print(f"{label} {key}")
+    print(f"{PLANS_FILE}: معدلة: {len(changed)} | جديدة: {len(added)} | محذوفة: {len(removed)}")
+    return 1 if changed or added or removed else 0
+
+
+def cmd_verify(args):
+    from verify_plans import verify
+
+    problems = verify(args.workbook, classifier=args.classifier)
+    for marker, key, detail in problems:
+        print(f"{marker} {key}: {detail}")
+    print(f"{'✓ متطابقة' if not problems else f'✗ {len(problems)} فرق'}")
+    return 1 if problems else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="motabe-plans", description="أدوات ملفات الخطط الدراسية")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add(name, handler, help, sheet=True):
+        command = commands.add_parser(name, help=help)
+        command.add_argument('workbook', nargs='?', default=DEFAULT_WORKBOOK)
+        if sheet:
+            command.add_argument('--sheet', default=None, help="اسم الورقة (الافتراضي: الورقة النشطة)")
+        command.set_defaults(handler=handler)
+        return command
+
+    inspect = add('inspect', cmd_inspect, "الأوراق وأول الأسطر وملخص الخطط")
+    inspect.add_argument('--rows', type=int, default=15, help="عدد الأسطر المعروضة")
+    inspect.add_argument('--sections', action='store_true', help="عرض الجداول المكتشفة في الورقة وأعمدتها")
+    add('count', cmd_count, "عدد الأسطر والمواد")
+    dump = add('dump', cmd_dump, "تصدير الأسطر المقروءة إلى CSV")
+    dump.add_argument('-o', '--output', help="ملف CSV (الافتراضي: الطباعة)")
+    dump.add_argument('--phase', help="تصدير مرحلة واحدة فقط")
+    validate = add('validate', cmd_validate, "فحص الأسطر الناقصة والحصص والمواد المكررة (plan_validation.py)")
+    validate.add_argument('--json', action='store_true', help="تقرير JSON بدلاً من الجدول")
+    validate.add_argument('--rules', nargs='+', help="تشغيل قواعد محددة فقط")
+    validate.add_argument('--expected', type=int, help="العدد المتوقع للأسطر")
+    validate.add_argument('--severity', choices=['error', 'warning', 'info'], default='warning',
+                          help="أدنى مستوى يعرض في الجدول")
+    generate = add('generate', cmd_generate, "توليد study_plans.ts (انظر generate_study_plans.py)",
+                   sheet=False)
+    generate.add_argument('--split', action='store_true')
+    generate.add_argument('--stats', action='store_true', help="مجموع الحصص وتوزيعها لكل خطة مع فحص السعة")
+    add('diff', cmd_diff, "مقارنة ملف Excel مع study_plans.ts بدون كتابة")
+    verify = add('verify', cmd_verify, "مطابقة study_plans.ts و study_plans_config.ts مع ملف Excel (verify_plans.py)",
+                 sheet=False)
+    verify.add_argument('--classifier', action='store_true', help="مقارنة specializationIds مع المصنف")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Teacher and class occupancy as packed bitsets.
+
+The frontend keeps occupancy as string keys (`${teacherId}-${day}-${period}`)
+in Sets and Maps and counts a teacher's load by scanning the whole
+timetable. OccupancyGrid stores the same facts as two NumPy arrays of
+uint64, teachers x days and classes x days, with bit `period - 1` set when
+the teacher (or class) is busy in that period. So:
+
+- a busy test is one index and one shift;
+- daily and weekly loads for every teacher are one vectorized popcount;
+- free periods shared by a teacher and a class are `~(t | c)` on two words;
+- to_keys() / from_timetable() convert to and from the TimetableData keys.
+
+A grid holds one layer of occupancy. Lessons and waiting duties are kept in
+two grids when they must be counted apart.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+MAX_PERIODS = 64
+
+# جدول عدد البتات لكل بايت لنسخ NumPy التي لا تحتوي bitwise_count
+_POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def popcount(words):
+    """Number of set bits of every element of a uint64 array."""
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).astype(np.int64)
+    return _POPCOUNT8[words.view(np.uint8)].reshape(words.shape + (8,)).sum(axis=-1, dtype=np.int64)
+
+
+def slot_key(teacher_id, day, period):
+    return f"{teacher_id}-{day}-{period}"
+
+
+def split_key(key):
+    """`${teacherId}-${day}-${period}` -> (teacherId, day, period); teacher ids may contain '-'."""
+    teacher_id, day, period = key.rsplit('-', 2)
+    return teacher_id, day, int(period)
+
+
+class OccupancyGrid:
+    """teacher x day x period and class x day x period occupancy, one bit per period."""
+
+    def __init__(self, teacher_ids, class_ids, days, periods_per_day):
+        # type: (Iterable[str], Iterable[str], Iterable[str], int) -> None
+        if not 0 < periods_per_day <= MAX_PERIODS:
+            raise ValueError(f"periodsPerDay يجب أن يكون بين 1 و {MAX_PERIODS}")
+        self.teacher_ids = list(teacher_ids)
+        self.class_ids = list(class_ids)
+        self.days = list(days)
+        self.periods = periods_per_day
+        self.teacher_index = {teacher_id: t for t, teacher_id in enumerate(self.teacher_ids)}
+        self.class_index = {class_id: c for c, class_id in enumerate(self.class_ids)}
+        self.day_index = {day: d for d, day in enumerate(self.days)}
+        self.teachers = np.zeros((len(self.teacher_ids), len(self.days)), dtype=np.uint64)
+        self.classes = np.zeros((len(self.class_ids), len(self.days)), dtype=np.uint64)
+        self.full_day = (1 << periods_per_day) - 1
+
+    # ---- البناء والتحويل ----
+
+    @classmethod
+    def from_timetable(cls, timetable, days, periods_per_day, teacher_ids=None, class_ids=None):
+        # type: (Dict[str, dict], List[str], int, Optional[Iterable[str]], Optional[Iterable[str]]) -> OccupancyGrid
+        """
+        Build a grid from TimetableData. Teachers and classes not listed are
+        added in key order; keys for unknown days or periods are ignored.
+        """
+        entries = [(split_key(key), slot) for key, slot in timetable.items()]
+        teacher_ids = list(teacher_ids or [])
+        class_ids = list(class_ids or [])
+        known_teachers, known_classes = set(teacher_ids), set(class_ids)
+        for (teacher_id, _, _), slot in entries:
+            if teacher_id not in known_teachers:
+                known_teachers.add(teacher_id)
+                teacher_ids.append(teacher_id)
+            class_id = slot.get('classId')
+            if class_id and class_id not in known_classes:
+                known_classes.add(class_id)
+                class_ids.append(class_id)
+
+        grid = cls(teacher_ids, class_ids, days, periods_per_day)
+        for (teacher_id, day, period), slot in entries:
+            if day in grid.day_index and 1 <= period <= periods_per_day:
+                grid.occupy(teacher_id, day, period, slot.get('classId'))
+        return grid
+
+    def to_keys(self):
+        # type: () -> Iterator[str]
+        """Busy teacher slots as `${teacherId}-${day}-${period}`, by teacher, day, period."""
+        for t, d in zip(*np.nonzero(self.teachers)):
+            word = int(self.teachers[t, d])
+            teacher_id, day = self.teacher_ids[t], self.days[d]
+            while word:
+                low = word & -word
+                yield slot_key(teacher_id, day, low.bit_length())
+                word ^= low
+
+    # ---- الاختبار والتعديل: O(1) ----
+
+    def _bit(self, day, period):
+        return self.day_index[day], np.uint64(1 << (period - 1))
+
+    def teacher_busy(self, teacher_id, day, period):
+        d, bit = self._bit(day, period)
+        return bool(self.teachers[self.teacher_index[teacher_id], d] & bit)
+
+    def class_busy(self, class_id, day, period):
+        d, bit = self._bit(day, period)
+        return bool(self.classes[self.class_index[class_id], d] & bit)
+
+    def conflicts(self, teacher_id, class_id, day, period):
+        """True if the teacher or the class is already busy in that period."""
+        d, bit = self._bit(day, period)
+        busy = self.teachers[self.teacher_index[teacher_id], d]
+        if class_id is not None:
+            busy |= self.classes[self.class_index[class_id], d]
+        return bool(busy & bit)
+
+    def occupy(self, teacher_id, day, period, class_id=None):
+        d, bit = self._bit(day, period)
+        self.teachers[self.teacher_index[teacher_id], d] |= bit
+        if class_id is not None:
+            self.classes[self.class_index[class_id], d] |= bit
+
+    def release(self, teacher_id, day, period, class_id=None):
+        d, bit = self._bit(day, period)
+        self.teachers[self.teacher_index[teacher_id], d] &= ~bit
+        if class_id is not None:
+            self.classes[self.class_index[class_id], d] &= ~bit
+
+    def free_periods(self, teacher_id, day, class_id=None):
+        # type: (str, str, Optional[str]) -> List[int]
+        """Periods of `day` in which the teacher (and the class, if given) are both free."""
+        d = self.day_index[day]
+        busy = int(self.teachers[self.teacher_index[teacher_id], d])
+        if class_id is not None:
+            busy |= int(self.classes[self.class_index[class_id], d])
+        free = ~busy & self.full_day
+        return [period for period in range(1, self.periods + 1) if free >> (period - 1) & 1]
+
+    def week_mask(self, teacher_id=None, class_id=None):
+        """
+        The teacher's (or class's) week as one integer with bit
+        `day * periodsPerDay + period - 1`, the layout timetable_solver uses.
+        """
+        row = self.teachers[self.teacher_index[teacher_id]] if teacher_id is not None \
+            else self.classes[self.class_index[class_id]]
+        mask = 0
+        for d, word in enumerate(row.tolist()):
+            mask |= word << (d * self.periods)
+        return mask
+
+    # ---- الأحمال: عمليات متجهة على كل المعلمين ----
+
+    def teacher_daily_load(self):
+        """(teachers, days) array of busy periods."""
+        return popcount(self.teachers)
+
+    def teacher_weekly_load(self):
+        return self.teacher_daily_load().sum(axis=1)
+
+    def class_daily_load(self):
+        return popcount(self.classes)
+
+    def free_teachers(self, day, period, candidates=None):
+        """Indexes of the teachers free in that period, optionally among `candidates` (an index array)."""
+        d, bit = self._bit(day, period)
+        column = self.teachers[:, d] if candidates is None else self.teachers[candidates, d]
+        free = np.nonzero((column & bit) == 0)[0]
+        return free if candidates is None else np.asarray(candidates)[free]
+
+    def edge_load(self, period):
+        """(teachers,) count of days on which each teacher is busy in `period` (first/last period limits)."""
+        return ((self.teachers >> np.uint64(period - 1)) & np.uint64(1)).sum(axis=1, dtype=np.int64)
+
+    def gaps(self):
+        """(teachers, days) idle periods between a teacher's first and last lesson of the day."""
+        loads = popcount(self.teachers)
+        first = np.full(self.teachers.shape, -1, dtype=np.int64)
+        last = np.full(self.teachers.shape, -1, dtype=np.int64)
+        for period in range(self.periods):
+            busy = (self.teachers >> np.uint64(period)) & np.uint64(1) != 0
+            first = np.where(busy & (first < 0), period, first)
+            last = np.where(busy, period, last)
+        return np.where(loads > 0, last - first + 1 - loads, 0)
+
+    def runs_over(self, limits):
+        """
+        (teachers, days) bool: the teacher has more than `limit` consecutive
+        busy periods that day. `limits` is a scalar or one limit per teacher.
+        """
+        limits = np.broadcast_to(np.asarray(limits, dtype=np.int64), (len(self.teacher_ids),))
+        run = self.teachers.copy()
+        # run & (x >> i) لكل i حتى الحد: يبقى البت إذا بدأت عنده limit+1 حصة متتالية
+        for i in range(1, int(limits.max(initial=0)) + 1):
+            shifted = run & (self.teachers >> np.uint64(i))
+            run = np.where((i <= limits)[:, None], shifted, run)
+        return run != 0
+
+    def copy(self):
+        grid = OccupancyGrid.__new__(OccupancyGrid)
+        grid.__dict__.update(self.__dict__)
+        grid.teachers = self.teachers.copy()
+        grid.classes = self.classes.copy()
+        return grid
+
+    def __len__(self):
+        return int(popcount(self.teachers).sum())
+
+    def summary(self):
+        # type: () -> Tuple[int, int, int]
+        """(busy teacher slots, busy class slots, total gaps)."""
+        return len(self), int(popcount(self.classes).sum()), int(self.gaps().sum())
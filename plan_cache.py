@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+On-disk cache of parsed plan rows.
+
+Each sheet is cached separately under a key built from the sheet's XML part,
+the workbook's shared strings and PARSER_VERSION, so re-running a generator
+against an unchanged workbook only unpickles a small file, and editing one
+sheet leaves the other sheets' entries valid. Editing any text cell changes
+the shared strings and therefore re-parses every sheet.
+"""
+
+import hashlib
+import os
+import pickle
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+
+from plan_reader import DEFAULT_WORKBOOK, PARSER_VERSION, PlanRow, iter_plan_rows
+
+CACHE_DIR = ".plan_cache"
+
+NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+NS_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def sheet_parts(archive):
+    """Return ({sheet name: xml part path}, active sheet name)."""
+    workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+    rels = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+
+    targets = {}
+    for rel in rels.iter(f"{NS_PKG_REL}Relationship"):
+        target = rel.get("Target")
+        # المسار قد يكون مطلقاً (/xl/...) أو نسبياً لمجلد xl
+        if target.startswith("/"):
+            target = target.lstrip("/")
+        else:
+            target = posixpath.normpath(posixpath.join("xl", target))
+        targets[rel.get("Id")] = target
+
+    parts = {}
+    for sheet in workbook.iter(f"{NS_MAIN}sheet"):
+        parts[sheet.get("name")] = targets[sheet.get(f"{NS_REL}id")]
+
+    active_tab = 0
+    view = workbook.find(f"{NS_MAIN}bookViews/{NS_MAIN}workbookView")
+    if view is not None:
+        active_tab = int(view.get("activeTab", 0))
+    names = list(parts)
+    return parts, names[min(active_tab, len(names) - 1)]
+
+
+def sheet_digest(path, sheet=None, keep_blank_phase=False):
+    """Return (sheet name, content hash) without parsing any cell."""
+    with zipfile.ZipFile(path) as archive:
+        parts, active = sheet_parts(archive)
+        name = sheet or active
+        if name not in parts:
+            raise KeyError(f"Worksheet {name} does not exist.")
+
+        digest = hashlib.sha256(f"plan_reader/{PARSER_VERSION}\0{name}\0{int(keep_blank_phase)}\0".encode("utf-8"))
+        digest.update(archive.read(parts[name]))
+        if "xl/sharedStrings.xml" in archive.namelist():
+            digest.update(archive.read("xl/sharedStrings.xml"))
+    return name, digest.hexdigest()
+
+
+def load_plan_rows(path=DEFAULT_WORKBOOK, sheet=None, cache_dir=CACHE_DIR, keep_blank_phase=False):
+    """
+    Return the PlanRow list for one sheet, parsing the workbook only when
+    the cache has no entry for the sheet's current content.
+    keep_blank_phase is passed to iter_plan_rows and cached separately.
+    """
+    name, digest = sheet_digest(path, sheet, keep_blank_phase)
+    cache_file = os.path.join(cache_dir, f"{digest}.pickle")
+
+    if os.path.exists(cache_file):
+        with open(cache_file, "rb") as f:
+            return [PlanRow._make(row) for row in pickle.load(f)]
+
+    rows = list(iter_plan_rows(path, name, keep_blank_phase))
+
+    # الكتابة في ملف مؤقت ثم الاستبدال حتى لا يقرأ تشغيل متزامن ملفاً ناقصاً
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    with open(tmp_file, "wb") as f:
+        pickle.dump([tuple(row) for row in rows], f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, cache_file)
+    return rows
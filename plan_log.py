@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Structured logging for the plan scripts.
+
+All loggers live under the "motabe" namespace and are silent by default:
+get_logger() returns a logger whose DEBUG level is disabled, so guarded
+debug blocks (`if log.isEnabledFor(logging.DEBUG)`) cost nothing.
+
+configure() installs a single buffered UTF-8 file handler. Records carry
+optional `row` and `key` fields (pass them via `extra=`); in JSON-lines mode
+each record is one JSON object, otherwise a plain text line.
+
+Scripts call configure_from_env(), driven by:
+    MOTABE_LOG=debug            level name (debug, info, warning, ...)
+    MOTABE_LOG=debug,json       same, written as JSON lines
+    MOTABE_LOG_FILE=path        output file (default: extraction_debug.log)
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+
+ROOT_LOGGER = "motabe"
+DEFAULT_LOG_FILE = "extraction_debug.log"
+BUFFER_CAPACITY = 1000
+ENV_LEVEL = "MOTABE_LOG"
+ENV_FILE = "MOTABE_LOG_FILE"
+
+# حقول إضافية اختيارية تمرر عبر extra=
+CONTEXT_FIELDS = ("row", "key")
+
+
+class TextFormatter(logging.Formatter):
+    def format(self, record):
+        context = ''.join(
+            f" {field}={getattr(record, field)}" for field in CONTEXT_FIELDS if hasattr(record, field)
+        )
+        return f"{record.levelname} {record.name}{context}: {record.getMessage()}"
+
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "time": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS:
+            if hasattr(record, field):
+                entry[field] = getattr(record, field)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class BufferedFileHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that owns its UTF-8 file target and closes it too."""
+
+    def __init__(self, path, capacity=BUFFER_CAPACITY):
+        super().__init__(capacity, flushLevel=logging.ERROR,
+                         target=logging.FileHandler(path, mode='w', encoding='utf-8'))
+
+    def setFormatter(self, fmt):
+        # التنسيق يطبق عند الكتابة الفعلية في الملف
+        self.target.setFormatter(fmt)
+
+    def close(self):
+        target = self.target
+        try:
+            super().close()
+        finally:
+            if target is not None:
+                target.close()
+
+
+def _root():
+    root = logging.getLogger(ROOT_LOGGER)
+    if not root.handlers:
+        # صامت افتراضياً: لا شيء يصل إلى stderr ولا إلى ملف
+        root.addHandler(logging.NullHandler())
+        root.setLevel(logging.WARNING)
+        root.propagate = False
+    return root
+
+
+def get_logger(name):
+    _root()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def configure(level=logging.DEBUG, path=DEFAULT_LOG_FILE, json_lines=False, capacity=BUFFER_CAPACITY):
+    """
+    Route all "motabe" loggers to one buffered UTF-8 file handler.
+
+    Records are flushed every `capacity` records, on ERROR, and at exit.
+    Calling it again replaces the previous handler.
+    """
+    root = _root()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+    handler = BufferedFileHandler(path, capacity)
+    handler.setFormatter(JsonLinesFormatter() if json_lines else TextFormatter())
+    root.addHandler(handler)
+    root.setLevel(level)
+    return root
+
+
+def configure_from_env(default_path=DEFAULT_LOG_FILE):
+    """Enable logging only when MOTABE_LOG is set; returns True if enabled."""
+    spec = os.environ.get(ENV_LEVEL, "").strip().lower()
+    if not spec:
+        return False
+
+    parts = [part.strip() for part in spec.split(",")]
+    level = logging.getLevelName(parts[0].upper())
+    if not isinstance(level, int):
+        raise ValueError(f"{ENV_LEVEL}: unknown level {parts[0]!r}")
+
+    configure(level, os.environ.get(ENV_FILE, default_path), json_lines="json" in parts[1:])
+    return True
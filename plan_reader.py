@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared streaming reader for the study-plan workbooks.
+
+Opens the workbook once in read-only mode and yields one PlanRow per data
+row, so the extraction scripts no longer load the full workbook DOM or walk
+the sheet several times.
+"""
+
+from typing import Iterator, NamedTuple, Optional
+
+from arabic_text import clean
+from plan_sections import SectionSegmenter
+
+DEFAULT_WORKBOOK = "خطة المقررات الدراسية 1447هـ.xlsx"
+
+# يرفع عند أي تغيير في شكل PlanRow أو قواعد التنظيف (يبطل ملفات plan_cache)
+PARSER_VERSION = 2
+
+
+class PlanRow(NamedTuple):
+    row: int                      # رقم السطر في ملف Excel
+    phase: Optional[str]
+    department: Optional[str]     # None في الملفات ذات الأعمدة الأربعة
+    grade: Optional[str]          # الصف، أو الفصل الدراسي في جداول الثانوي
+    subject: Optional[str]
+    periods: Optional[int]        # None إذا لم تكن الخلية رقماً صحيحاً
+    raw_periods: object           # القيمة الأصلية كما في الخلية
+
+
+def clean_text(value):
+    # NFKC وحذف التطويل والتشكيل وتوحيد المسافات، مرة واحدة لكل قيمة مختلفة
+    return clean(value)
+
+
+# أسماء الصفوف كانت تنظف المسافات وحدها، والآن كل النصوص تمر بنفس التنظيف
+clean_grade = clean_text
+
+
+def parse_periods(value):
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    return None
+
+
+def make_row(row_num, row, columns):
+    def cell(name):
+        index = columns[name]
+        if index is None or index >= len(row):
+            return None
+        return row[index]
+
+    raw_periods = cell('periods')
+    return PlanRow(
+        row=row_num,
+        phase=clean_text(cell('phase')),
+        department=clean_text(cell('department')),
+        grade=clean_grade(cell('grade')),
+        subject=clean_text(cell('subject')),
+        periods=parse_periods(raw_periods),
+        raw_periods=raw_periods,
+    )
+
+
+def iter_plan_rows(path=DEFAULT_WORKBOOK, sheet=None, keep_blank_phase=False):
+    # type: (str, Optional[str], bool) -> Iterator[PlanRow]
+    """
+    Yield a PlanRow for every data row whose phase column is filled.
+
+    Rows go through a SectionSegmenter: each header row selects the column
+    mapping for the table below it, so sheets with several stacked tables
+    are read in a single pass.
+
+    With keep_blank_phase, rows under a merged phase cell (None after the
+    first row of the merge) are kept with phase=None for the caller to
+    forward-fill.
+    """
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.active
+        segmenter = SectionSegmenter()
+
+        for row_num, row in enumerate(worksheet.iter_rows(values_only=True), start=1):
+            if not segmenter.feed(row_num, row):
+                continue
+
+            phase_index = segmenter.columns['phase']
+            if not keep_blank_phase and (phase_index is None or phase_index >= len(row) or row[phase_index] is None):
+                continue
+
+            yield make_row(row_num, row, segmenter.columns)
+    finally:
+        workbook.close()
+
+
+def fill_merged(rows):
+    # type: (Iterator[PlanRow]) -> Iterator[PlanRow]
+    """
+    Forward-fill phase and grade into the rows under merged cells, as
+    extract_study_plan.py does, for rows read with keep_blank_phase=True.
+    """
+    phase = grade = None
+    for row in rows:
+        phase = row.phase or phase
+        grade = row.grade or grade
+        yield row._replace(phase=phase, grade=grade)
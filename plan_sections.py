@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Header-aware segmentation of plan sheets with several stacked tables.
+
+A plan sheet is a sequence of tables, each introduced by its own header row
+and usually followed by blank rows. The segmenter makes one pass over the
+rows: a header row selects the schema and column mapping for the rows that
+follow it, and a header or blank row closes the current section. Columns are
+mapped from the header labels, so re-ordered tables parse the same way.
+
+Schemas:
+    stage        المرحلة | الصف الدراسي | المادة الدراسية | عدد الحصص
+    high         الصف الدراسي | الفصل | المادة الدراسية | عدد الحصص
+                 (the year goes to `phase`, the semester to `grade`)
+    departments  المرحلة | القسم / المسار | الصف الدراسي | المادة الدراسية | عدد الحصص
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+# قيم العمود الأول التي تدل على سطر رأس جدول
+HEADER_MARKERS = ("المرحلة", "الصف الدراسي")
+
+# ترتيب الأعمدة الافتراضي عندما لا يسبق البيانات أي رأس (الملف القديم)
+COLUMNS_4 = {'phase': 0, 'department': None, 'grade': 1, 'subject': 2, 'periods': 3}
+
+# عنوان العمود -> الحقل في PlanRow
+LABEL_FIELDS = {
+    'المرحلة': 'phase',
+    'القسم / المسار': 'department',
+    'القسم': 'department',
+    'المسار': 'department',
+    'الصف الدراسي': 'grade',
+    'الفصل': 'grade',
+    'المادة الدراسية': 'subject',
+    'المادة': 'subject',
+    'عدد الحصص': 'periods',
+    'الحصص': 'periods',
+}
+
+
+class Section(NamedTuple):
+    schema: str                   # stage | high | departments
+    header_row: Optional[int]     # None إذا بدأ القسم بعد سطر فارغ دون رأس جديد
+    start_row: int                # أول سطر بيانات (مرقم من 1 كما في Excel)
+    end_row: int                  # آخر سطر بيانات
+    columns: Dict[str, Optional[int]]
+
+
+def is_header(cell):
+    return isinstance(cell, str) and cell.strip() in HEADER_MARKERS
+
+
+def is_blank(row):
+    # NaN != NaN: يغطي الخلايا الفارغة عند القراءة عبر pandas
+    return all(value is None or value != value or (isinstance(value, str) and not value.strip())
+               for value in row)
+
+
+def classify_header(row):
+    """Return (schema, columns) for a header row."""
+    labels = [str(cell).strip() if cell is not None else '' for cell in row]
+
+    columns = {field: None for field in COLUMNS_4}
+    for index, label in enumerate(labels):
+        field = LABEL_FIELDS.get(label)
+        if field and columns[field] is None:
+            columns[field] = index
+
+    if 'الفصل' in labels and 'المرحلة' not in labels:
+        # جداول الثانوي: السنة في عمود "الصف الدراسي" والفصل في عمود "الفصل"
+        columns['phase'] = labels.index('الصف الدراسي')
+        columns['grade'] = labels.index('الفصل')
+        return 'high', columns
+    if columns['department'] is not None:
+        return 'departments', columns
+    return 'stage', columns
+
+
+class SectionSegmenter:
+    """
+    Feed rows in sheet order; `columns` always holds the mapping for the
+    current row and `sections` the closed sections so far.
+    """
+
+    def __init__(self):
+        self.schema = 'stage'
+        self.columns = COLUMNS_4
+        self.sections = []          # type: List[Section]
+        self._header_row = None
+        self._start = None
+        self._end = None
+
+    def feed(self, row_num, row):
+        """Return True if the row is a data row of the current section."""
+        if not row or is_blank(row):
+            self._close()
+            return False
+
+        if is_header(row[0]):
+            self._close()
+            self.schema, self.columns = classify_header(row)
+            self._header_row = row_num
+            return False
+
+        if self._start is None:
+            self._start = row_num
+        self._end = row_num
+        return True
+
+    def _close(self):
+        if self._start is not None:
+            self.sections.append(Section(self.schema, self._header_row, self._start, self._end, self.columns))
+            # الأسطر التالية بعد الفراغ تبقى على نفس الأعمدة لكن بلا رأس خاص بها
+            self._header_row = None
+        self._start = self._end = None
+
+    def close(self):
+        self._close()
+        return self.sections
+
+
+def segment_rows(rows):
+    """Segment an iterable of (row number, values) and return the sections."""
+    segmenter = SectionSegmenter()
+    for row_num, row in rows:
+        segmenter.feed(row_num, row)
+    return segmenter.close()
+
+
+def read_sections(path, sheet=None):
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.active
+        return segment_rows(enumerate(worksheet.iter_rows(values_only=True), start=1))
+    finally:
+        workbook.close()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Single-pass validation of parsed plan rows.
+
+Every rule sees each PlanRow once, in one loop over the rows, so adding a
+rule does not add a pass over the workbook. Each finding is a Diagnostic
+(row number, rule, severity, message, offending value). A report can be
+rendered as JSON for tooling or as a plain table for reading.
+
+Rules are registered with the @rule decorator; rules that need to remember
+earlier rows (duplicates) keep their state in the `state` dict passed to
+them, which lives for one validation run.
+
+load_rows() keeps the rows under merged phase cells and forward-fills
+them, so missing_phase only reports rows that no phase above covers.
+"""
+
+import json
+from collections import Counter
+from typing import Callable, List, NamedTuple, Optional
+
+from plan_cache import load_plan_rows
+from plan_reader import PlanRow, fill_merged
+
+DEFAULT_WORKBOOK = "الخطط الدراسية 1447هـ.xlsx"
+
+ERROR = 'error'
+WARNING = 'warning'
+INFO = 'info'
+SEVERITIES = (ERROR, WARNING, INFO)
+
+
+class Rule(NamedTuple):
+    id: str
+    severity: str
+    description: str
+    check: Callable                # (row, state) -> None | (value, message)
+
+
+class Diagnostic(NamedTuple):
+    row: Optional[int]             # None للتشخيصات على مستوى الملف
+    rule: str
+    severity: str
+    message: str
+    value: object
+
+
+class Report(NamedTuple):
+    rows: int
+    diagnostics: List[Diagnostic]
+
+    def count(self, severity):
+        return sum(1 for d in self.diagnostics if d.severity == severity)
+
+    @property
+    def ok(self):
+        return self.count(ERROR) == 0
+
+
+RULES = []
+
+
+def rule(rule_id, severity, description):
+    def register(check):
+        RULES.append(Rule(rule_id, severity, description, check))
+        return check
+    return register
+
+
+def is_manual(row):
+    # نص في خانة الحصص مثل "يحددها المستخدم بشكل يدوي"
+    return row.periods is None and isinstance(row.raw_periods, str) and bool(row.raw_periods.strip())
+
+
+@rule('missing_phase', ERROR, "المرحلة فارغة")
+def check_phase(row, state):
+    if not row.phase:
+        return row.phase, "المرحلة فارغة"
+
+
+@rule('missing_grade', ERROR, "الصف الدراسي فارغ")
+def check_grade(row, state):
+    if not row.grade:
+        return row.grade, "الصف الدراسي فارغ"
+
+
+@rule('missing_subject', ERROR, "المادة فارغة")
+def check_subject(row, state):
+    if not row.subject:
+        values = {'phase': row.phase, 'department': row.department, 'grade': row.grade, 'periods': row.raw_periods}
+        return {k: v for k, v in values.items() if v is not None}, "المادة فارغة"
+
+
+@rule('missing_periods', WARNING, "عدد الحصص فارغ")
+def check_missing_periods(row, state):
+    if row.subject and row.raw_periods is None:
+        return None, "عدد الحصص فارغ"
+
+
+@rule('invalid_periods', ERROR, "عدد الحصص ليس عدداً صحيحاً موجباً")
+def check_invalid_periods(row, state):
+    if row.raw_periods is None or is_manual(row):
+        return None
+    if row.periods is None or row.periods <= 0:
+        return row.raw_periods, f"عدد الحصص غير صالح ({type(row.raw_periods).__name__})"
+
+
+@rule('manual_periods', INFO, "عدد الحصص يحدده المستخدم")
+def check_manual_periods(row, state):
+    if is_manual(row):
+        return row.raw_periods, "عدد الحصص يحدده المستخدم"
+
+
+@rule('duplicate_subject', WARNING, "المادة مكررة في نفس الخطة")
+def check_duplicate(row, state):
+    if not row.subject:
+        return None
+    seen = state.setdefault('duplicate_subject', {})
+    key = (row.phase, row.department, row.grade, row.subject)
+    if key in seen:
+        return row.subject, f"مكررة (السطر {seen[key]})"
+    seen[key] = row.row
+
+
+def load_rows(path=DEFAULT_WORKBOOK, sheet=None):
+    # type: (str, Optional[str]) -> List[PlanRow]
+    """Rows to validate: blank-phase rows kept, merged phase/grade cells filled."""
+    return list(fill_merged(load_plan_rows(path, sheet, keep_blank_phase=True)))
+
+
+def select_rules(rule_ids=None):
+    if not rule_ids:
+        return list(RULES)
+    known = {r.id: r for r in RULES}
+    unknown = [rule_id for rule_id in rule_ids if rule_id not in known]
+    if unknown:
+        raise KeyError(f"قواعد غير معروفة: {', '.join(unknown)}")
+    return [known[rule_id] for rule_id in rule_ids]
+
+
+def validate_rows(rows, rule_ids=None, expected_rows=None):
+    # type: (List[PlanRow], Optional[List[str]], Optional[int]) -> Report
+    """Run the selected rules over the rows in a single pass."""
+    rules = select_rules(rule_ids)
+    state = {}
+    diagnostics = []
+    count = 0
+
+    for row in rows:
+        count += 1
+        for r in rules:
+            finding = r.check(row, state)
+            if finding is not None:
+                value, message = finding
+                diagnostics.append(Diagnostic(row.row, r.id, r.severity, message, value))
+
+    if expected_rows is not None and count != expected_rows:
+        diagnostics.append(Diagnostic(
+            None, 'row_count', ERROR, f"عدد الأسطر المقروءة {count} والمتوقع {expected_rows}", count - expected_rows,
+        ))
+    return Report(count, diagnostics)
+
+
+def format_json(report, **meta):
+    data = dict(meta)
+    data.update({
+        'rows': report.rows,
+        'summary': {severity: report.count(severity) for severity in SEVERITIES},
+        'diagnostics': [d._asdict() for d in report.diagnostics],
+    })
+    return json.dumps(data, ensure_ascii=False, indent=2, default=str)
+
+
+def format_table(report, min_severity=INFO):
+    shown = SEVERITIES[:SEVERITIES.index(min_severity) + 1]
+    lines = []
+    for d in report.diagnostics:
+        if d.severity in shown:
+            row = '-' if d.row is None else d.row
+            lines.append(f"{row:>6} | {d.severity:7} | {d.rule:17} | {d.message} | {d.value!r}")
+
+    by_rule = Counter(d.rule for d in report.diagnostics)
+    lines.append(f"\n{report.rows} سطر: " + ', '.join(
+        f"{report.count(severity)} {severity}" for severity in SEVERITIES))
+    for rule_id, n in sorted(by_rule.items()):
+        lines.append(f"  {rule_id}: {n}")
+    return '\n'.join(lines)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Table-driven specialization classifier shared with the frontend.
+
+specialization_rules.json is the single rule table. It is compiled into one
+regex of zero-width lookaheads, one capture group per rule, so a name is
+classified in a single left-to-right scan: at each position the alternation
+reports the highest-priority rule matching there, and the overall winner is
+the lowest rule index seen. Names and keywords are compared on their
+arabic_text.fold() keys, so hamza, taa marbuta and diacritic variants of a
+keyword still match. Results are memoized per distinct name.
+
+Running this file exports the same table to utils/specializationRules.ts.
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+
+from arabic_text import fold
+
+RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "specialization_rules.json")
+TS_FILE = os.path.join("utils", "specializationRules.ts")
+
+
+def load_rules(path=RULES_FILE):
+    with open(path, encoding='utf-8') as f:
+        return [(rule['id'], rule['keywords']) for rule in json.load(f)['rules']]
+
+
+def compile_rules(rules):
+    groups = ('(' + '|'.join(re.escape(fold(word)) for word in keywords) + ')' for _, keywords in rules)
+    return re.compile('(?=' + '|'.join(groups) + ')')
+
+
+RULES = load_rules()
+_PATTERN = compile_rules(RULES)
+
+
+@lru_cache(maxsize=None)
+def classify(name):
+    """Return the specialization id for a subject/specialization name, or None."""
+    best = None
+    for match in _PATTERN.finditer(fold(name)):
+        index = match.lastindex - 1
+        if best is None or index < best:
+            best = index
+            if best == 0:
+                break
+    return RULES[best][0] if best is not None else None
+
+
+def specialization_ids(name):
+    # بصيغة specializationIds في Subject
+    spec_id = classify(name)
+    return [spec_id] if spec_id else []
+
+
+def export_ts(path=TS_FILE):
+    lines = [
+        "// مولد تلقائياً من specialization_rules.json بواسطة: python specializations.py\n",
+        "// لا تعدل هذا الملف يدوياً، عدّل ملف القواعد ثم أعد التوليد\n",
+        "\n",
+        "/** [specializationId, keywords] ordered by priority (first rule wins). */\n",
+        "export const SPECIALIZATION_RULES: [string, string[]][] = [\n",
+    ]
+    for spec_id, keywords in RULES:
+        lines.append(f"  [{json.dumps(spec_id)}, {json.dumps(keywords, ensure_ascii=False)}],\n")
+    lines += [
+        "];\n",
+        "\n",
+        "const escapeRegExp = (s: string) => s.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&');\n",
+        "\n",
+        "// Same folding as arabic_text.fold(): NFKC, no tatweel/diacritics, أإآٱ→ا، ى→ي، ة→ه\n",
+        "export const foldArabic = (s: string): string =>\n",
+        "  s.normalize('NFKC')\n",
+        "    .replace(/[\\u0640\\u064B-\\u065F\\u0670\\u06D6-\\u06ED]/g, '')\n",
+        "    .replace(/[أإآٱ]/g, 'ا')\n",
+        "    .replace(/ى/g, 'ي')\n",
+        "    .replace(/ة/g, 'ه')\n",
+        "    .split(/\\s+/).filter(Boolean).join(' ');\n",
+        "\n",
+        "// Lookahead per position: the first group that matches is the highest-priority rule there\n",
+        "const RULES_PATTERN = new RegExp(\n",
+        "  '(?=' + SPECIALIZATION_RULES.map(([, words]) => `(${words.map(w => escapeRegExp(foldArabic(w))).join('|')})`).join('|') + ')',\n",
+        "  'g'\n",
+        ");\n",
+        "\n",
+        "const cache = new Map<string, string | undefined>();\n",
+        "\n",
+        "/**\n",
+        " * Classify a subject or specialization name in one scan.\n",
+        " * Returns undefined when no rule matches.\n",
+        " */\n",
+        "export function classifySpecialization(name: string): string | undefined {\n",
+        "  if (cache.has(name)) return cache.get(name);\n",
+        "\n",
+        "  let best = -1;\n",
+        "  for (const match of foldArabic(name).matchAll(RULES_PATTERN)) {\n",
+        "    const index = match.findIndex((group, i) => i > 0 && group !== undefined) - 1;\n",
+        "    if (index >= 0 && (best < 0 || index < best)) best = index;\n",
+        "    if (best === 0) break;\n",
+        "  }\n",
+        "\n",
+        "  const result = best >= 0 ? SPECIALIZATION_RULES[best][0] : undefined;\n",
+        "  cache.set(name, result);\n",
+        "  return result;\n",
+        "}\n",
+    ]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(''.join(lines))
+
+
+if __name__ == '__main__':
+    export_ts()
+    print(f"✓ تم تصدير {len(RULES)} قاعدة إلى {TS_FILE}")
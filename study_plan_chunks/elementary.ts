@@ -0,0 +1,158 @@
+import { EncodedPlan } from '../utils/studyPlanCodec';
+
+// مولد تلقائياً من study_plans.ts بواسطة generate_study_plans.py --split
+// جدول نصوص + مصفوفات أرقام، تفك في index.ts (الصيغة موضحة في utils/studyPlanCodec.ts)
+export const STRINGS: string[] = [
+  'sp_الابتدائية_تعليم_عام_الأول',
+  'ELEMENTARY',
+  'تعليم عام',
+  'قرآن وإسلامية',
+  '1',
+  'اللغة العربية',
+  '2',
+  'الرياضيات',
+  '3',
+  'العلوم',
+  '4',
+  'اللغة الإنجليزية',
+  '5',
+  'التربية الفنية',
+  '8',
+  'التربية البدنية',
+  '9',
+  'المهارات الحياتية',
+  '17',
+  'النشاط',
+  'sp_الابتدائية_تعليم_عام_الثاني',
+  'sp_الابتدائية_تعليم_عام_الثالث',
+  'sp_الابتدائية_تعليم_عام_الرابع',
+  'الدراسات الاجتماعية',
+  '6',
+  'المهارات الرقمية',
+  '7',
+  'sp_الابتدائية_تعليم_عام_الخامس',
+  'sp_الابتدائية_تعليم_عام_السادس',
+  'sp_الابتدائية_تحفيظ_القرآن_الأول',
+  'تحفيظ القرآن',
+  'sp_الابتدائية_تحفيظ_القرآن_الثاني',
+  'sp_الابتدائية_تحفيظ_القرآن_الثالث',
+  'sp_الابتدائية_تحفيظ_القرآن_الرابع',
+  'التجويد',
+  'sp_الابتدائية_تحفيظ_القرآن_الخامس',
+  'sp_الابتدائية_تحفيظ_القرآن_السادس',
+  'sp_الابتدائية_تعليم_مستمر_ابتدائية_الأول',
+  'تعليم مستمر - ابتدائية',
+  'sp_الابتدائية_تعليم_مستمر_ابتدائية_الثاني',
+  'sp_الابتدائية_تعليم_مستمر_ابتدائية_الثالث',
+  'الحاسب',
+  'sp_الابتدائية_التعليم_المستمر_ذوي_الإعاقة_الفكرية_البسيطة_الأول',
+  'التعليم المستمر - ذوي الإعاقة الفكرية البسيطة',
+  'المهارات المهنية',
+  'sp_الابتدائية_التعليم_المستمر_ذوي_الإعاقة_الفكرية_البسيطة_الثاني',
+  'sp_الابتدائية_التعليم_المستمر_ذوي_الإعاقة_الفكرية_البسيطة_الثالث',
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الأول',
+  'المدارس الأهلية (منهج مغاير)',
+  'الدراسات الإسلامية',
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الثاني',
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الثالث',
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الرابع',
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الخامس',
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_السادس',
+  'sp_الابتدائية_المدارس_المطبقة_للفنون_أولية_الأول',
+  'المدارس المطبقة للفنون - أولية',
+  'الفنون البصرية',
+  'الفنون الموسيقية',
+  'الفنون الأدائية',
+  'sp_الابتدائية_المدارس_المطبقة_للفنون_أولية_الثاني',
+  'sp_الابتدائية_المدارس_المطبقة_للفنون_أولية_الثالث',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الأول',
+  'مدارس ذوي الإعاقة - طيف التوحد',
+  'التواصل',
+  'الأكاديمي',
+  'الفنون',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الثاني',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الثالث',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الرابع',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الخامس',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_السادس',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الأول',
+  'مدارس ذوي الإعاقة - الفكرية',
+  'لغة عربية',
+  'رياضيات',
+  'علوم',
+  'إنجليزي',
+  'فنية',
+  'بدنية',
+  'حياتية',
+  'نشاط',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الثاني',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الثالث',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الرابع',
+  'اجتماعيات',
+  'مهارات رقمية',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الخامس',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_السادس',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الأول',
+  'مدارس ذوي الإعاقة - الإعاقات',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الثاني',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الثالث',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الرابع',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الخامس',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_السادس',
+  'sp_الابتدائية_الموهوبين_الرابع',
+  'الموهوبين',
+  'الإثراء العام',
+  'sp_الابتدائية_الموهوبين_الخامس',
+  'sp_الابتدائية_الموهوبين_السادس',
+];
+
+export const PLANS: EncodedPlan[] = [
+  [0,1,2,[[1,3,5,4],[2,5,8,6],[3,7,5,8],[4,9,3,10],[5,11,3,12],[6,13,2,14],[7,15,3,16],[8,17,1,18],[9,19,3]]],
+  [20,1,2,[[1,3,5,4],[2,5,7,6],[3,7,6,8],[4,9,3,10],[5,11,3,12],[6,13,2,14],[7,15,3,16],[8,17,1,18],[9,19,3]]],
+  [21,1,2,[[1,3,5,4],[2,5,6,6],[3,7,6,8],[4,9,4,10],[5,11,3,12],[6,13,2,14],[7,15,3,16],[8,17,1,18],[9,19,3]]],
+  [22,1,2,[[1,3,5,4],[2,5,5,6],[3,7,6,8],[4,23,2,24],[5,9,4,10],[6,11,3,12],[7,25,2,26],[8,13,1,14],[9,15,2,16],[10,17,1,18],[11,19,2]]],
+  [27,1,2,[[1,3,5,4],[2,5,5,6],[3,7,6,8],[4,23,2,24],[5,9,4,10],[6,11,3,12],[7,25,2,26],[8,13,1,14],[9,15,2,16],[10,17,1,18],[11,19,2]]],
+  [28,1,2,[[1,3,5,4],[2,5,5,6],[3,7,6,8],[4,23,2,24],[5,9,4,10],[6,11,3,12],[7,25,2,26],[8,13,1,14],[9,15,2,16],[10,17,1,18],[11,19,2]]],
+  [29,1,30,[[1,3,9,4],[2,5,8,6],[3,7,5,8],[4,9,3,10],[5,11,3,12],[6,13,2,14],[7,15,3,16],[8,17,1,18],[9,19,1]]],
+  [31,1,30,[[1,3,9,4],[2,5,7,6],[3,7,6,8],[4,9,3,10],[5,11,3,12],[6,13,2,14],[7,15,3,16],[8,17,1,18],[9,19,1]]],
+  [32,1,30,[[1,3,9,4],[2,5,6,6],[3,7,6,8],[4,9,4,10],[5,11,3,12],[6,13,2,14],[7,15,3,16],[8,17,1,18],[9,19,1]]],
+  [33,1,30,[[1,3,8,4],[2,5,5,6],[3,7,6,8],[4,23,2,24],[5,9,4,10],[6,11,3,12],[7,25,2,26],[8,13,1,14],[9,15,2,16],[10,17,1,18],[11,34,1,4]]],
+  [35,1,30,[[1,3,8,4],[2,5,5,6],[3,7,6,8],[4,23,2,24],[5,9,4,10],[6,11,3,12],[7,25,2,26],[8,13,1,14],[9,15,2,16],[10,17,1,18],[11,34,1,4]]],
+  [36,1,30,[[1,3,8,4],[2,5,5,6],[3,7,6,8],[4,23,2,24],[5,9,4,10],[6,11,3,12],[7,25,2,26],[8,13,1,14],[9,15,2,16],[10,17,1,18],[11,34,1,4]]],
+  [37,1,38,[[1,3,4,4],[2,5,9,6],[3,7,2,8],[4,13,1,14],[5,15,1,16],[6,17,1,18]]],
+  [39,1,38,[[1,3,4,4],[2,5,6,6],[3,23,1,24],[4,7,2,8],[5,9,1,10],[6,11,2,12],[7,13,1,14],[8,15,1,16],[9,17,1,18]]],
+  [40,1,38,[[1,3,4,4],[2,5,6,6],[3,23,1,24],[4,7,2,8],[5,9,1,10],[6,11,2,12],[7,41,1,26],[8,13,1,14],[9,15,1,16],[10,17,1,18]]],
+  [42,1,43,[[1,3,4,4],[2,5,8,6],[3,7,2,8],[4,44,1],[5,13,1,14],[6,15,1,16],[7,17,1,18]]],
+  [45,1,43,[[1,3,4,4],[2,5,6,6],[3,23,1,24],[4,7,2,8],[5,44,1],[6,25,1,26],[7,13,1,14],[8,15,1,16],[9,17,2,18]]],
+  [46,1,43,[[1,3,4,4],[2,5,6,6],[3,23,1,24],[4,7,2,8],[5,44,2],[6,25,1,26],[7,13,1,14],[8,15,1,16],[9,17,2,18]]],
+  [47,1,48,[[1,49,5,4],[2,5,6,6]]],
+  [50,1,48,[[1,49,5,4],[2,5,6,6]]],
+  [51,1,48,[[1,49,5,4],[2,5,4,6],[3,23,2,24]]],
+  [52,1,48,[[1,49,5,4],[2,5,6,6],[3,23,2,24]]],
+  [53,1,48,[[1,49,5,4],[2,5,4,6],[3,23,2,24]]],
+  [54,1,48,[[1,49,5,4],[2,5,4,6],[3,23,2,24]]],
+  [55,1,56,[[1,3,5,4],[2,5,8,6],[3,7,5,8],[4,9,3,10],[5,11,3,12],[6,57,1,14],[7,58,1,14],[8,59,1,14],[9,15,3,16],[10,17,1,18],[11,19,3]]],
+  [60,1,56,[[1,3,5,4],[2,5,7,6],[3,7,6,8],[4,9,3,10],[5,11,3,12],[6,57,1,14],[7,58,1,14],[8,59,1,14],[9,15,3,16],[10,17,1,18],[11,19,3]]],
+  [61,1,56,[[1,3,5,4],[2,5,6,6],[3,7,6,8],[4,9,4,10],[5,11,3,12],[6,57,1,14],[7,58,1,14],[8,59,1,14],[9,15,3,16],[10,17,1,18],[11,19,3]]],
+  [62,1,63,[[1,64,5],[2,65,12],[3,17,4,18],[4,15,4,16],[5,66,3,14],[6,19,2]]],
+  [67,1,63,[[1,64,5],[2,65,12],[3,17,4,18],[4,15,4,16],[5,66,3,14],[6,19,2]]],
+  [68,1,63,[[1,64,5],[2,65,12],[3,17,4,18],[4,15,4,16],[5,66,3,14],[6,19,2]]],
+  [69,1,63,[[1,64,5],[2,65,14],[3,17,3,18],[4,15,2,16],[5,66,3,14],[6,25,1,26],[7,19,2]]],
+  [70,1,63,[[1,64,5],[2,65,14],[3,17,3,18],[4,15,2,16],[5,66,3,14],[6,25,1,26],[7,19,2]]],
+  [71,1,63,[[1,64,5],[2,65,14],[3,17,3,18],[4,15,2,16],[5,66,3,14],[6,25,1,26],[7,19,2]]],
+  [72,1,73,[[1,3,4,4],[2,74,5,6],[3,75,5,8],[4,76,2,10],[5,77,1],[6,78,3,14],[7,79,4,16],[8,80,4],[9,81,2]]],
+  [82,1,73,[[1,3,4,4],[2,74,5,6],[3,75,5,8],[4,76,2,10],[5,77,1],[6,78,3,14],[7,79,4,16],[8,80,4],[9,81,2]]],
+  [83,1,73,[[1,3,4,4],[2,74,5,6],[3,75,5,8],[4,76,2,10],[5,77,1],[6,78,3,14],[7,79,4,16],[8,80,4],[9,81,2]]],
+  [84,1,73,[[1,3,4,4],[2,74,5,6],[3,75,5,8],[4,76,2,10],[5,85,2,24],[6,77,1],[7,86,1],[8,78,3,14],[9,79,2,16],[10,80,3],[11,81,2]]],
+  [87,1,73,[[1,3,4,4],[2,74,5,6],[3,75,5,8],[4,76,2,10],[5,85,2,24],[6,77,1],[7,86,1],[8,78,3,14],[9,79,2,16],[10,80,3],[11,81,2]]],
+  [88,1,73,[[1,3,4,4],[2,74,5,6],[3,75,5,8],[4,76,2,10],[5,85,2,24],[6,77,1],[7,86,1],[8,78,3,14],[9,79,2,16],[10,80,3],[11,81,2]]],
+  [89,1,90,[[1,3,4,4],[2,74,5,6],[3,75,5,8],[4,76,2,10],[5,77,1],[6,78,3,14],[7,79,4,16],[8,80,4],[9,81,2]]],
+  [91,1,90,[[1,3,4,4],[2,74,5,6],[3,75,5,8],[4,76,2,10],[5,77,1],[6,78,3,14],[7,79,4,16],[8,80,4],[9,81,2]]],
+  [92,1,90,[[1,3,4,4],[2,74,5,6],[3,75,5,8],[4,76,2,10],[5,77,1],[6,78,3,14],[7,79,4,16],[8,80,4],[9,81,2]]],
+  [93,1,90,[[1,3,4,4],[2,74,5,6],[3,75,5,8],[4,76,2,10],[5,85,2,24],[6,77,1],[7,86,1],[8,78,3,14],[9,79,2,16],[10,80,3],[11,81,2]]],
+  [94,1,90,[[1,3,4,4],[2,74,5,6],[3,75,5,8],[4,76,2,10],[5,85,2,24],[6,77,1],[7,86,1],[8,78,3,14],[9,79,2,16],[10,80,3],[11,81,2]]],
+  [95,1,90,[[1,3,4,4],[2,74,5,6],[3,75,5,8],[4,76,2,10],[5,85,2,24],[6,77,1],[7,86,1],[8,78,3,14],[9,79,2,16],[10,80,3],[11,81,2]]],
+  [96,1,97,[[1,7,1,8],[2,9,1,10],[3,11,1,12],[4,25,1,26],[5,98,2]]],
+  [99,1,97,[[1,7,1,8],[2,9,1,10],[3,11,1,12],[4,25,1,26],[5,98,2]]],
+  [100,1,97,[[1,7,1,8],[2,9,1,10],[3,11,1,12],[4,25,1,26],[5,98,2]]],
+];
@@ -0,0 +1,230 @@
+import { EncodedPlan } from '../utils/studyPlanCodec';
+
+// مولد تلقائياً من study_plans.ts بواسطة generate_study_plans.py --split
+// جدول نصوص + مصفوفات أرقام، تفك في index.ts (الصيغة موضحة في utils/studyPlanCodec.ts)
+export const STRINGS: string[] = [
+  'sp_الثانوية_مسارات_الفصل_الأول_الأول_الثانوي',
+  'HIGH',
+  'مسارات - الفصل الأول',
+  'القرآن الكريم وتفسيره',
+  '1',
+  'sp_الثانوية_المشترك_الفصل_الأول_الأول_الثانوي',
+  'المشترك - الفصل الأول',
+  'الرياضيات 1',
+  '3',
+  'اللغة الإنجليزية 1',
+  '5',
+  'التقنية الرقمية 1',
+  'الكفايات اللغوية 1',
+  '2',
+  'مادة العلوم (كيمياء/فيزياء)',
+  '10',
+  'التفكير الناقد',
+  '18',
+  'التربية الصحية والبدنية 1',
+  '9',
+  'sp_الثانوية_المشترك_الفصل_الثاني_الأول_الثانوي',
+  'المشترك - الفصل الثاني',
+  'الأحياء 1',
+  '11',
+  'علم البيئة',
+  'الحديث 1',
+  'المعرفة المالية',
+  'الدراسات الاجتماعية',
+  '6',
+  'التربية المهنية',
+  'sp_الثانوية_مسار_عام_الفصل_الأول_الثاني_الثانوي',
+  'مسار عام - الفصل الأول',
+  'الرياضيات 2',
+  'اللغة الإنجليزية 2',
+  'الفيزياء 2',
+  '12',
+  'الكيمياء 2',
+  'الأحياء 2',
+  'الكفايات اللغوية 2',
+  'التاريخ',
+  'اللياقة والثقافة الصحية',
+  'النشاط',
+  'sp_الثانوية_مسار_عام_الفصل_الثاني_الثاني_الثانوي',
+  'مسار عام - الفصل الثاني',
+  'التقنية الرقمية 2',
+  'التوحيد 1',
+  'الجغرافيا',
+  'الفنون',
+  '8',
+  'sp_الثانوية_مسار_حاسب_وهندسة_الفصل_الأول_الثاني_الثانوي',
+  'مسار حاسب وهندسة - الفصل الأول',
+  'إنترنت الأشياء 1-1',
+  'sp_الثانوية_مسار_حاسب_وهندسة_الفصل_الثاني_الثاني_الثانوي',
+  'مسار حاسب وهندسة - الفصل الثاني',
+  'علم البيانات',
+  'الهندسة',
+  '22',
+  'sp_الثانوية_مسار_صحة_وحياة_الفصل_الأول_الثاني_الثانوي',
+  'مسار صحة وحياة - الفصل الأول',
+  'مبادئ العلوم الصحية',
+  '4',
+  'sp_الثانوية_مسار_صحة_وحياة_الفصل_الثاني_الثاني_الثانوي',
+  'مسار صحة وحياة - الفصل الثاني',
+  'الرعاية الصحية',
+  'sp_الثانوية_مسار_إدارة_أعمال_الفصل_الأول_الثاني_الثانوي',
+  'مسار إدارة أعمال - الفصل الأول',
+  'صناعة القرار في الأعمال',
+  'مقدمة في الأعمال',
+  'الإدارة المالية',
+  'sp_الثانوية_مسار_إدارة_أعمال_الفصل_الثاني_الثاني_الثانوي',
+  'مسار إدارة أعمال - الفصل الثاني',
+  'مبادئ الاقتصاد',
+  '13',
+  'مبادئ الإدارة',
+  'التفسير 1',
+  'sp_الثانوية_مسار_شرعي_الفصل_الأول_الثاني_الثانوي',
+  'مسار شرعي - الفصل الأول',
+  'القرآن الكريم 1',
+  'القراءات 1',
+  'الحديث 2',
+  'sp_الثانوية_مسار_شرعي_الفصل_الثاني_الثاني_الثانوي',
+  'مسار شرعي - الفصل الثاني',
+  'علوم القرآن',
+  'القراءات 2',
+  'مصطلح الحديث',
+  'التوحيد 2',
+  'sp_الثانوية_مسار_عام_الفصل_الأول_الثالث_الثانوي',
+  'الرياضيات 3',
+  'اللغة الإنجليزية 3',
+  'الفيزياء 3',
+  'الكيمياء 3',
+  'الأحياء 3',
+  'علوم الأرض والفضاء',
+  '20',
+  'المجال الاختياري',
+  'sp_الثانوية_مسار_عام_الفصل_الثاني_الثالث_الثانوي',
+  'الفقه 1',
+  'الدراسات الأدبية',
+  'الدراسات النفسية والاجتماعية',
+  'التقنية الرقمية 3',
+  'المواطنة الرقمية',
+  'sp_الثانوية_مسار_حاسب_وهندسة_الفصل_الأول_الثالث_الثانوي',
+  'الذكاء الاصطناعي',
+  'هندسة البرمجيات',
+  'التربية الصحية والبدنية 2',
+  'مشروع التخرج',
+  'sp_الثانوية_مسار_حاسب_وهندسة_الفصل_الثاني_الثالث_الثانوي',
+  'الأمن السيبراني',
+  'التصميم الهندسي',
+  'المهارات الحياتية',
+  '17',
+  'البحث ومصادر المعلومات',
+  'sp_الثانوية_مسار_صحة_وحياة_الفصل_الأول_الثالث_الثانوي',
+  'أنظمة جسم الإنسان',
+  'sp_الثانوية_مسار_صحة_وحياة_الفصل_الثاني_الثالث_الثانوي',
+  'الإحصاء',
+  'sp_الثانوية_مسار_إدارة_أعمال_الفصل_الأول_الثالث_الثانوي',
+  'إدارة الفعاليات',
+  'تخطيط الحملات التسويقية',
+  'مبادئ القانون',
+  'الدراسات البلاغية والنقدية',
+  'sp_الثانوية_مسار_إدارة_أعمال_الفصل_الثاني_الثالث_الثانوي',
+  'السكرتارية والإدارة المكتبية',
+  'تطبيقات في القانون',
+  'sp_الثانوية_مسار_شرعي_الفصل_الأول_الثالث_الثانوي',
+  'القرآن الكريم 2',
+  'الفقه 2',
+  'التفسير 2',
+  'الفرائض',
+  'sp_الثانوية_مسار_شرعي_الفصل_الثاني_الثالث_الثانوي',
+  'أصول الفقه',
+  'sp_الثانوية_المعاهد_العلمية_الثالث_الثانوي',
+  'المعاهد العلمية',
+  'القرآن الكريم',
+  'التفسير',
+  'الحديث',
+  'التوحيد',
+  'الفقه',
+  'النحو والصرف',
+  'المهارات اللغوية',
+  'البلاغة والنقد',
+  'الأدب العربي وتاريخه',
+  'العروض والقافية',
+  'الدراسات الاجتماعية (الجغرافيا)',
+  'الرياضيات',
+  'اللغة الإنجليزية',
+  'التقنية الرقمية',
+  'sp_الثانوية_دار_الحديث_المكية_المدنية_الأول_الثانوي',
+  'دار الحديث المكية / المدنية',
+  'دراسات في الكتب الستة',
+  'الدراسات الاجتماعية ( تاريخ - جغرافيا)',
+  'العلوم (الأحياء)',
+  'sp_الثانوية_دار_الحديث_المكية_المدنية_الثاني_الثانوي',
+  'تخريج الحديث',
+  'الدراسات الاجتماعية (تاريخ)',
+  'التربية الصحية',
+  'sp_الثانوية_دار_الحديث_المكية_المدنية_الثالث_الثانوي',
+  'الدراسات الاجتماعية (جغرافيا)',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_طيف_التوحد_الأول_الثانوي_التأهيلي',
+  'مدارس ذوي الإعاقة - طيف التوحد',
+  'التواصل',
+  'الأكاديمي',
+  'التربية البدنية',
+  'المهارات الرقمية',
+  '7',
+  'النشاط والتدريب',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_طيف_التوحد_الثاني_الثانوي_التأهيلي',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_طيف_التوحد_الثالث_الثانوي_التأهيلي',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الفكرية_الأول_الثانوي_التأهيلي',
+  'مدارس ذوي الإعاقة - الفكرية',
+  'قرآن وإسلامية',
+  'لغة عربية',
+  'رياضيات',
+  'إنجليزي',
+  'مهارات رقمية',
+  'فنية',
+  'بدنية',
+  'حياتية',
+  'نشاط',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الفكرية_الثاني_الثانوي_التأهيلي',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الفكرية_الثالث_الثانوي_التأهيلي',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الإعاقات_الأول_الثانوي_التأهيلي',
+  'مدارس ذوي الإعاقة - الإعاقات',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الإعاقات_الثاني_الثانوي_التأهيلي',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الإعاقات_الثالث_الثانوي_التأهيلي',
+];
+
+export const PLANS: EncodedPlan[] = [
+  [0,1,2,[[1,3,4,4]]],
+  [5,1,6,[[0,3,4,4],[1,7,5,8],[2,9,5,10],[3,11,3],[4,12,4,13],[5,14,3,15],[6,16,3,17],[7,18,2,19]]],
+  [20,1,21,[[1,7,5,8],[2,9,5,10],[3,11,3],[4,22,3,23],[5,14,3,15],[6,12,3,13],[7,24,2],[8,25,2,4],[9,26,2],[10,27,3,28],[11,29,2],[12,18,2,19]]],
+  [30,1,31,[[1,32,5,8],[2,33,5,10],[3,34,4,35],[4,36,5,15],[5,37,4,23],[6,38,4,13],[7,39,3,28],[8,40,3],[9,41,2]]],
+  [42,1,43,[[1,32,5,8],[2,33,5,10],[3,36,5,15],[4,37,4,23],[5,44,4],[6,45,2,4],[7,46,2,28],[8,47,2,48],[9,40,3],[10,41,2]]],
+  [49,1,50,[[1,32,5,8],[2,33,5,10],[3,34,4,35],[4,51,4],[5,38,4,13],[6,39,2,28],[7,40,3],[8,41,2]]],
+  [52,1,53,[[1,32,5,8],[2,33,5,10],[3,36,3,15],[4,54,4],[5,55,3,56],[6,45,2,4],[7,46,3,28],[8,40,3],[9,41,2]]],
+  [57,1,58,[[1,32,5,8],[2,33,5,10],[3,36,5,15],[4,37,4,23],[5,59,4,60],[6,38,4,13],[7,40,3],[8,41,2]]],
+  [61,1,62,[[1,32,5,8],[2,33,5,10],[3,34,4,35],[4,63,3],[5,44,2],[6,45,2,4],[7,40,3],[8,41,2]]],
+  [64,1,65,[[1,33,5,10],[2,66,5],[3,67,4],[4,38,4,13],[5,68,3],[6,45,2,4],[7,39,2,28],[8,40,3],[9,41,3]]],
+  [69,1,70,[[1,33,5,10],[2,66,4],[3,67,3],[4,71,3,72],[5,73,3,72],[6,74,2,4],[7,46,3,28],[8,47,2,48],[9,40,3],[10,41,3]]],
+  [75,1,76,[[1,77,5,4],[2,33,5,10],[3,38,4,13],[4,78,4],[5,79,2,4],[6,45,2,4],[7,39,3,28],[8,40,3],[9,41,3]]],
+  [80,1,81,[[1,77,5,4],[2,33,5,10],[3,82,4,4],[4,83,3],[5,84,2,4],[6,85,2,4],[7,46,2,28],[8,47,2,48],[9,40,3],[10,41,3]]],
+  [86,1,31,[[1,87,4,8],[2,88,4,10],[3,89,5,35],[4,90,5,15],[5,91,4,23],[6,92,3,93],[7,94,5],[8,41,1]]],
+  [95,1,43,[[1,87,4,8],[2,88,4,10],[3,89,5,35],[4,90,3,15],[5,91,4,23],[6,92,3,93],[7,96,2,4],[8,97,2],[9,98,2],[10,99,2],[11,100,2],[12,94,2],[13,41,2]]],
+  [101,1,50,[[1,87,4,8],[2,88,4,10],[3,89,5,35],[4,90,3,15],[5,92,3,93],[6,102,2],[7,103,3,56],[8,104,3,19],[9,105,2],[10,41,1]]],
+  [106,1,53,[[1,87,4,8],[2,88,4,10],[3,107,2],[4,108,3],[5,96,2,4],[6,109,2,110],[7,111,2,60],[8,41,2]]],
+  [112,1,58,[[1,87,4,8],[2,88,4,10],[3,91,5,23],[4,113,3],[5,92,3,93],[6,109,2,110],[7,104,3,19],[8,105,2],[9,41,2]]],
+  [114,1,62,[[1,87,4,8],[2,88,4,10],[3,89,3,35],[4,90,3,15],[5,96,2,4],[6,115,2],[7,111,2,60],[8,41,1]]],
+  [116,1,65,[[1,88,4,10],[2,117,4],[3,118,3],[4,119,3],[5,120,3],[6,115,2],[7,104,2,19],[8,111,2,60],[9,105,2],[10,41,1]]],
+  [121,1,70,[[1,88,4,10],[2,117,3],[3,118,4],[4,122,3],[5,123,2],[6,96,2,4],[7,97,2],[8,98,2],[9,44,4],[10,100,2],[11,109,2,110],[12,41,3]]],
+  [124,1,76,[[1,125,5,4],[2,88,4,10],[3,126,4,4],[4,119,3],[5,120,3],[6,127,2,4],[7,128,2],[8,105,1],[9,41,1]]],
+  [129,1,81,[[1,125,5,4],[2,88,4,10],[3,130,2,4],[4,96,2,4],[5,97,2],[6,98,2],[7,44,4],[8,123,2],[9,100,2],[10,109,2,110],[11,111,2,60],[12,104,2,19],[13,41,3]]],
+  [131,1,132,[[1,133,3,4],[2,134,2,4],[3,135,2,4],[4,136,2,4],[5,137,3,4],[6,130,2,4],[7,128,1],[8,138,3,13],[9,139,2],[10,140,2,13],[11,141,1],[12,142,1],[13,143,2,28],[14,144,2,8],[15,145,4,10],[16,146,3]]],
+  [147,1,148,[[1,133,3,4],[2,134,2,4],[3,135,2,4],[4,136,2,4],[5,137,3,4],[6,149,1],[7,138,2,13],[8,139,1],[9,140,1,13],[10,141,1],[11,150,2,28],[12,144,2,8],[13,151,5,23],[14,145,4,10],[15,146,3],[16,40,1],[17,16,1,17]]],
+  [152,1,148,[[1,133,3,4],[2,134,2,4],[3,135,2,4],[4,136,2,4],[5,137,3,4],[6,128,2],[7,84,1,4],[8,149,1],[9,153,1,4],[10,138,3,13],[11,139,2],[12,140,2,13],[13,141,2],[14,154,4,28],[15,144,2,8],[16,145,4,10],[17,146,2],[18,155,1,19]]],
+  [156,1,148,[[1,133,3,4],[2,134,2,4],[3,135,2,4],[4,136,2,4],[5,137,3,4],[6,130,2,4],[7,128,1],[8,149,1],[9,153,1,4],[10,138,3,13],[11,139,2],[12,140,2,13],[13,141,1],[14,142,1],[15,157,4,28],[16,144,2,8],[17,145,4,10],[18,146,3]]],
+  [158,1,159,[[1,160,3],[2,161,11],[3,109,2,110],[4,162,3,19],[5,47,3,48],[6,163,3,164],[7,165,5]]],
+  [166,1,159,[[1,160,3],[2,161,11],[3,109,2,110],[4,162,3,19],[5,47,3,48],[6,163,3,164],[7,165,5]]],
+  [167,1,159,[[1,160,3],[2,161,11],[3,109,2,110],[4,162,3,19],[5,47,3,48],[6,163,3,164],[7,165,5]]],
+  [168,1,169,[[1,170,4,4],[2,171,4,13],[3,172,5,8],[4,173,2],[5,174,4],[6,175,3,48],[7,176,3,19],[8,177,5],[9,178,5]]],
+  [179,1,169,[[1,170,4,4],[2,171,4,13],[3,172,5,8],[4,173,2],[5,174,4],[6,175,3,48],[7,176,3,19],[8,177,5],[9,178,5]]],
+  [180,1,169,[[1,170,4,4],[2,171,4,13],[3,172,5,8],[4,173,2],[5,174,4],[6,175,3,48],[7,176,3,19],[8,177,5],[9,178,5]]],
+  [181,1,182,[[1,170,4,4],[2,171,4,13],[3,172,5,8],[4,173,2],[5,174,4],[6,175,3,48],[7,176,3,19],[8,177,5],[9,178,5]]],
+  [183,1,182,[[1,170,4,4],[2,171,4,13],[3,172,5,8],[4,173,2],[5,174,4],[6,175,3,48],[7,176,3,19],[8,177,5],[9,178,5]]],
+  [184,1,182,[[1,170,4,4],[2,171,4,13],[3,172,5,8],[4,173,2],[5,174,4],[6,175,3,48],[7,176,3,19],[8,177,5],[9,178,5]]],
+];
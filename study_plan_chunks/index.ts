@@ -0,0 +1,159 @@
+import { Subject } from '../types';
+import { decodeStudyPlans, EncodedPlan } from '../utils/studyPlanCodec';
+
+// مولد تلقائياً بواسطة generate_study_plans.py --split
+// كل مرحلة في وحدة مستقلة، فلا تحمّل إلا خطط المرحلة المطلوبة
+type PlanChunkId = 'kindergarten' | 'elementary' | 'middle' | 'high';
+
+interface EncodedChunk {
+  STRINGS: string[];
+  PLANS: EncodedPlan[];
+}
+
+const CHUNK_LOADERS: Record<PlanChunkId, () => Promise<EncodedChunk>> = {
+  kindergarten: () => import('./kindergarten'),
+  elementary: () => import('./elementary'),
+  middle: () => import('./middle'),
+  high: () => import('./high'),
+};
+
+// كل وحدة تفك مرة واحدة ثم يعاد استخدام النتيجة
+const decodedChunks: Partial<Record<PlanChunkId, Promise<Record<string, Subject[]>>>> = {};
+
+const loadChunk = (chunk: PlanChunkId): Promise<Record<string, Subject[]>> => {
+  if (!decodedChunks[chunk]) {
+    decodedChunks[chunk] = CHUNK_LOADERS[chunk]().then(m => decodeStudyPlans(m.STRINGS, m.PLANS));
+  }
+  return decodedChunks[chunk]!;
+};
+
+export const STUDY_PLAN_CHUNKS: Record<string, PlanChunkId> = {
+  'sp_رياض_أطفال_الحضانة_المستوى_الأول': 'kindergarten',
+  'sp_رياض_أطفال_رياض_أطفال_المستوى_الثاني': 'kindergarten',
+  'sp_الابتدائية_تعليم_عام_الأول': 'elementary',
+  'sp_الابتدائية_تعليم_عام_الثاني': 'elementary',
+  'sp_الابتدائية_تعليم_عام_الثالث': 'elementary',
+  'sp_الابتدائية_تعليم_عام_الرابع': 'elementary',
+  'sp_الابتدائية_تعليم_عام_الخامس': 'elementary',
+  'sp_الابتدائية_تعليم_عام_السادس': 'elementary',
+  'sp_الابتدائية_تحفيظ_القرآن_الأول': 'elementary',
+  'sp_الابتدائية_تحفيظ_القرآن_الثاني': 'elementary',
+  'sp_الابتدائية_تحفيظ_القرآن_الثالث': 'elementary',
+  'sp_الابتدائية_تحفيظ_القرآن_الرابع': 'elementary',
+  'sp_الابتدائية_تحفيظ_القرآن_الخامس': 'elementary',
+  'sp_الابتدائية_تحفيظ_القرآن_السادس': 'elementary',
+  'sp_المتوسطة_تعليم_عام_الأول_المتوسط': 'middle',
+  'sp_المتوسطة_تعليم_عام_الثاني_المتوسط': 'middle',
+  'sp_المتوسطة_تعليم_عام_الثالث_المتوسط': 'middle',
+  'sp_المتوسطة_تحفيظ_القرآن_الأول_المتوسط': 'middle',
+  'sp_المتوسطة_تحفيظ_القرآن_الثاني_المتوسط': 'middle',
+  'sp_المتوسطة_تحفيظ_القرآن_الثالث_المتوسط': 'middle',
+  'sp_الثانوية_مسارات_الفصل_الأول_الأول_الثانوي': 'high',
+  'sp_الثانوية_المشترك_الفصل_الأول_الأول_الثانوي': 'high',
+  'sp_الثانوية_المشترك_الفصل_الثاني_الأول_الثانوي': 'high',
+  'sp_الثانوية_مسار_عام_الفصل_الأول_الثاني_الثانوي': 'high',
+  'sp_الثانوية_مسار_عام_الفصل_الثاني_الثاني_الثانوي': 'high',
+  'sp_الثانوية_مسار_حاسب_وهندسة_الفصل_الأول_الثاني_الثانوي': 'high',
+  'sp_الثانوية_مسار_حاسب_وهندسة_الفصل_الثاني_الثاني_الثانوي': 'high',
+  'sp_الثانوية_مسار_صحة_وحياة_الفصل_الأول_الثاني_الثانوي': 'high',
+  'sp_الثانوية_مسار_صحة_وحياة_الفصل_الثاني_الثاني_الثانوي': 'high',
+  'sp_الثانوية_مسار_إدارة_أعمال_الفصل_الأول_الثاني_الثانوي': 'high',
+  'sp_الثانوية_مسار_إدارة_أعمال_الفصل_الثاني_الثاني_الثانوي': 'high',
+  'sp_الثانوية_مسار_شرعي_الفصل_الأول_الثاني_الثانوي': 'high',
+  'sp_الثانوية_مسار_شرعي_الفصل_الثاني_الثاني_الثانوي': 'high',
+  'sp_الثانوية_مسار_عام_الفصل_الأول_الثالث_الثانوي': 'high',
+  'sp_الثانوية_مسار_عام_الفصل_الثاني_الثالث_الثانوي': 'high',
+  'sp_الثانوية_مسار_حاسب_وهندسة_الفصل_الأول_الثالث_الثانوي': 'high',
+  'sp_الثانوية_مسار_حاسب_وهندسة_الفصل_الثاني_الثالث_الثانوي': 'high',
+  'sp_الثانوية_مسار_صحة_وحياة_الفصل_الأول_الثالث_الثانوي': 'high',
+  'sp_الثانوية_مسار_صحة_وحياة_الفصل_الثاني_الثالث_الثانوي': 'high',
+  'sp_الثانوية_مسار_إدارة_أعمال_الفصل_الأول_الثالث_الثانوي': 'high',
+  'sp_الثانوية_مسار_إدارة_أعمال_الفصل_الثاني_الثالث_الثانوي': 'high',
+  'sp_الثانوية_مسار_شرعي_الفصل_الأول_الثالث_الثانوي': 'high',
+  'sp_الثانوية_مسار_شرعي_الفصل_الثاني_الثالث_الثانوي': 'high',
+  'sp_الابتدائية_تعليم_مستمر_ابتدائية_الأول': 'elementary',
+  'sp_الابتدائية_تعليم_مستمر_ابتدائية_الثاني': 'elementary',
+  'sp_الابتدائية_تعليم_مستمر_ابتدائية_الثالث': 'elementary',
+  'sp_الابتدائية_التعليم_المستمر_ذوي_الإعاقة_الفكرية_البسيطة_الأول': 'elementary',
+  'sp_الابتدائية_التعليم_المستمر_ذوي_الإعاقة_الفكرية_البسيطة_الثاني': 'elementary',
+  'sp_الابتدائية_التعليم_المستمر_ذوي_الإعاقة_الفكرية_البسيطة_الثالث': 'elementary',
+  'sp_الثانوية_المعاهد_العلمية_الثالث_الثانوي': 'high',
+  'sp_المتوسطة_دار_الحديث_المكية_المدنية_الأول_المتوسط': 'middle',
+  'sp_المتوسطة_دار_الحديث_المكية_المدنية_الثاني_المتوسط': 'middle',
+  'sp_المتوسطة_دار_الحديث_المكية_المدنية_الثالث_المتوسط': 'middle',
+  'sp_الثانوية_دار_الحديث_المكية_المدنية_الأول_الثانوي': 'high',
+  'sp_الثانوية_دار_الحديث_المكية_المدنية_الثاني_الثانوي': 'high',
+  'sp_الثانوية_دار_الحديث_المكية_المدنية_الثالث_الثانوي': 'high',
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الأول': 'elementary',
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الثاني': 'elementary',
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الثالث': 'elementary',
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الرابع': 'elementary',
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الخامس': 'elementary',
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_السادس': 'elementary',
+  'sp_المتوسطة_المدارس_الأهلية_(منهج_مغاير)_الأول_المتوسط': 'middle',
+  'sp_المتوسطة_المدارس_الأهلية_(منهج_مغاير)_الثاني_المتوسط': 'middle',
+  'sp_المتوسطة_المدارس_الأهلية_(منهج_مغاير)_الثالث_المتوسط': 'middle',
+  'sp_المتوسطة_المدارس_المطبقة_للغة_الصينية_الأول_المتوسط': 'middle',
+  'sp_المتوسطة_المدارس_المطبقة_للغة_الصينية_الثاني_المتوسط': 'middle',
+  'sp_المتوسطة_المدارس_المطبقة_للغة_الصينية_الثالث_المتوسط': 'middle',
+  'sp_الابتدائية_المدارس_المطبقة_للفنون_أولية_الأول': 'elementary',
+  'sp_الابتدائية_المدارس_المطبقة_للفنون_أولية_الثاني': 'elementary',
+  'sp_الابتدائية_المدارس_المطبقة_للفنون_أولية_الثالث': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الأول': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الثاني': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الثالث': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الرابع': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الخامس': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_السادس': 'elementary',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_طيف_التوحد_الأول_المتوسط': 'middle',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_طيف_التوحد_الثاني_المتوسط': 'middle',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_طيف_التوحد_الثالث_المتوسط': 'middle',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_طيف_التوحد_الأول_الثانوي_التأهيلي': 'high',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_طيف_التوحد_الثاني_الثانوي_التأهيلي': 'high',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_طيف_التوحد_الثالث_الثانوي_التأهيلي': 'high',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الأول': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الثاني': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الثالث': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الرابع': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الخامس': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_السادس': 'elementary',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الفكرية_الأول_المتوسط': 'middle',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الفكرية_الثاني_المتوسط': 'middle',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الفكرية_الثالث_المتوسط': 'middle',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الفكرية_الأول_الثانوي_التأهيلي': 'high',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الفكرية_الثاني_الثانوي_التأهيلي': 'high',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الفكرية_الثالث_الثانوي_التأهيلي': 'high',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الأول': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الثاني': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الثالث': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الرابع': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الخامس': 'elementary',
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_السادس': 'elementary',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الإعاقات_الأول_المتوسط': 'middle',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الإعاقات_الثاني_المتوسط': 'middle',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الإعاقات_الثالث_المتوسط': 'middle',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الإعاقات_الأول_الثانوي_التأهيلي': 'high',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الإعاقات_الثاني_الثانوي_التأهيلي': 'high',
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الإعاقات_الثالث_الثانوي_التأهيلي': 'high',
+  'sp_الابتدائية_الموهوبين_الرابع': 'elementary',
+  'sp_الابتدائية_الموهوبين_الخامس': 'elementary',
+  'sp_الابتدائية_الموهوبين_السادس': 'elementary',
+  'sp_المتوسطة_الموهوبين_الأول_المتوسط': 'middle',
+  'sp_المتوسطة_الموهوبين_الثاني_المتوسط': 'middle',
+  'sp_المتوسطة_الموهوبين_الثالث_المتوسط': 'middle',
+};
+
+export const loadStudyPlan = (key: string): Promise<Subject[]> => {
+  const chunk = STUDY_PLAN_CHUNKS[key];
+  if (!chunk) return Promise.resolve([]);
+  return loadChunk(chunk).then(plans => plans[key] ?? []);
+};
+
+export const loadStudyPlans = async (keys: string[]): Promise<Record<string, Subject[]>> => {
+  const loaded = await Promise.all(keys.map(key => loadStudyPlan(key)));
+  return Object.fromEntries(keys.map((key, i) => [key, loaded[i]]));
+};
+
+// كل الخطط بترتيب study_plans.ts، للصفحات التي تعرض جميع الخطط
+export const loadAllStudyPlans = (): Promise<Record<string, Subject[]>> =>
+  loadStudyPlans(Object.keys(STUDY_PLAN_CHUNKS));
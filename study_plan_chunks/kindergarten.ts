@@ -0,0 +1,25 @@
+import { EncodedPlan } from '../utils/studyPlanCodec';
+
+// مولد تلقائياً من study_plans.ts بواسطة generate_study_plans.py --split
+// جدول نصوص + مصفوفات أرقام، تفك في index.ts (الصيغة موضحة في utils/studyPlanCodec.ts)
+export const STRINGS: string[] = [
+  'sp_رياض_أطفال_الحضانة_المستوى_الأول',
+  'KINDERGARTEN',
+  'الحضانة',
+  'قرآن وإسلامية',
+  '1',
+  'الوطنية والدراسات الاجتماعية',
+  '6',
+  'التطور الاجتماعي والعاطفي',
+  'اللغة والتواصل',
+  'العمليات المعرفية والمعلومات العامة',
+  '4',
+  'الصحة والتطور البدني',
+  'sp_رياض_أطفال_رياض_أطفال_المستوى_الثاني',
+  'رياض أطفال',
+];
+
+export const PLANS: EncodedPlan[] = [
+  [0,1,2,[[1,3,0,4],[2,5,0,6],[3,7,0],[4,8,0],[5,9,0,10],[6,11,0]]],
+  [12,1,13,[[1,3,0,4],[2,5,0,6],[3,7,0],[4,8,0],[5,9,0,10],[6,11,0]]],
+];
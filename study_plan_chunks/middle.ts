@@ -0,0 +1,124 @@
+import { EncodedPlan } from '../utils/studyPlanCodec';
+
+// مولد تلقائياً من study_plans.ts بواسطة generate_study_plans.py --split
+// جدول نصوص + مصفوفات أرقام، تفك في index.ts (الصيغة موضحة في utils/studyPlanCodec.ts)
+export const STRINGS: string[] = [
+  'sp_المتوسطة_تعليم_عام_الأول_المتوسط',
+  'MIDDLE',
+  'تعليم عام',
+  'قرآن وإسلامية',
+  '1',
+  'اللغة العربية',
+  '2',
+  'الدراسات الاجتماعية',
+  '6',
+  'الرياضيات',
+  '3',
+  'العلوم',
+  '4',
+  'اللغة الإنجليزية',
+  '5',
+  'المهارات الرقمية',
+  '7',
+  'التربية الفنية',
+  '8',
+  'التربية البدنية',
+  '9',
+  'المهارات الحياتية',
+  '17',
+  'النشاط',
+  'sp_المتوسطة_تعليم_عام_الثاني_المتوسط',
+  'sp_المتوسطة_تعليم_عام_الثالث_المتوسط',
+  'التفكير الناقد',
+  '18',
+  'sp_المتوسطة_تحفيظ_القرآن_الأول_المتوسط',
+  'تحفيظ القرآن',
+  'التجويد',
+  'sp_المتوسطة_تحفيظ_القرآن_الثاني_المتوسط',
+  'sp_المتوسطة_تحفيظ_القرآن_الثالث_المتوسط',
+  'sp_المتوسطة_دار_الحديث_المكية_المدنية_الأول_المتوسط',
+  'دار الحديث المكية / المدنية',
+  'القرآن الكريم',
+  'التفسير',
+  'الحديث',
+  'علوم الحديث',
+  'التوحيد',
+  'الفقه',
+  'النحو والصرف',
+  'المهارات اللغوية',
+  'النصوص الأدبية',
+  'القواعد الكتابية',
+  'sp_المتوسطة_دار_الحديث_المكية_المدنية_الثاني_المتوسط',
+  'sp_المتوسطة_دار_الحديث_المكية_المدنية_الثالث_المتوسط',
+  'sp_المتوسطة_المدارس_الأهلية_(منهج_مغاير)_الأول_المتوسط',
+  'المدارس الأهلية (منهج مغاير)',
+  'الدراسات الإسلامية',
+  'sp_المتوسطة_المدارس_الأهلية_(منهج_مغاير)_الثاني_المتوسط',
+  'sp_المتوسطة_المدارس_الأهلية_(منهج_مغاير)_الثالث_المتوسط',
+  'sp_المتوسطة_المدارس_المطبقة_للغة_الصينية_الأول_المتوسط',
+  'المدارس المطبقة للغة الصينية',
+  'اللغة الصينية',
+  'sp_المتوسطة_المدارس_المطبقة_للغة_الصينية_الثاني_المتوسط',
+  'sp_المتوسطة_المدارس_المطبقة_للغة_الصينية_الثالث_المتوسط',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_طيف_التوحد_الأول_المتوسط',
+  'مدارس ذوي الإعاقة - طيف التوحد',
+  'التواصل',
+  'الأكاديمي',
+  'الفنون',
+  'النشاط والتدريب',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_طيف_التوحد_الثاني_المتوسط',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_طيف_التوحد_الثالث_المتوسط',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الفكرية_الأول_المتوسط',
+  'مدارس ذوي الإعاقة - الفكرية',
+  'لغة عربية',
+  'رياضيات',
+  'علوم',
+  'اجتماعيات',
+  'إنجليزي',
+  'مهارات رقمية',
+  'فنية',
+  'بدنية',
+  'حياتية',
+  'نشاط',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الفكرية_الثاني_المتوسط',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الفكرية_الثالث_المتوسط',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الإعاقات_الأول_المتوسط',
+  'مدارس ذوي الإعاقة - الإعاقات',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الإعاقات_الثاني_المتوسط',
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الإعاقات_الثالث_المتوسط',
+  'sp_المتوسطة_الموهوبين_الأول_المتوسط',
+  'الموهوبين',
+  'الإثراء العام',
+  'sp_المتوسطة_الموهوبين_الثاني_المتوسط',
+  'sp_المتوسطة_الموهوبين_الثالث_المتوسط',
+];
+
+export const PLANS: EncodedPlan[] = [
+  [0,1,2,[[1,3,5,4],[2,5,5,6],[3,7,3,8],[4,9,6,10],[5,11,4,12],[6,13,4,14],[7,15,2,16],[8,17,2,18],[9,19,2,20],[10,21,1,22],[11,23,1]]],
+  [24,1,2,[[1,3,5,4],[2,5,5,6],[3,7,3,8],[4,9,6,10],[5,11,4,12],[6,13,4,14],[7,15,2,16],[8,17,2,18],[9,19,2,20],[10,21,1,22],[11,23,1]]],
+  [25,1,2,[[1,3,5,4],[2,5,4,6],[3,7,2,8],[4,9,6,10],[5,11,4,12],[6,13,4,14],[7,15,2,16],[8,17,2,18],[9,19,2,20],[10,21,1,22],[11,23,1],[12,26,2,27]]],
+  [28,1,29,[[1,3,8,4],[2,30,1,4],[3,5,5,6],[4,7,2,8],[5,9,6,10],[6,11,4,12],[7,13,4,14],[8,15,2,16],[9,17,1,18],[10,19,1,20],[11,21,1,22]]],
+  [31,1,29,[[1,3,8,4],[2,30,1,4],[3,5,5,6],[4,7,2,8],[5,9,6,10],[6,11,4,12],[7,13,4,14],[8,15,2,16],[9,17,1,18],[10,19,1,20],[11,21,1,22]]],
+  [32,1,29,[[1,3,7,4],[2,30,1,4],[3,5,4,6],[4,7,2,8],[5,9,6,10],[6,11,4,12],[7,13,4,14],[8,15,2,16],[9,17,1,18],[10,19,1,20],[11,21,1,22],[12,26,2,27]]],
+  [33,1,34,[[1,35,3,4],[2,36,2,4],[3,37,2,4],[4,38,1,4],[5,39,2,4],[6,40,3,4],[7,41,3,6],[8,42,1],[9,43,1],[10,44,2],[11,7,2,8],[12,9,4,10],[13,11,3,12],[14,13,3,14],[15,15,1,16],[16,21,1,22],[17,19,1,20]]],
+  [45,1,34,[[1,35,3,4],[2,36,2,4],[3,37,2,4],[4,38,1,4],[5,39,2,4],[6,40,3,4],[7,41,3,6],[8,42,1],[9,43,1],[10,44,2],[11,7,2,8],[12,9,4,10],[13,11,3,12],[14,13,3,14],[15,15,1,16],[16,21,1,22],[17,19,1,20]]],
+  [46,1,34,[[1,35,3,4],[2,36,2,4],[3,37,2,4],[4,38,1,4],[5,39,2,4],[6,40,2,4],[7,41,3,6],[8,42,1],[9,43,1],[10,44,2],[11,7,1,8],[12,9,4,10],[13,11,3,12],[14,13,3,14],[15,15,1,16],[16,21,1,22],[17,19,1,20],[18,26,2,27]]],
+  [47,1,48,[[1,49,5,4],[2,5,4,6],[3,7,2,8]]],
+  [50,1,48,[[1,49,5,4],[2,5,4,6],[3,7,2,8]]],
+  [51,1,48,[[1,49,5,4],[2,5,3,6],[3,7,2,8]]],
+  [52,1,53,[[1,3,5,4],[2,5,5,6],[3,7,2,8],[4,9,6,10],[5,11,4,12],[6,13,3,14],[7,54,3,14],[8,15,2,16],[9,17,2,18],[10,19,2,20],[11,21,1,22]]],
+  [55,1,53,[[1,3,5,4],[2,5,5,6],[3,7,2,8],[4,9,6,10],[5,11,4,12],[6,13,3,14],[7,54,3,14],[8,15,2,16],[9,17,2,18],[10,19,2,20],[11,21,1,22]]],
+  [56,1,53,[[1,3,5,4],[2,5,4,6],[3,7,2,8],[4,9,6,10],[5,11,4,12],[6,13,4,14],[7,54,2,14],[8,15,2,16],[9,17,2,18],[10,19,2,20],[11,21,1,22],[12,26,2,27],[13,23,1]]],
+  [57,1,58,[[1,59,5],[2,60,14],[3,21,4,22],[4,19,3,20],[5,61,3,18],[6,15,2,16],[7,62,4]]],
+  [63,1,58,[[1,59,5],[2,60,14],[3,21,4,22],[4,19,3,20],[5,61,3,18],[6,15,2,16],[7,62,4]]],
+  [64,1,58,[[1,59,5],[2,60,14],[3,21,4,22],[4,19,3,20],[5,61,3,18],[6,15,2,16],[7,62,4]]],
+  [65,1,66,[[1,3,4,4],[2,67,4,6],[3,68,4,10],[4,69,4,12],[5,70,1,8],[6,71,1],[7,72,2],[8,73,3,18],[9,74,3,20],[10,75,4],[11,76,5]]],
+  [77,1,66,[[1,3,4,4],[2,67,4,6],[3,68,4,10],[4,69,4,12],[5,70,1,8],[6,71,1],[7,72,2],[8,73,3,18],[9,74,3,20],[10,75,4],[11,76,5]]],
+  [78,1,66,[[1,3,4,4],[2,67,4,6],[3,68,4,10],[4,69,4,12],[5,70,1,8],[6,71,1],[7,72,2],[8,73,3,18],[9,74,3,20],[10,75,4],[11,76,5]]],
+  [79,1,80,[[1,3,4,4],[2,67,4,6],[3,68,4,10],[4,69,4,12],[5,70,1,8],[6,71,1],[7,72,2],[8,73,3,18],[9,74,3,20],[10,75,4],[11,76,5]]],
+  [81,1,80,[[1,3,4,4],[2,67,4,6],[3,68,4,10],[4,69,4,12],[5,70,1,8],[6,71,1],[7,72,2],[8,73,3,18],[9,74,3,20],[10,75,4],[11,76,5]]],
+  [82,1,80,[[1,3,4,4],[2,67,4,6],[3,68,4,10],[4,69,4,12],[5,70,1,8],[6,71,1],[7,72,2],[8,73,3,18],[9,74,3,20],[10,75,4],[11,76,5]]],
+  [83,1,84,[[1,9,1,10],[2,11,1,12],[3,13,1,14],[4,15,1,16],[5,85,2]]],
+  [86,1,84,[[1,9,1,10],[2,11,1,12],[3,13,1,14],[4,15,1,16],[5,85,2]]],
+  [87,1,84,[[1,9,1,10],[2,11,1,12],[3,13,1,14],[4,15,1,16],[5,85,2]]],
+];
@@ -0,0 +1,130 @@
+// مولد تلقائياً من study_plans.ts بواسطة generate_study_plans.py --stats
+// لكل خطة: مجموع الحصص الأسبوعية، وأكبر حد يومي، ولكل مادة (بلاحقة معرّفها بعد مفتاح الخطة):
+// [periodsPerClass, أيام الحصة الواحدة, أيام الحصتين, الحد اليومي]
+// يقرؤه calculateQuotaDistribution و getMaxDailyPeriodsForSubject (utils/scheduleConstraints.ts)
+
+export interface StudyPlanStats {
+  totalPeriods: number;
+  maxDaily: number;
+  subjects: Record<string, [number, number, number, number]>;
+  overCapacity?: true;   // المجموع أكبر من periodsPerDay × weekDays
+}
+
+export const PLAN_STATS_WEEK_DAYS = 5;
+export const PLAN_STATS_PERIODS_PER_DAY = 7;
+
+export const STUDY_PLAN_STATS: Record<string, StudyPlanStats> = {
+  'sp_رياض_أطفال_الحضانة_المستوى_الأول': { totalPeriods: 0, maxDaily: 1, subjects: {"1":[0,0,0,1],"2":[0,0,0,1],"3":[0,0,0,1],"4":[0,0,0,1],"5":[0,0,0,1],"6":[0,0,0,1]} },
+  'sp_رياض_أطفال_رياض_أطفال_المستوى_الثاني': { totalPeriods: 0, maxDaily: 1, subjects: {"1":[0,0,0,1],"2":[0,0,0,1],"3":[0,0,0,1],"4":[0,0,0,1],"5":[0,0,0,1],"6":[0,0,0,1]} },
+  'sp_الابتدائية_تعليم_عام_الأول': { totalPeriods: 33, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[8,2,3,2],"3":[5,5,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[3,3,0,1],"8":[1,1,0,1],"9":[3,3,0,1]} },
+  'sp_الابتدائية_تعليم_عام_الثاني': { totalPeriods: 33, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[7,3,2,2],"3":[6,4,1,2],"4":[3,3,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[3,3,0,1],"8":[1,1,0,1],"9":[3,3,0,1]} },
+  'sp_الابتدائية_تعليم_عام_الثالث': { totalPeriods: 33, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[6,4,1,2],"3":[6,4,1,2],"4":[4,4,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[3,3,0,1],"8":[1,1,0,1],"9":[3,3,0,1]} },
+  'sp_الابتدائية_تعليم_عام_الرابع': { totalPeriods: 33, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[6,4,1,2],"4":[2,2,0,1],"5":[4,4,0,1],"6":[3,3,0,1],"7":[2,2,0,1],"8":[1,1,0,1],"9":[2,2,0,1],"10":[1,1,0,1],"11":[2,2,0,1]} },
+  'sp_الابتدائية_تعليم_عام_الخامس': { totalPeriods: 33, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[6,4,1,2],"4":[2,2,0,1],"5":[4,4,0,1],"6":[3,3,0,1],"7":[2,2,0,1],"8":[1,1,0,1],"9":[2,2,0,1],"10":[1,1,0,1],"11":[2,2,0,1]} },
+  'sp_الابتدائية_تعليم_عام_السادس': { totalPeriods: 33, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[6,4,1,2],"4":[2,2,0,1],"5":[4,4,0,1],"6":[3,3,0,1],"7":[2,2,0,1],"8":[1,1,0,1],"9":[2,2,0,1],"10":[1,1,0,1],"11":[2,2,0,1]} },
+  'sp_الابتدائية_تحفيظ_القرآن_الأول': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[9,1,4,2],"2":[8,2,3,2],"3":[5,5,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[3,3,0,1],"8":[1,1,0,1],"9":[1,1,0,1]} },
+  'sp_الابتدائية_تحفيظ_القرآن_الثاني': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[9,1,4,2],"2":[7,3,2,2],"3":[6,4,1,2],"4":[3,3,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[3,3,0,1],"8":[1,1,0,1],"9":[1,1,0,1]} },
+  'sp_الابتدائية_تحفيظ_القرآن_الثالث': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[9,1,4,2],"2":[6,4,1,2],"3":[6,4,1,2],"4":[4,4,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[3,3,0,1],"8":[1,1,0,1],"9":[1,1,0,1]} },
+  'sp_الابتدائية_تحفيظ_القرآن_الرابع': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[8,2,3,2],"2":[5,5,0,1],"3":[6,4,1,2],"4":[2,2,0,1],"5":[4,4,0,1],"6":[3,3,0,1],"7":[2,2,0,1],"8":[1,1,0,1],"9":[2,2,0,1],"10":[1,1,0,1],"11":[1,1,0,1]} },
+  'sp_الابتدائية_تحفيظ_القرآن_الخامس': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[8,2,3,2],"2":[5,5,0,1],"3":[6,4,1,2],"4":[2,2,0,1],"5":[4,4,0,1],"6":[3,3,0,1],"7":[2,2,0,1],"8":[1,1,0,1],"9":[2,2,0,1],"10":[1,1,0,1],"11":[1,1,0,1]} },
+  'sp_الابتدائية_تحفيظ_القرآن_السادس': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[8,2,3,2],"2":[5,5,0,1],"3":[6,4,1,2],"4":[2,2,0,1],"5":[4,4,0,1],"6":[3,3,0,1],"7":[2,2,0,1],"8":[1,1,0,1],"9":[2,2,0,1],"10":[1,1,0,1],"11":[1,1,0,1]} },
+  'sp_المتوسطة_تعليم_عام_الأول_المتوسط': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[3,3,0,1],"4":[6,4,1,2],"5":[4,4,0,1],"6":[4,4,0,1],"7":[2,2,0,1],"8":[2,2,0,1],"9":[2,2,0,1],"10":[1,1,0,1],"11":[1,1,0,1]} },
+  'sp_المتوسطة_تعليم_عام_الثاني_المتوسط': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[3,3,0,1],"4":[6,4,1,2],"5":[4,4,0,1],"6":[4,4,0,1],"7":[2,2,0,1],"8":[2,2,0,1],"9":[2,2,0,1],"10":[1,1,0,1],"11":[1,1,0,1]} },
+  'sp_المتوسطة_تعليم_عام_الثالث_المتوسط': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[4,4,0,1],"3":[2,2,0,1],"4":[6,4,1,2],"5":[4,4,0,1],"6":[4,4,0,1],"7":[2,2,0,1],"8":[2,2,0,1],"9":[2,2,0,1],"10":[1,1,0,1],"11":[1,1,0,1],"12":[2,2,0,1]} },
+  'sp_المتوسطة_تحفيظ_القرآن_الأول_المتوسط': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[8,2,3,2],"2":[1,1,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[6,4,1,2],"6":[4,4,0,1],"7":[4,4,0,1],"8":[2,2,0,1],"9":[1,1,0,1],"10":[1,1,0,1],"11":[1,1,0,1]} },
+  'sp_المتوسطة_تحفيظ_القرآن_الثاني_المتوسط': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[8,2,3,2],"2":[1,1,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[6,4,1,2],"6":[4,4,0,1],"7":[4,4,0,1],"8":[2,2,0,1],"9":[1,1,0,1],"10":[1,1,0,1],"11":[1,1,0,1]} },
+  'sp_المتوسطة_تحفيظ_القرآن_الثالث_المتوسط': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[7,3,2,2],"2":[1,1,0,1],"3":[4,4,0,1],"4":[2,2,0,1],"5":[6,4,1,2],"6":[4,4,0,1],"7":[4,4,0,1],"8":[2,2,0,1],"9":[1,1,0,1],"10":[1,1,0,1],"11":[1,1,0,1],"12":[2,2,0,1]} },
+  'sp_الثانوية_مسارات_الفصل_الأول_الأول_الثانوي': { totalPeriods: 4, maxDaily: 1, subjects: {"1":[4,4,0,1]} },
+  'sp_الثانوية_المشترك_الفصل_الأول_الأول_الثانوي': { totalPeriods: 29, maxDaily: 1, subjects: {"0":[4,4,0,1],"1":[5,5,0,1],"2":[5,5,0,1],"3":[3,3,0,1],"4":[4,4,0,1],"5":[3,3,0,1],"6":[3,3,0,1],"7":[2,2,0,1]} },
+  'sp_الثانوية_المشترك_الفصل_الثاني_الأول_الثانوي': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[3,3,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[3,3,0,1],"7":[2,2,0,1],"8":[2,2,0,1],"9":[2,2,0,1],"10":[3,3,0,1],"11":[2,2,0,1],"12":[2,2,0,1]} },
+  'sp_الثانوية_مسار_عام_الفصل_الأول_الثاني_الثانوي': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[4,4,0,1],"4":[5,5,0,1],"5":[4,4,0,1],"6":[4,4,0,1],"7":[3,3,0,1],"8":[3,3,0,1],"9":[2,2,0,1]} },
+  'sp_الثانوية_مسار_عام_الفصل_الثاني_الثاني_الثانوي': { totalPeriods: 34, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[5,5,0,1],"4":[4,4,0,1],"5":[4,4,0,1],"6":[2,2,0,1],"7":[2,2,0,1],"8":[2,2,0,1],"9":[3,3,0,1],"10":[2,2,0,1]} },
+  'sp_الثانوية_مسار_حاسب_وهندسة_الفصل_الأول_الثاني_الثانوي': { totalPeriods: 29, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[4,4,0,1],"4":[4,4,0,1],"5":[4,4,0,1],"6":[2,2,0,1],"7":[3,3,0,1],"8":[2,2,0,1]} },
+  'sp_الثانوية_مسار_حاسب_وهندسة_الفصل_الثاني_الثاني_الثانوي': { totalPeriods: 30, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[3,3,0,1],"4":[4,4,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[3,3,0,1],"8":[3,3,0,1],"9":[2,2,0,1]} },
+  'sp_الثانوية_مسار_صحة_وحياة_الفصل_الأول_الثاني_الثانوي': { totalPeriods: 32, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[5,5,0,1],"4":[4,4,0,1],"5":[4,4,0,1],"6":[4,4,0,1],"7":[3,3,0,1],"8":[2,2,0,1]} },
+  'sp_الثانوية_مسار_صحة_وحياة_الفصل_الثاني_الثاني_الثانوي': { totalPeriods: 26, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[4,4,0,1],"4":[3,3,0,1],"5":[2,2,0,1],"6":[2,2,0,1],"7":[3,3,0,1],"8":[2,2,0,1]} },
+  'sp_الثانوية_مسار_إدارة_أعمال_الفصل_الأول_الثاني_الثانوي': { totalPeriods: 31, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[4,4,0,1],"4":[4,4,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[2,2,0,1],"8":[3,3,0,1],"9":[3,3,0,1]} },
+  'sp_الثانوية_مسار_إدارة_أعمال_الفصل_الثاني_الثاني_الثانوي': { totalPeriods: 31, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[4,4,0,1],"3":[3,3,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[3,3,0,1],"8":[2,2,0,1],"9":[3,3,0,1],"10":[3,3,0,1]} },
+  'sp_الثانوية_مسار_شرعي_الفصل_الأول_الثاني_الثانوي': { totalPeriods: 31, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[4,4,0,1],"4":[4,4,0,1],"5":[2,2,0,1],"6":[2,2,0,1],"7":[3,3,0,1],"8":[3,3,0,1],"9":[3,3,0,1]} },
+  'sp_الثانوية_مسار_شرعي_الفصل_الثاني_الثاني_الثانوي': { totalPeriods: 31, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[4,4,0,1],"4":[3,3,0,1],"5":[2,2,0,1],"6":[2,2,0,1],"7":[2,2,0,1],"8":[2,2,0,1],"9":[3,3,0,1],"10":[3,3,0,1]} },
+  'sp_الثانوية_مسار_عام_الفصل_الأول_الثالث_الثانوي': { totalPeriods: 31, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[5,5,0,1],"4":[5,5,0,1],"5":[4,4,0,1],"6":[3,3,0,1],"7":[5,5,0,1],"8":[1,1,0,1]} },
+  'sp_الثانوية_مسار_عام_الفصل_الثاني_الثالث_الثانوي': { totalPeriods: 37, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[5,5,0,1],"4":[3,3,0,1],"5":[4,4,0,1],"6":[3,3,0,1],"7":[2,2,0,1],"8":[2,2,0,1],"9":[2,2,0,1],"10":[2,2,0,1],"11":[2,2,0,1],"12":[2,2,0,1],"13":[2,2,0,1]}, overCapacity: true },
+  'sp_الثانوية_مسار_حاسب_وهندسة_الفصل_الأول_الثالث_الثانوي': { totalPeriods: 30, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[5,5,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[3,3,0,1],"8":[3,3,0,1],"9":[2,2,0,1],"10":[1,1,0,1]} },
+  'sp_الثانوية_مسار_حاسب_وهندسة_الفصل_الثاني_الثالث_الثانوي': { totalPeriods: 21, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[2,2,0,1],"4":[3,3,0,1],"5":[2,2,0,1],"6":[2,2,0,1],"7":[2,2,0,1],"8":[2,2,0,1]} },
+  'sp_الثانوية_مسار_صحة_وحياة_الفصل_الأول_الثالث_الثانوي': { totalPeriods: 28, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[5,5,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[3,3,0,1],"8":[2,2,0,1],"9":[2,2,0,1]} },
+  'sp_الثانوية_مسار_صحة_وحياة_الفصل_الثاني_الثالث_الثانوي': { totalPeriods: 21, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[3,3,0,1],"4":[3,3,0,1],"5":[2,2,0,1],"6":[2,2,0,1],"7":[2,2,0,1],"8":[1,1,0,1]} },
+  'sp_الثانوية_مسار_إدارة_أعمال_الفصل_الأول_الثالث_الثانوي': { totalPeriods: 26, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[3,3,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[2,2,0,1],"8":[2,2,0,1],"9":[2,2,0,1],"10":[1,1,0,1]} },
+  'sp_الثانوية_مسار_إدارة_أعمال_الفصل_الثاني_الثالث_الثانوي': { totalPeriods: 33, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[3,3,0,1],"3":[4,4,0,1],"4":[3,3,0,1],"5":[2,2,0,1],"6":[2,2,0,1],"7":[2,2,0,1],"8":[2,2,0,1],"9":[4,4,0,1],"10":[2,2,0,1],"11":[2,2,0,1],"12":[3,3,0,1]} },
+  'sp_الثانوية_مسار_شرعي_الفصل_الأول_الثالث_الثانوي': { totalPeriods: 25, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[4,4,0,1],"3":[4,4,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[2,2,0,1],"8":[1,1,0,1],"9":[1,1,0,1]} },
+  'sp_الثانوية_مسار_شرعي_الفصل_الثاني_الثالث_الثانوي': { totalPeriods: 34, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[4,4,0,1],"3":[2,2,0,1],"4":[2,2,0,1],"5":[2,2,0,1],"6":[2,2,0,1],"7":[4,4,0,1],"8":[2,2,0,1],"9":[2,2,0,1],"10":[2,2,0,1],"11":[2,2,0,1],"12":[2,2,0,1],"13":[3,3,0,1]} },
+  'sp_الابتدائية_تعليم_مستمر_ابتدائية_الأول': { totalPeriods: 18, maxDaily: 2, subjects: {"1":[4,4,0,1],"2":[9,1,4,2],"3":[2,2,0,1],"4":[1,1,0,1],"5":[1,1,0,1],"6":[1,1,0,1]} },
+  'sp_الابتدائية_تعليم_مستمر_ابتدائية_الثاني': { totalPeriods: 19, maxDaily: 2, subjects: {"1":[4,4,0,1],"2":[6,4,1,2],"3":[1,1,0,1],"4":[2,2,0,1],"5":[1,1,0,1],"6":[2,2,0,1],"7":[1,1,0,1],"8":[1,1,0,1],"9":[1,1,0,1]} },
+  'sp_الابتدائية_تعليم_مستمر_ابتدائية_الثالث': { totalPeriods: 20, maxDaily: 2, subjects: {"1":[4,4,0,1],"2":[6,4,1,2],"3":[1,1,0,1],"4":[2,2,0,1],"5":[1,1,0,1],"6":[2,2,0,1],"7":[1,1,0,1],"8":[1,1,0,1],"9":[1,1,0,1],"10":[1,1,0,1]} },
+  'sp_الابتدائية_التعليم_المستمر_ذوي_الإعاقة_الفكرية_البسيطة_الأول': { totalPeriods: 18, maxDaily: 2, subjects: {"1":[4,4,0,1],"2":[8,2,3,2],"3":[2,2,0,1],"4":[1,1,0,1],"5":[1,1,0,1],"6":[1,1,0,1],"7":[1,1,0,1]} },
+  'sp_الابتدائية_التعليم_المستمر_ذوي_الإعاقة_الفكرية_البسيطة_الثاني': { totalPeriods: 19, maxDaily: 2, subjects: {"1":[4,4,0,1],"2":[6,4,1,2],"3":[1,1,0,1],"4":[2,2,0,1],"5":[1,1,0,1],"6":[1,1,0,1],"7":[1,1,0,1],"8":[1,1,0,1],"9":[2,2,0,1]} },
+  'sp_الابتدائية_التعليم_المستمر_ذوي_الإعاقة_الفكرية_البسيطة_الثالث': { totalPeriods: 20, maxDaily: 2, subjects: {"1":[4,4,0,1],"2":[6,4,1,2],"3":[1,1,0,1],"4":[2,2,0,1],"5":[2,2,0,1],"6":[1,1,0,1],"7":[1,1,0,1],"8":[1,1,0,1],"9":[2,2,0,1]} },
+  'sp_الثانوية_المعاهد_العلمية_الثالث_الثانوي': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[3,3,0,1],"2":[2,2,0,1],"3":[2,2,0,1],"4":[2,2,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[1,1,0,1],"8":[3,3,0,1],"9":[2,2,0,1],"10":[2,2,0,1],"11":[1,1,0,1],"12":[1,1,0,1],"13":[2,2,0,1],"14":[2,2,0,1],"15":[4,4,0,1],"16":[3,3,0,1]} },
+  'sp_المتوسطة_دار_الحديث_المكية_المدنية_الأول_المتوسط': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[3,3,0,1],"2":[2,2,0,1],"3":[2,2,0,1],"4":[1,1,0,1],"5":[2,2,0,1],"6":[3,3,0,1],"7":[3,3,0,1],"8":[1,1,0,1],"9":[1,1,0,1],"10":[2,2,0,1],"11":[2,2,0,1],"12":[4,4,0,1],"13":[3,3,0,1],"14":[3,3,0,1],"15":[1,1,0,1],"16":[1,1,0,1],"17":[1,1,0,1]} },
+  'sp_المتوسطة_دار_الحديث_المكية_المدنية_الثاني_المتوسط': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[3,3,0,1],"2":[2,2,0,1],"3":[2,2,0,1],"4":[1,1,0,1],"5":[2,2,0,1],"6":[3,3,0,1],"7":[3,3,0,1],"8":[1,1,0,1],"9":[1,1,0,1],"10":[2,2,0,1],"11":[2,2,0,1],"12":[4,4,0,1],"13":[3,3,0,1],"14":[3,3,0,1],"15":[1,1,0,1],"16":[1,1,0,1],"17":[1,1,0,1]} },
+  'sp_المتوسطة_دار_الحديث_المكية_المدنية_الثالث_المتوسط': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[3,3,0,1],"2":[2,2,0,1],"3":[2,2,0,1],"4":[1,1,0,1],"5":[2,2,0,1],"6":[2,2,0,1],"7":[3,3,0,1],"8":[1,1,0,1],"9":[1,1,0,1],"10":[2,2,0,1],"11":[1,1,0,1],"12":[4,4,0,1],"13":[3,3,0,1],"14":[3,3,0,1],"15":[1,1,0,1],"16":[1,1,0,1],"17":[1,1,0,1],"18":[2,2,0,1]} },
+  'sp_الثانوية_دار_الحديث_المكية_المدنية_الأول_الثانوي': { totalPeriods: 36, maxDaily: 1, subjects: {"1":[3,3,0,1],"2":[2,2,0,1],"3":[2,2,0,1],"4":[2,2,0,1],"5":[3,3,0,1],"6":[1,1,0,1],"7":[2,2,0,1],"8":[1,1,0,1],"9":[1,1,0,1],"10":[1,1,0,1],"11":[2,2,0,1],"12":[2,2,0,1],"13":[5,5,0,1],"14":[4,4,0,1],"15":[3,3,0,1],"16":[1,1,0,1],"17":[1,1,0,1]}, overCapacity: true },
+  'sp_الثانوية_دار_الحديث_المكية_المدنية_الثاني_الثانوي': { totalPeriods: 39, maxDaily: 1, subjects: {"1":[3,3,0,1],"2":[2,2,0,1],"3":[2,2,0,1],"4":[2,2,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[1,1,0,1],"8":[1,1,0,1],"9":[1,1,0,1],"10":[3,3,0,1],"11":[2,2,0,1],"12":[2,2,0,1],"13":[2,2,0,1],"14":[4,4,0,1],"15":[2,2,0,1],"16":[4,4,0,1],"17":[2,2,0,1],"18":[1,1,0,1]}, overCapacity: true },
+  'sp_الثانوية_دار_الحديث_المكية_المدنية_الثالث_الثانوي': { totalPeriods: 39, maxDaily: 1, subjects: {"1":[3,3,0,1],"2":[2,2,0,1],"3":[2,2,0,1],"4":[2,2,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[1,1,0,1],"8":[1,1,0,1],"9":[1,1,0,1],"10":[3,3,0,1],"11":[2,2,0,1],"12":[2,2,0,1],"13":[1,1,0,1],"14":[1,1,0,1],"15":[4,4,0,1],"16":[2,2,0,1],"17":[4,4,0,1],"18":[3,3,0,1]}, overCapacity: true },
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الأول': { totalPeriods: 11, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[6,4,1,2]} },
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الثاني': { totalPeriods: 11, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[6,4,1,2]} },
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الثالث': { totalPeriods: 11, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[4,4,0,1],"3":[2,2,0,1]} },
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الرابع': { totalPeriods: 13, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[6,4,1,2],"3":[2,2,0,1]} },
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_الخامس': { totalPeriods: 11, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[4,4,0,1],"3":[2,2,0,1]} },
+  'sp_الابتدائية_المدارس_الأهلية_(منهج_مغاير)_السادس': { totalPeriods: 11, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[4,4,0,1],"3":[2,2,0,1]} },
+  'sp_المتوسطة_المدارس_الأهلية_(منهج_مغاير)_الأول_المتوسط': { totalPeriods: 11, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[4,4,0,1],"3":[2,2,0,1]} },
+  'sp_المتوسطة_المدارس_الأهلية_(منهج_مغاير)_الثاني_المتوسط': { totalPeriods: 11, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[4,4,0,1],"3":[2,2,0,1]} },
+  'sp_المتوسطة_المدارس_الأهلية_(منهج_مغاير)_الثالث_المتوسط': { totalPeriods: 10, maxDaily: 1, subjects: {"1":[5,5,0,1],"2":[3,3,0,1],"3":[2,2,0,1]} },
+  'sp_المتوسطة_المدارس_المطبقة_للغة_الصينية_الأول_المتوسط': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[2,2,0,1],"4":[6,4,1,2],"5":[4,4,0,1],"6":[3,3,0,1],"7":[3,3,0,1],"8":[2,2,0,1],"9":[2,2,0,1],"10":[2,2,0,1],"11":[1,1,0,1]} },
+  'sp_المتوسطة_المدارس_المطبقة_للغة_الصينية_الثاني_المتوسط': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[5,5,0,1],"3":[2,2,0,1],"4":[6,4,1,2],"5":[4,4,0,1],"6":[3,3,0,1],"7":[3,3,0,1],"8":[2,2,0,1],"9":[2,2,0,1],"10":[2,2,0,1],"11":[1,1,0,1]} },
+  'sp_المتوسطة_المدارس_المطبقة_للغة_الصينية_الثالث_المتوسط': { totalPeriods: 37, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[4,4,0,1],"3":[2,2,0,1],"4":[6,4,1,2],"5":[4,4,0,1],"6":[4,4,0,1],"7":[2,2,0,1],"8":[2,2,0,1],"9":[2,2,0,1],"10":[2,2,0,1],"11":[1,1,0,1],"12":[2,2,0,1],"13":[1,1,0,1]}, overCapacity: true },
+  'sp_الابتدائية_المدارس_المطبقة_للفنون_أولية_الأول': { totalPeriods: 34, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[8,2,3,2],"3":[5,5,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[1,1,0,1],"7":[1,1,0,1],"8":[1,1,0,1],"9":[3,3,0,1],"10":[1,1,0,1],"11":[3,3,0,1]} },
+  'sp_الابتدائية_المدارس_المطبقة_للفنون_أولية_الثاني': { totalPeriods: 34, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[7,3,2,2],"3":[6,4,1,2],"4":[3,3,0,1],"5":[3,3,0,1],"6":[1,1,0,1],"7":[1,1,0,1],"8":[1,1,0,1],"9":[3,3,0,1],"10":[1,1,0,1],"11":[3,3,0,1]} },
+  'sp_الابتدائية_المدارس_المطبقة_للفنون_أولية_الثالث': { totalPeriods: 34, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[6,4,1,2],"3":[6,4,1,2],"4":[4,4,0,1],"5":[3,3,0,1],"6":[1,1,0,1],"7":[1,1,0,1],"8":[1,1,0,1],"9":[3,3,0,1],"10":[1,1,0,1],"11":[3,3,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الأول': { totalPeriods: 30, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[12,0,7,2],"3":[4,4,0,1],"4":[4,4,0,1],"5":[3,3,0,1],"6":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الثاني': { totalPeriods: 30, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[12,0,7,2],"3":[4,4,0,1],"4":[4,4,0,1],"5":[3,3,0,1],"6":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الثالث': { totalPeriods: 30, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[12,0,7,2],"3":[4,4,0,1],"4":[4,4,0,1],"5":[3,3,0,1],"6":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الرابع': { totalPeriods: 30, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[14,0,9,2],"3":[3,3,0,1],"4":[2,2,0,1],"5":[3,3,0,1],"6":[1,1,0,1],"7":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_الخامس': { totalPeriods: 30, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[14,0,9,2],"3":[3,3,0,1],"4":[2,2,0,1],"5":[3,3,0,1],"6":[1,1,0,1],"7":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_طيف_التوحد_السادس': { totalPeriods: 30, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[14,0,9,2],"3":[3,3,0,1],"4":[2,2,0,1],"5":[3,3,0,1],"6":[1,1,0,1],"7":[2,2,0,1]} },
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_طيف_التوحد_الأول_المتوسط': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[14,0,9,2],"3":[4,4,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[4,4,0,1]} },
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_طيف_التوحد_الثاني_المتوسط': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[14,0,9,2],"3":[4,4,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[4,4,0,1]} },
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_طيف_التوحد_الثالث_المتوسط': { totalPeriods: 35, maxDaily: 2, subjects: {"1":[5,5,0,1],"2":[14,0,9,2],"3":[4,4,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[2,2,0,1],"7":[4,4,0,1]} },
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_طيف_التوحد_الأول_الثانوي_التأهيلي': { totalPeriods: 30, maxDaily: 2, subjects: {"1":[3,3,0,1],"2":[11,0,6,2],"3":[2,2,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[3,3,0,1],"7":[5,5,0,1]} },
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_طيف_التوحد_الثاني_الثانوي_التأهيلي': { totalPeriods: 30, maxDaily: 2, subjects: {"1":[3,3,0,1],"2":[11,0,6,2],"3":[2,2,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[3,3,0,1],"7":[5,5,0,1]} },
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_طيف_التوحد_الثالث_الثانوي_التأهيلي': { totalPeriods: 30, maxDaily: 2, subjects: {"1":[3,3,0,1],"2":[11,0,6,2],"3":[2,2,0,1],"4":[3,3,0,1],"5":[3,3,0,1],"6":[3,3,0,1],"7":[5,5,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الأول': { totalPeriods: 30, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[5,5,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[1,1,0,1],"6":[3,3,0,1],"7":[4,4,0,1],"8":[4,4,0,1],"9":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الثاني': { totalPeriods: 30, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[5,5,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[1,1,0,1],"6":[3,3,0,1],"7":[4,4,0,1],"8":[4,4,0,1],"9":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الثالث': { totalPeriods: 30, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[5,5,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[1,1,0,1],"6":[3,3,0,1],"7":[4,4,0,1],"8":[4,4,0,1],"9":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الرابع': { totalPeriods: 30, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[5,5,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[2,2,0,1],"6":[1,1,0,1],"7":[1,1,0,1],"8":[3,3,0,1],"9":[2,2,0,1],"10":[3,3,0,1],"11":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_الخامس': { totalPeriods: 30, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[5,5,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[2,2,0,1],"6":[1,1,0,1],"7":[1,1,0,1],"8":[3,3,0,1],"9":[2,2,0,1],"10":[3,3,0,1],"11":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الفكرية_السادس': { totalPeriods: 30, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[5,5,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[2,2,0,1],"6":[1,1,0,1],"7":[1,1,0,1],"8":[3,3,0,1],"9":[2,2,0,1],"10":[3,3,0,1],"11":[2,2,0,1]} },
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الفكرية_الأول_المتوسط': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[4,4,0,1],"4":[4,4,0,1],"5":[1,1,0,1],"6":[1,1,0,1],"7":[2,2,0,1],"8":[3,3,0,1],"9":[3,3,0,1],"10":[4,4,0,1],"11":[5,5,0,1]} },
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الفكرية_الثاني_المتوسط': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[4,4,0,1],"4":[4,4,0,1],"5":[1,1,0,1],"6":[1,1,0,1],"7":[2,2,0,1],"8":[3,3,0,1],"9":[3,3,0,1],"10":[4,4,0,1],"11":[5,5,0,1]} },
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الفكرية_الثالث_المتوسط': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[4,4,0,1],"4":[4,4,0,1],"5":[1,1,0,1],"6":[1,1,0,1],"7":[2,2,0,1],"8":[3,3,0,1],"9":[3,3,0,1],"10":[4,4,0,1],"11":[5,5,0,1]} },
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الفكرية_الأول_الثانوي_التأهيلي': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[4,4,0,1],"6":[3,3,0,1],"7":[3,3,0,1],"8":[5,5,0,1],"9":[5,5,0,1]} },
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الفكرية_الثاني_الثانوي_التأهيلي': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[4,4,0,1],"6":[3,3,0,1],"7":[3,3,0,1],"8":[5,5,0,1],"9":[5,5,0,1]} },
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الفكرية_الثالث_الثانوي_التأهيلي': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[4,4,0,1],"6":[3,3,0,1],"7":[3,3,0,1],"8":[5,5,0,1],"9":[5,5,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الأول': { totalPeriods: 30, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[5,5,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[1,1,0,1],"6":[3,3,0,1],"7":[4,4,0,1],"8":[4,4,0,1],"9":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الثاني': { totalPeriods: 30, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[5,5,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[1,1,0,1],"6":[3,3,0,1],"7":[4,4,0,1],"8":[4,4,0,1],"9":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الثالث': { totalPeriods: 30, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[5,5,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[1,1,0,1],"6":[3,3,0,1],"7":[4,4,0,1],"8":[4,4,0,1],"9":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الرابع': { totalPeriods: 30, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[5,5,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[2,2,0,1],"6":[1,1,0,1],"7":[1,1,0,1],"8":[3,3,0,1],"9":[2,2,0,1],"10":[3,3,0,1],"11":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_الخامس': { totalPeriods: 30, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[5,5,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[2,2,0,1],"6":[1,1,0,1],"7":[1,1,0,1],"8":[3,3,0,1],"9":[2,2,0,1],"10":[3,3,0,1],"11":[2,2,0,1]} },
+  'sp_الابتدائية_مدارس_ذوي_الإعاقة_الإعاقات_السادس': { totalPeriods: 30, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[5,5,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[2,2,0,1],"6":[1,1,0,1],"7":[1,1,0,1],"8":[3,3,0,1],"9":[2,2,0,1],"10":[3,3,0,1],"11":[2,2,0,1]} },
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الإعاقات_الأول_المتوسط': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[4,4,0,1],"4":[4,4,0,1],"5":[1,1,0,1],"6":[1,1,0,1],"7":[2,2,0,1],"8":[3,3,0,1],"9":[3,3,0,1],"10":[4,4,0,1],"11":[5,5,0,1]} },
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الإعاقات_الثاني_المتوسط': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[4,4,0,1],"4":[4,4,0,1],"5":[1,1,0,1],"6":[1,1,0,1],"7":[2,2,0,1],"8":[3,3,0,1],"9":[3,3,0,1],"10":[4,4,0,1],"11":[5,5,0,1]} },
+  'sp_المتوسطة_مدارس_ذوي_الإعاقة_الإعاقات_الثالث_المتوسط': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[4,4,0,1],"4":[4,4,0,1],"5":[1,1,0,1],"6":[1,1,0,1],"7":[2,2,0,1],"8":[3,3,0,1],"9":[3,3,0,1],"10":[4,4,0,1],"11":[5,5,0,1]} },
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الإعاقات_الأول_الثانوي_التأهيلي': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[4,4,0,1],"6":[3,3,0,1],"7":[3,3,0,1],"8":[5,5,0,1],"9":[5,5,0,1]} },
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الإعاقات_الثاني_الثانوي_التأهيلي': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[4,4,0,1],"6":[3,3,0,1],"7":[3,3,0,1],"8":[5,5,0,1],"9":[5,5,0,1]} },
+  'sp_الثانوية_مدارس_ذوي_الإعاقة_الإعاقات_الثالث_الثانوي_التأهيلي': { totalPeriods: 35, maxDaily: 1, subjects: {"1":[4,4,0,1],"2":[4,4,0,1],"3":[5,5,0,1],"4":[2,2,0,1],"5":[4,4,0,1],"6":[3,3,0,1],"7":[3,3,0,1],"8":[5,5,0,1],"9":[5,5,0,1]} },
+  'sp_الابتدائية_الموهوبين_الرابع': { totalPeriods: 6, maxDaily: 1, subjects: {"1":[1,1,0,1],"2":[1,1,0,1],"3":[1,1,0,1],"4":[1,1,0,1],"5":[2,2,0,1]} },
+  'sp_الابتدائية_الموهوبين_الخامس': { totalPeriods: 6, maxDaily: 1, subjects: {"1":[1,1,0,1],"2":[1,1,0,1],"3":[1,1,0,1],"4":[1,1,0,1],"5":[2,2,0,1]} },
+  'sp_الابتدائية_الموهوبين_السادس': { totalPeriods: 6, maxDaily: 1, subjects: {"1":[1,1,0,1],"2":[1,1,0,1],"3":[1,1,0,1],"4":[1,1,0,1],"5":[2,2,0,1]} },
+  'sp_المتوسطة_الموهوبين_الأول_المتوسط': { totalPeriods: 6, maxDaily: 1, subjects: {"1":[1,1,0,1],"2":[1,1,0,1],"3":[1,1,0,1],"4":[1,1,0,1],"5":[2,2,0,1]} },
+  'sp_المتوسطة_الموهوبين_الثاني_المتوسط': { totalPeriods: 6, maxDaily: 1, subjects: {"1":[1,1,0,1],"2":[1,1,0,1],"3":[1,1,0,1],"4":[1,1,0,1],"5":[2,2,0,1]} },
+  'sp_المتوسطة_الموهوبين_الثالث_المتوسط': { totalPeriods: 6, maxDaily: 1, subjects: {"1":[1,1,0,1],"2":[1,1,0,1],"3":[1,1,0,1],"4":[1,1,0,1],"5":[2,2,0,1]} },
+};
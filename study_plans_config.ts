@@ -259,6 +259,7 @@ export const STUDY_PLANS_CONFIG: StudyPlanCategory[] = [
             id: 'الأول_الثانوي',
             name: 'الصف الأول الثانوي',
             plans: [
+              { key: 'sp_الثانوية_مسارات_الفصل_الأول_الأول_الثانوي',  label: 'مسارات - فصل أول' },
               { key: 'sp_الثانوية_المشترك_الفصل_الأول_الأول_الثانوي',  label: 'مشترك - فصل أول' },
               { key: 'sp_الثانوية_المشترك_الفصل_الثاني_الأول_الثانوي', label: 'مشترك - فصل ثاني' },
             ],
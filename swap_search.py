@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Swap-chain search for interactive timetable edits.
+
+findChainSwap() in utils/scheduleInteractive.ts scans the whole timetable
+for every drag and returns the first triangle it finds, unchecked.
+SwapSearch keeps the timetable as a timetable_solver.Solver, whose
+at_teacher / at_class dicts index every lesson by (teacher, slot) and
+(class, slot).
+
+Moving a lesson to a new time displaces the lessons that block it: the
+class's lesson and the teacher's lesson at that time, or a lesson that
+breaks a daily limit. Each displaced lesson is moved in turn, and
+lessons already moved in the chain are never moved again. Chains are
+searched breadth-first by iterative deepening, so every chain of 2 moves
+is found before any chain of 3.
+
+Every move is checked against the same hard constraints as the solver:
+- the teacher's excluded slots, early exit and meetings;
+- the subject's excluded periods and the class's day length;
+- daily limits.
+
+Lessons keep their teacher, because the Assignment decides who teaches a
+class. Lessons that no longer fit (SwapSearch.invalid) are kept in the
+timetable unchanged, and their teacher and class slots count as taken.
+Proposals are ranked by chain length, then by the change in violations and
+gaps of the teachers involved (Solver.teacher_penalty).
+
+    python swap_search.py input.json --timetable tt.json --move t1-sunday-2 --to monday 4
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import List, NamedTuple, Tuple
+
+from occupancy import slot_key, split_key
+from timetable_repair import replay
+from timetable_solver import Problem, Solver, load_input, write_json
+
+DEFAULT_DEPTH = 4
+DEFAULT_LIMIT = 10
+MAX_NODES = 50000
+
+
+class Move(NamedTuple):
+    lesson: int
+    source: int            # رقم الحصة في الأسبوع قبل النقل
+    target: int
+
+
+class Proposal(NamedTuple):
+    moves: List[Tuple[str, str]]   # (المفتاح القديم، المفتاح الجديد)
+    steps: List[str]
+    penalty: int                   # تغير المخالفات والفجوات للمعلمين المعنيين (الأقل أفضل)
+    relatedTeacherIds: List[str]
+
+
+class SwapSearch:
+    """Indexed timetable state answering "move this lesson to that time" queries."""
+
+    def __init__(self, data, timetable):
+        # الانتظار وغيره من غير الدروس يحجز وقت المعلم ولا ينقل
+        others = {key: entry for key, entry in timetable.items() if entry.get('type', 'lesson') != 'lesson'}
+        existing = dict((data.get('existingTimetable') or {}), **others)
+        self.problem = Problem(dict(data, existingTimetable=existing))
+        self.solver = Solver(self.problem)
+        self.others = others
+        self.invalid, _ = replay(self.solver, timetable)
+        # الدروس غير الصالحة تبقى في الجدول كما هي وتحجز وقت معلمها وفصلها
+        self.invalid_entries = {key: timetable[key] for key in self.invalid}
+        self._reserve(self.invalid_entries)
+        self.penalties = [self.solver.teacher_penalty(t) for t in range(len(self.problem.teachers))]
+        self.nodes = 0
+
+    def _reserve(self, entries):
+        p = self.problem
+        for key, entry in entries.items():
+            teacher_id, day, period = split_key(key)
+            if day not in p.day_index or not 1 <= period <= p.periods:
+                continue
+            bit = ~(1 << p.slot(day, period))
+            t = p.teacher_index.get(teacher_id)
+            if t is not None:
+                p.teacher_allowed[t] &= bit
+            c = p.class_index.get(entry.get('classId'))
+            if c is not None:
+                p.class_open[c] &= bit
+
+    # ---- البحث ----
+
+    def lesson_at(self, key):
+        teacher_id, day, period = split_key(key)
+        t = self.problem.teacher_index.get(teacher_id)
+        if t is None or day not in self.problem.day_index:
+            return None
+        return self.solver.at_teacher.get((t, self.problem.slot(day, period)))
+
+    def propose(self, key, day, period, max_depth=DEFAULT_DEPTH, limit=DEFAULT_LIMIT, time_limit=0.5):
+        # type: (str, str, int, int, int, float) -> List[Proposal]
+        """Ranked, validated chains that move the lesson at `key` to (day, period)."""
+        p, solver = self.problem, self.solver
+        i = self.lesson_at(key)
+        if i is None:
+            raise KeyError(f"لا يوجد درس في {key}")
+        target = p.slot(day, period)
+        if target == solver.slot_of[i] or not solver.static_domain(p.lessons[i]) >> target & 1:
+            return []
+
+        deadline = time.perf_counter() + time_limit
+        self.nodes = 0
+        found = []
+        source = solver.slot_of[i]
+        # يرفع الدرس أولاً حتى لا يحسب هو نفسه ضمن حد المادة اليومي في يوم الهدف
+        solver.remove(i)
+        blockers = solver.blockers(p.lessons[i], target)
+        for depth in range(len(blockers) + 1, max_depth + 1):
+            moved = self._move(i, target, blockers)
+            self._search(moved[2], [Move(i, source, target)], {i}, depth, found, limit, deadline)
+            self._undo(moved)
+            if len(found) >= limit or time.perf_counter() >= deadline:
+                break
+        solver.place(i, source)
+        found.sort(key=lambda result: (len(result[0]), result[1]))
+        return [self._proposal(chain, penalty) for chain, penalty in found[:limit]]
+
+    def _move(self, i, slot, blockers):
+        """Remove `blockers` and put lesson i in `slot`; returns what _undo needs."""
+        solver = self.solver
+        removed = [(j, solver.slot_of[j]) for j in sorted(blockers)]
+        for j, _ in removed:
+            solver.remove(j)
+        previous = solver.slot_of[i]
+        if previous >= 0:
+            solver.remove(i)
+        solver.place(i, slot)
+        return i, previous, removed
+
+    def _undo(self, moved):
+        i, previous, removed = moved
+        solver = self.solver
+        solver.remove(i)
+        if previous >= 0:
+            solver.place(i, previous)
+        for j, slot in removed:
+            solver.place(j, slot)
+
+    def _search(self, homeless, moves, locked, depth, results, limit, deadline):
+        """
+        Depth-first up to exactly `depth` moves. `homeless` holds the
+        displaced (lesson, original slot) pairs; a chain is recorded, with
+        its penalty change, when none are left.
+        """
+        if not homeless:
+            if len(moves) == depth:
+                teachers = {self.problem.lessons[move.lesson].teacher for move in moves}
+                penalty = sum(self.solver.teacher_penalty(t) - self.penalties[t] for t in teachers)
+                results.append((list(moves), penalty))
+            return
+        remaining = depth - len(moves)
+        if remaining < len(homeless) or len(results) >= limit or self.nodes >= MAX_NODES \
+                or time.perf_counter() >= deadline:
+            return
+
+        solver = self.solver
+        (i, source), rest = homeless[0], homeless[1:]
+        lesson = self.problem.lessons[i]
+        candidates = solver.static_domain(lesson)
+        while candidates:
+            low = candidates & -candidates
+            slot = low.bit_length() - 1
+            candidates ^= low
+            self.nodes += 1
+            blockers = solver.blockers(lesson, slot)
+            if blockers & locked or len(rest) + len(blockers) > remaining - 1:
+                continue
+            moved = self._move(i, slot, blockers)
+            moves.append(Move(i, source, slot))
+            self._search(rest + moved[2], moves, locked | {i}, depth, results, limit, deadline)
+            moves.pop()
+            self._undo(moved)
+            if len(results) >= limit:
+                return
+
+    # ---- النتائج والتطبيق ----
+
+    def _proposal(self, chain, penalty):
+        p = self.problem
+        keys, steps, teachers = [], [], []
+        for move in chain:
+            lesson = p.lessons[move.lesson]
+            teacher_id = p.teachers[lesson.teacher]['id']
+            (from_day, from_period), (to_day, to_period) = p.slot_day_period(move.source), p.slot_day_period(move.target)
+            keys.append((slot_key(teacher_id, from_day, from_period), slot_key(teacher_id, to_day, to_period)))
+            steps.append(f"{p.classes[lesson.cls]['id']} | {lesson.subject}: "
+                         f"{from_day} ح{from_period} → {to_day} ح{to_period}")
+            if teacher_id not in teachers:
+                teachers.append(teacher_id)
+        return Proposal(keys, steps, penalty, teachers)
+
+    def apply(self, proposal):
+        # type: (Proposal) -> dict
+        """Commit a proposal to the state and return the new TimetableData."""
+        p, solver = self.problem, self.solver
+        lessons = [(self.lesson_at(old), split_key(new)) for old, new in proposal.moves]
+        if any(i is None for i, _ in lessons):
+            raise KeyError("الجدول تغير بعد حساب الاقتراح")
+        for i, _ in lessons:
+            solver.remove(i)
+        for i, (_, day, period) in lessons:
+            solver.place(i, p.slot(day, period))
+        for i, _ in lessons:
+            t = p.lessons[i].teacher
+            self.penalties[t] = solver.teacher_penalty(t)
+        return self.timetable()
+
+    def timetable(self):
+        return dict(self.solver.timetable(), **self.invalid_entries, **self.others)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="اقتراح سلاسل تبديل صالحة لنقل حصة إلى وقت آخر")
+    parser.add_argument('input', help="ملف JSON بمدخلات generateSchedule")
+    parser.add_argument('--timetable', help="الجدول الحالي (الافتراضي: settings.timetable)")
+    parser.add_argument('--move', required=True, help="مفتاح الحصة: teacherId-day-period")
+    parser.add_argument('--to', nargs=2, required=True, metavar=('DAY', 'PERIOD'))
+    parser.add_argument('--depth', type=int, default=DEFAULT_DEPTH, help="أقصى عدد حصص في السلسلة")
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT)
+    parser.add_argument('--apply', type=int, metavar='N', help="تطبيق الاقتراح رقم N وكتابة الجدول")
+    parser.add_argument('-o', '--output', help="ملف الجدول بعد --apply (الافتراضي: الطباعة)")
+    args = parser.parse_args()
+
+    data = load_input(args.input)
+    current = load_input(args.timetable) if args.timetable else (data.get('settings') or {}).get('timetable') or {}
+    started = time.perf_counter()
+    search = SwapSearch(data, current)
+    indexed = time.perf_counter()
+    proposals = search.propose(args.move, args.to[0], int(args.to[1]), args.depth, args.limit)
+    print(f"✓ {len(proposals)} اقتراح | {search.nodes} حالة | الفهرسة {indexed - started:.3f} ث | "
+          f"البحث {time.perf_counter() - indexed:.3f} ث | غير صالحة: {len(search.invalid)}", file=sys.stderr)
+    for key in search.invalid[:20]:
+        print(f"  ✗ {key}: حصة غير صالحة أبقيت كما هي", file=sys.stderr)
+
+    if args.apply is not None:
+        write_json(search.apply(proposals[args.apply]), args.output)
+    else:
+        json.dump([proposal._asdict() for proposal in proposals], sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+    sys.exit(0 if not search.invalid else 2)
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""Shared input builders for the timetable tests."""
+
+DAYS = ['sunday', 'monday', 'tuesday', 'wednesday', 'thursday']
+
+
+def make_school(classes=2, subjects=(('math', 5), ('science', 4), ('arabic', 6)), periods=7, days=DAYS):
+    """Input for generateSchedule: one teacher per subject, every class taking every subject."""
+    return {
+        'teachers': [{'id': f"t{subject}", 'name': subject, 'quotaLimit': 24} for subject, _ in subjects],
+        'subjects': [{'id': subject, 'name': subject, 'periodsPerClass': count} for subject, count in subjects],
+        'classes': [{'id': f"c{c}", 'subjectIds': [subject for subject, _ in subjects]} for c in range(classes)],
+        'settings': {'subjectConstraints': [], 'teacherConstraints': [], 'meetings': []},
+        'options': {'activeDays': list(days), 'periodsPerDay': periods, 'weekDays': len(days)},
+        'assignments': [{'classId': f"c{c}", 'subjectId': subject, 'teacherId': f"t{subject}"}
+                        for c in range(classes) for subject, _ in subjects],
+        'isBypassingConflicts': False,
+    }
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import re
+
+import pytest
+
+openpyxl = pytest.importorskip('openpyxl')
+
+import batch_plans
+
+ROWS = [
+    ('المتوسطة', 'عام', 'الصف الأول', 'الرياضيات', 6),
+    ('المتوسطة', 'عام', 'الصف الأول', 'العلوم', 4),
+    ('المتوسطة', 'عام', 'الصف الثاني', 'الرياضيات', 6),
+]
+
+
+def write_workbook(path):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(['المرحلة', 'القسم / المسار', 'الصف الدراسي', 'المادة الدراسية', 'عدد الحصص'])
+    for row in ROWS:
+        sheet.append(list(row))
+    workbook.save(path)
+
+
+def plan_keys(path):
+    return re.findall(r"^  '(sp_[^']+)': \[", path.read_text(encoding='utf-8'), re.M)
+
+
+@pytest.fixture
+def plans_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'plans').mkdir()
+    for region in ('الرياض', 'جدة'):
+        write_workbook(str(tmp_path / 'plans' / f'الخطط الدراسية 1447هـ {region}.xlsx'))
+    return tmp_path
+
+
+def test_batch_namespaces_plans(plans_dir):
+    output = plans_dir / 'out.ts'
+    assert batch_plans.main(['plans'], str(output), workers=1) == 0
+    keys = plan_keys(output)
+    assert len(keys) == 4
+    assert sum(key.startswith('sp_1447_الرياض_') for key in keys) == 2
+
+
+def test_failed_workbook_keeps_its_plans(plans_dir):
+    output = plans_dir / 'out.ts'
+    batch_plans.main(['plans'], str(output), workers=1)
+    before = output.read_text(encoding='utf-8')
+
+    (plans_dir / 'plans' / 'الخطط الدراسية 1447هـ جدة.xlsx').write_bytes(b'not a zip file')
+    assert batch_plans.main(['plans'], str(output), workers=1) == 1
+    assert output.read_text(encoding='utf-8') == before
+
+
+def test_key_owner_prefers_longest_namespace():
+    namespaces = {'1447', '1447_الرياض', ''}
+    assert batch_plans.key_owner('sp_1447_الرياض_x_y', namespaces) == '1447_الرياض'
+    assert batch_plans.key_owner('sp_1447_x_y', namespaces) == '1447'
+    assert batch_plans.key_owner('sp_x_y', namespaces) == ''
+    assert batch_plans.key_owner('sp_x_y', {'1447'}) is None
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+from duty_roster import duty_dates, generate_roster, min_cost_assignment
+
+import numpy as np
+
+SCHOOL_DAYS = ['sunday', 'monday', 'tuesday', 'wednesday', 'thursday']
+
+
+def school_info(start, end, holidays=()):
+    return {
+        'timing': {'activeDays': SCHOOL_DAYS, 'periodCounts': {day: 7 for day in SCHOOL_DAYS}},
+        'semesters': [{'id': 's1', 'name': 'الأول', 'startDate': start, 'endDate': end,
+                       'holidays': list(holidays), 'isCurrent': True}],
+    }
+
+
+def test_min_cost_assignment_is_optimal():
+    cost = np.array([[4., 1., 3.], [2., 0., 5.]])
+    assert list(min_cost_assignment(cost)) == [1, 0]
+
+
+def test_duty_dates_for_hijri_semester():
+    dates = duty_dates(school_info('1447-03-01', '1447-03-14'))
+    assert dates[0].date == '2025-08-24' and dates[-1].date == '2025-09-04'
+    assert [d.weekId for d in dates].count('week-2') == 5
+
+
+def test_duty_dates_outside_hijri_table_keep_real_dates():
+    dates = duty_dates(school_info('2017-09-03', '2017-12-28', holidays=['not a date']))
+    assert len(dates) == 85 and dates[0].date == '2017-09-03'
+
+
+def test_roster_counts_are_fair():
+    teachers = [{'id': f"t{i}", 'name': f"t{i}"} for i in range(7)]
+    result = generate_roster(teachers, [], [], {}, {'timetable': {}}, school_info('2025-08-24', '2025-10-02'),
+                             count_per_day=1)
+    counts = result['newCounts']
+    assert result['stats']['duties'] == result['stats']['dates'] == 30
+    assert max(counts.values()) - min(counts.values()) <= 1
+    for week in result['weekAssignments']:
+        ids = [a['staffId'] for day in week['dayAssignments'] for a in day['staffAssignments']]
+        assert len(ids) == len(set(ids))
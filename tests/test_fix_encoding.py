@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+import os
+
+from fix_encoding import main, repair_file, repair_line
+
+
+def test_repair_line_fixes_both_code_pages():
+    assert repair_line("'ط¹ط§ظ…'\n") == ("'عام'\n", 1)
+    assert repair_line("'Ø¹Ø§Ù…'\n") == ("'عام'\n", 1)
+    # نص عربي صحيح يبقى كما هو
+    assert repair_line("فقط؛ عام\n") == ("فقط؛ عام\n", 0)
+
+
+def test_repair_file_rewrites_in_place(tmp_path):
+    path = tmp_path / 'a.ts'
+    path.write_text("const a = 'ط¹ط§ظ…';\r\n", encoding='utf-8', newline='')
+    assert repair_file(str(path)) == (str(path), 1, None, None)
+    assert path.read_bytes() == "const a = 'عام';\r\n".encode('utf-8')
+    assert os.listdir(tmp_path) == ['a.ts']
+
+
+def test_non_utf8_file_is_skipped_without_temp_file(tmp_path):
+    raw = ("const a = 'ok';\n" * 50 + "const b = 'عام';\n").encode('cp1256')
+    (tmp_path / 'raw.ts').write_bytes(raw)
+    (tmp_path / 'good.ts').write_text("const a = 'ط¹ط§ظ…';\n", encoding='utf-8')
+
+    assert main([str(tmp_path)], workers=1) == 1
+    assert (tmp_path / 'raw.ts').read_bytes() == raw
+    assert (tmp_path / 'good.ts').read_text(encoding='utf-8') == "const a = 'عام';\n"
+    assert sorted(os.listdir(tmp_path)) == ['good.ts', 'raw.ts']
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+import generate_study_plans as gsp
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KEY = gsp.make_plan_key('الثانوية', 'المشترك', 'الأول الثانوي')
+
+
+def plan(*subjects):
+    return {'phase': 'الثانوية', 'department': 'المشترك', 'grade': 'الأول الثانوي',
+            'subjects': list(subjects)}
+
+
+def with_manual_subject(text):
+    # مادة أضيفت يدوياً في أول الخطة كما في study_plans.ts
+    manual = (f"    {{ id: '{KEY}_0', name: 'القرآن الكريم وتفسيره', specializationIds: [\"1\"], "
+              f"periodsPerClass: 4, phases: [Phase.HIGH], department: 'المشترك' }},\n")
+    return text.replace(f"  '{KEY}': [\n", f"  '{KEY}': [\n" + manual), manual
+
+
+def test_unchanged_plan_keeps_manual_subject():
+    plans = {KEY: plan(('الرياضيات 1', 5), ('اللغة الإنجليزية 1', 5))}
+    text, manual = with_manual_subject(gsp.update_plans_text('', plans)[0])
+
+    new_text, changed, added, removed = gsp.update_plans_text(text, plans)
+    assert new_text == text
+    assert (changed, added, removed) == ([], [], [])
+
+
+def test_rewritten_plan_keeps_manual_subject():
+    text, manual = with_manual_subject(
+        gsp.update_plans_text('', {KEY: plan(('الرياضيات 1', 5), ('اللغة الإنجليزية 1', 5))})[0])
+
+    new_text, changed, _, _ = gsp.update_plans_text(text, {KEY: plan(('الرياضيات 1', 6))})
+    assert changed == [KEY]
+    block = gsp.parse_plans_file(new_text)[1][0][1]
+    assert block.splitlines(keepends=True)[2] == manual
+    assert "name: 'الرياضيات 1', specializationIds: [\"3\"], periodsPerClass: 6" in block
+    assert 'اللغة الإنجليزية 1' not in block
+
+
+def test_is_manual_id():
+    assert gsp.is_manual_id(KEY, f'{KEY}_0')
+    assert gsp.is_manual_id(KEY, f'{KEY}_extra')
+    assert not gsp.is_manual_id(KEY, f'{KEY}_12')
+
+
+def test_committed_plans_match_workbook(monkeypatch):
+    pytest.importorskip('openpyxl')
+    import verify_plans
+
+    monkeypatch.chdir(ROOT)
+    assert verify_plans.verify() == []
+    text = gsp.read_text(gsp.PLANS_FILE)
+    plans = gsp.build_plans(gsp.load_plan_rows(gsp.EXCEL_FILE))
+    assert gsp.update_plans_text(text, plans)[0] == text
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+from grades import build_grade_index, grade_code, parse_grades
+
+
+def test_single_and_listed_grades():
+    assert parse_grades('الصف الثالث') == {3}
+    assert parse_grades('الأول المتوسط') == {1}
+    assert parse_grades('الصف الأول والثاني والثالث') == {1, 2, 3}
+    assert parse_grades('الصف الأول / الثاني') == {1, 2}
+    assert parse_grades('السنة الأولى') == {1}
+
+
+def test_groups_and_ranges():
+    assert parse_grades('الصفوف العليا (4-6)') == {4, 5, 6}
+    assert parse_grades('الصفوف الأولية') == {1, 2, 3}
+    assert parse_grades('2 - 3') == {2, 3}
+
+
+def test_empty_and_unknown_cells():
+    assert parse_grades(None) == frozenset()
+    assert parse_grades('رياض أطفال') == frozenset()
+    assert grade_code('رياض أطفال') is None
+
+
+def test_grade_codes():
+    assert grade_code('الصف الخامس') == 'grade5'
+    assert grade_code('الصفوف العليا') == 'upper'
+    assert grade_code('الصف الأول والثاني') == 'grades12'
+
+
+def test_grade_index_with_fallbacks():
+    texts = ['الصف الأول', 'الصف الأول والثاني', None, 'الصف الثالث']
+    fallbacks = [None, None, 'الصف الثاني', None]
+    assert build_grade_index(texts, fallbacks) == {1: [0, 1], 2: [1, 2], 3: [3]}
+    assert build_grade_index(texts) == {1: [0, 1], 2: [1], 3: [3]}
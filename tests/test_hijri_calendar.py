@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+from datetime import date
+
+import pytest
+
+from hijri_calendar import gregorian_to_hijri, hijri_to_gregorian, parse_date, semester_days, semester_table
+
+# بدايات أشهر معلنة في تقويم أم القرى
+KNOWN = [
+    ((1440, 1, 1), date(2018, 9, 11)),
+    ((1441, 9, 1), date(2020, 4, 24)),
+    ((1444, 10, 1), date(2023, 4, 21)),
+    ((1445, 12, 1), date(2024, 6, 7)),
+    ((1446, 9, 1), date(2025, 3, 1)),
+    ((1447, 1, 1), date(2025, 6, 26)),
+    ((1447, 3, 1), date(2025, 8, 24)),
+]
+
+
+@pytest.mark.parametrize('hijri, gregorian', KNOWN)
+def test_umm_al_qura_conversions(hijri, gregorian):
+    assert hijri_to_gregorian(*hijri) == gregorian
+    assert gregorian_to_hijri(gregorian) == hijri
+
+
+def test_parse_date_reads_low_years_as_hijri():
+    assert parse_date('1447-03-01') == date(2025, 8, 24)
+    assert parse_date('2025-08-24') == date(2025, 8, 24)
+    with pytest.raises(ValueError):
+        parse_date('1447-02-30')       # صفر 1447 تسعة وعشرون يوماً
+
+
+def test_semester_days_skip_weekends_and_holidays():
+    days = semester_days('1447-03-01', '1447-03-14', holidays=['2025-08-26'])
+    assert days[0].date == '2025-08-24' and days[0].hijri == '1447-03-01' and days[0].week == 1
+    assert '2025-08-26' not in [day.date for day in days]
+    assert {day.dayKey for day in days} <= {'sunday', 'monday', 'tuesday', 'wednesday', 'thursday'}
+    assert [day.week for day in days] == [1] * 4 + [2] * 5
+
+
+def test_gregorian_semester_outside_table_has_empty_hijri():
+    days = semester_days('2017-09-03', '2017-12-28')
+    assert len(days) == 85 and days[-1].week == 17
+    assert {day.hijri for day in days} == {''}
+    edge = semester_days('2018-09-09', '2018-09-11')
+    assert [day.hijri for day in edge] == ['', '', '1440-01-01']
+
+
+def test_bad_holiday_is_skipped(capsys):
+    semester = {'id': 's1', 'name': 'الأول', 'startDate': '2025-08-24', 'endDate': '2025-08-28',
+                'holidays': ['2025-08-25', 'غير صالح']}
+    table = semester_table(semester)
+    assert table['holidays'] == ['2025-08-25']
+    assert table['schoolDays'] == 4
+    assert 'غير صالح' in capsys.readouterr().err
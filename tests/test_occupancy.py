@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from occupancy import OccupancyGrid, popcount, split_key
+
+DAYS = ['sunday', 'monday']
+
+
+def lesson(teacher_id, class_id):
+    return {'teacherId': teacher_id, 'classId': class_id, 'subjectId': 's', 'type': 'lesson'}
+
+
+TIMETABLE = {
+    't-1-sunday-1': lesson('t-1', 'c1'),
+    't-1-sunday-2': lesson('t-1', 'c2'),
+    't-1-sunday-5': lesson('t-1', 'c1'),
+    't2-monday-3': lesson('t2', 'c1'),
+    't2-friday-1': lesson('t2', 'c1'),       # يوم غير نشط: يتجاهل
+}
+
+
+def test_split_key_keeps_dashes_in_teacher_id():
+    assert split_key('t-1-sunday-5') == ('t-1', 'sunday', 5)
+
+
+def test_from_timetable_round_trip():
+    grid = OccupancyGrid.from_timetable(TIMETABLE, DAYS, 7)
+    assert grid.teacher_ids == ['t-1', 't2'] and grid.class_ids == ['c1', 'c2']
+    assert sorted(grid.to_keys()) == sorted(key for key in TIMETABLE if 'friday' not in key)
+    assert grid.teacher_busy('t-1', 'sunday', 5) and not grid.teacher_busy('t-1', 'sunday', 3)
+    assert grid.conflicts('t2', 'c1', 'sunday', 1) and not grid.conflicts('t2', 'c2', 'sunday', 1)
+
+
+def test_loads_gaps_and_edges():
+    grid = OccupancyGrid.from_timetable(TIMETABLE, DAYS, 7)
+    assert grid.teacher_daily_load().tolist() == [[3, 0], [0, 1]]
+    assert grid.teacher_weekly_load().tolist() == [3, 1]
+    assert grid.gaps().tolist() == [[2, 0], [0, 0]]
+    assert grid.edge_load(1).tolist() == [1, 0]
+    assert grid.free_periods('t-1', 'sunday', 'c1') == [3, 4, 6, 7]
+    assert grid.summary() == (4, 4, 2)
+
+
+def test_week_mask_uses_solver_layout():
+    grid = OccupancyGrid.from_timetable(TIMETABLE, DAYS, 7)
+    assert grid.week_mask(teacher_id='t2') == 1 << (1 * 7 + 3 - 1)
+
+
+def test_occupy_release_and_copy():
+    grid = OccupancyGrid(['t1'], ['c1'], DAYS, 7)
+    grid.occupy('t1', 'monday', 2, 'c1')
+    copy = grid.copy()
+    grid.release('t1', 'monday', 2, 'c1')
+    assert len(grid) == 0 and len(copy) == 1
+    assert copy.class_busy('c1', 'monday', 2)
+
+
+def test_runs_over_per_teacher_limits():
+    grid = OccupancyGrid(['t1', 't2'], [], ['sunday'], 7)
+    for period in (1, 2, 3, 4):
+        grid.occupy('t1', 'sunday', period)
+        grid.occupy('t2', 'sunday', period)
+    assert grid.runs_over([3, 4]).tolist() == [[True], [False]]
+
+
+def test_popcount_and_period_limit():
+    assert popcount(np.array([0, 1, 2 ** 64 - 1], dtype=np.uint64)).tolist() == [0, 1, 64]
+    with pytest.raises(ValueError):
+        OccupancyGrid([], [], DAYS, 65)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+openpyxl = pytest.importorskip('openpyxl')
+
+import plan_cache
+from plan_cache import load_plan_rows, sheet_digest
+
+HEADER = ['المرحلة', 'الصف الدراسي', 'المادة الدراسية', 'عدد الحصص']
+
+
+def write_workbook(path, sheets):
+    workbook = openpyxl.Workbook()
+    workbook.remove(workbook.active)
+    for name, rows in sheets.items():
+        sheet = workbook.create_sheet(name)
+        sheet.append(HEADER)
+        for row in rows:
+            sheet.append(row)
+    workbook.save(path)
+
+
+def test_cache_hit_skips_parsing(tmp_path, monkeypatch):
+    path = str(tmp_path / 'plans.xlsx')
+    write_workbook(path, {'ورقة1': [['المتوسطة', 'الأول', 'الرياضيات', 6]]})
+    cache_dir = str(tmp_path / 'cache')
+    rows = load_plan_rows(path, cache_dir=cache_dir)
+    assert [(row.subject, row.periods) for row in rows] == [('الرياضيات', 6)]
+
+    def fail(*args):
+        raise AssertionError("parsed again")
+    monkeypatch.setattr(plan_cache, 'iter_plan_rows', fail)
+    assert load_plan_rows(path, cache_dir=cache_dir) == rows
+
+
+def test_digest_tracks_sheet_content(tmp_path):
+    path = str(tmp_path / 'plans.xlsx')
+    write_workbook(path, {'أ': [['المتوسطة', 'الأول', 'الرياضيات', 6]], 'ب': [['المتوسطة', 'الأول', 'العلوم', 4]]})
+    first = {name: sheet_digest(path, name)[1] for name in ('أ', 'ب')}
+    assert sheet_digest(path) == ('أ', first['أ'])
+
+    # تعديل رقم في الورقة الثانية لا يغير مفتاح الأولى
+    write_workbook(path, {'أ': [['المتوسطة', 'الأول', 'الرياضيات', 6]], 'ب': [['المتوسطة', 'الأول', 'العلوم', 5]]})
+    assert sheet_digest(path, 'أ')[1] == first['أ']
+    assert sheet_digest(path, 'ب')[1] != first['ب']
+    assert sheet_digest(path, 'أ', keep_blank_phase=True)[1] != first['أ']
+
+    with pytest.raises(KeyError):
+        sheet_digest(path, 'ج')
+
+
+def test_parser_version_invalidates(tmp_path, monkeypatch):
+    path = str(tmp_path / 'plans.xlsx')
+    write_workbook(path, {'ورقة1': [['المتوسطة', 'الأول', 'الرياضيات', 6]]})
+    before = sheet_digest(path)[1]
+    monkeypatch.setattr(plan_cache, 'PARSER_VERSION', plan_cache.PARSER_VERSION + 1)
+    assert sheet_digest(path)[1] != before
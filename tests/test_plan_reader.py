@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+openpyxl = pytest.importorskip('openpyxl')
+
+from plan_cache import load_plan_rows
+from plan_reader import iter_plan_rows
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKBOOK = 'خطة المقررات الدراسية 1447هـ.xlsx'
+
+ROWS = [
+    ('الابتدائية (عام)', 'الصف الأول', 'لغتي', 8),
+    ('الابتدائية (عام)', 'الصف الأول', 'الرياضيات', 5),
+    ('الابتدائية (عام)', 'الصف الأول', 'العلوم', 3),
+    ('المتوسطة (عام)', 'الصف الثاني', 'اللغة العربية', 5),
+    ('المتوسطة (عام)', 'الصف الثاني', 'الرياضيات', 6),
+]
+
+
+def write_workbook(path, merged):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = 'ورقة1'
+    sheet.append(['المرحلة', 'الصف الدراسي', 'المادة الدراسية', 'عدد الحصص'])
+    for _ in range(5):
+        sheet.append([None] * 4)
+    previous = (None, None)
+    for phase, grade, subject, periods in ROWS:
+        # الخلايا المدمجة تقرأ فارغة بعد سطرها الأول
+        shown = (None if merged and phase == previous[0] else phase,
+                 None if merged and grade == previous[1] else grade)
+        sheet.append([*shown, subject, periods])
+        previous = (phase, grade)
+    workbook.save(path)
+
+
+def test_reads_every_data_row(tmp_path):
+    path = str(tmp_path / 'filled.xlsx')
+    write_workbook(path, merged=False)
+    rows = list(iter_plan_rows(path))
+    assert [(row.phase, row.grade, row.subject, row.periods) for row in rows] == ROWS
+    assert rows[0].row == 7
+
+
+def test_blank_phase_rows_dropped_by_default(tmp_path):
+    path = str(tmp_path / 'merged.xlsx')
+    write_workbook(path, merged=True)
+    assert [row.subject for row in iter_plan_rows(path)] == ['لغتي', 'اللغة العربية']
+
+
+def test_keep_blank_phase_keeps_merged_rows(tmp_path):
+    path = str(tmp_path / 'merged.xlsx')
+    write_workbook(path, merged=True)
+    rows = load_plan_rows(path, keep_blank_phase=True, cache_dir=str(tmp_path / 'cache'))
+    assert [row.subject for row in rows] == [subject for _, _, subject, _ in ROWS]
+    assert [row.phase for row in rows] == ['الابتدائية (عام)', None, None, 'المتوسطة (عام)', None]
+    # الخيار جزء من مفتاح الذاكرة المؤقتة
+    assert len(load_plan_rows(path, cache_dir=str(tmp_path / 'cache'))) == 2
+
+
+def run_extractor(directory, merged):
+    write_workbook(str(directory / WORKBOOK), merged)
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    output = subprocess.run([sys.executable, os.path.join(ROOT, 'extract_study_plan.py')], cwd=str(directory),
+                            env=env, capture_output=True, text=True, check=True).stdout
+    return re.search(r"Extracted (\d+) subject entries across (\d+) keys", output).groups(), \
+        (directory / 'generated_templates_final.ts').read_text(encoding='utf-8')
+
+
+def test_extractor_forward_fills_merged_phase(tmp_path):
+    (tmp_path / 'merged').mkdir()
+    (tmp_path / 'filled').mkdir()
+    merged = run_extractor(tmp_path / 'merged', merged=True)
+    filled = run_extractor(tmp_path / 'filled', merged=False)
+    assert merged[0] == filled[0] == ('5', '2')
+    assert merged[1] == filled[1]
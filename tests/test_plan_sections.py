@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+from plan_sections import COLUMNS_4, classify_header, is_blank, segment_rows
+
+STAGE = ['المرحلة', 'الصف الدراسي', 'المادة الدراسية', 'عدد الحصص']
+HIGH = ['الصف الدراسي', 'الفصل', 'المادة الدراسية', 'عدد الحصص']
+DEPARTMENTS = ['المرحلة', 'القسم / المسار', 'الصف الدراسي', 'المادة الدراسية', 'عدد الحصص']
+
+
+def test_classify_header_schemas():
+    assert classify_header(STAGE) == ('stage', COLUMNS_4)
+    schema, columns = classify_header(HIGH)
+    assert schema == 'high' and (columns['phase'], columns['grade']) == (0, 1)
+    schema, columns = classify_header(DEPARTMENTS)
+    assert schema == 'departments' and columns == {'phase': 0, 'department': 1, 'grade': 2, 'subject': 3, 'periods': 4}
+
+
+def test_reordered_header_maps_by_label():
+    _, columns = classify_header(['المرحلة', 'عدد الحصص', 'المادة الدراسية', 'الصف الدراسي'])
+    assert (columns['periods'], columns['subject'], columns['grade']) == (1, 2, 3)
+
+
+def test_is_blank_covers_none_nan_and_spaces():
+    assert is_blank([None, float('nan'), '  '])
+    assert not is_blank([None, 0])
+
+
+def test_stacked_tables_are_split_at_headers_and_blanks():
+    rows = [
+        STAGE,
+        ['المتوسطة', 'الأول', 'الرياضيات', 6],
+        ['المتوسطة', 'الأول', 'العلوم', 4],
+        [None, None, None, None],
+        ['المتوسطة', 'الثاني', 'الرياضيات', 6],
+        HIGH,
+        ['الأول الثانوي', 'الأول', 'الرياضيات', 5],
+    ]
+    sections = segment_rows(enumerate(rows, start=1))
+    assert [(s.schema, s.header_row, s.start_row, s.end_row) for s in sections] == [
+        ('stage', 1, 2, 3),
+        ('stage', None, 5, 5),
+        ('high', 6, 7, 7),
+    ]
+
+
+def test_rows_before_any_header_use_four_columns():
+    sections = segment_rows([(1, ['المتوسطة', 'الأول', 'الرياضيات', 6])])
+    assert sections[0].columns == COLUMNS_4 and sections[0].header_row is None
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from plan_reader import PlanRow
+from plan_validation import ERROR, INFO, WARNING, format_json, format_table, load_rows, validate_rows
+
+
+def row(number, subject='الرياضيات', raw_periods=5, phase='المتوسطة', grade='الأول'):
+    periods = raw_periods if isinstance(raw_periods, int) and not isinstance(raw_periods, bool) else None
+    return PlanRow(number, phase, None, grade, subject, periods, raw_periods)
+
+
+def findings(report):
+    return [(d.row, d.rule, d.severity) for d in report.diagnostics]
+
+
+def test_clean_rows_pass():
+    report = validate_rows([row(2), row(3, 'العلوم', 4)])
+    assert report.ok and report.rows == 2 and report.diagnostics == []
+
+
+def test_each_rule_reports_its_row():
+    rows = [
+        row(2, phase=None),
+        row(3, subject=None),
+        row(4, 'اللغة العربية', raw_periods=None),
+        row(5, 'الاجتماعيات', raw_periods=0),
+        row(6, 'المهارات الحياتية', raw_periods='يحددها المستخدم بشكل يدوي'),
+        row(7, 'العلوم'),
+        row(8, 'العلوم'),
+    ]
+    report = validate_rows(rows)
+    assert findings(report) == [
+        (2, 'missing_phase', ERROR),
+        (3, 'missing_subject', ERROR),
+        (4, 'missing_periods', WARNING),
+        (5, 'invalid_periods', ERROR),
+        (6, 'manual_periods', INFO),
+        (8, 'duplicate_subject', WARNING),
+    ]
+    assert not report.ok
+
+
+def test_rule_selection_and_expected_row_count():
+    report = validate_rows([row(2, phase=None), row(3)], rule_ids=['duplicate_subject'], expected_rows=3)
+    assert findings(report) == [(None, 'row_count', ERROR)]
+    with pytest.raises(KeyError):
+        validate_rows([], rule_ids=['no_such_rule'])
+
+
+def test_report_formats():
+    report = validate_rows([row(2, raw_periods=None)])
+    data = json.loads(format_json(report, workbook='plans.xlsx'))
+    assert data['workbook'] == 'plans.xlsx' and data['summary'] == {ERROR: 0, WARNING: 1, INFO: 0}
+    assert 'missing_periods' in format_table(report)
+    assert 'missing_periods' not in format_table(report, min_severity=ERROR).splitlines()[0]
+
+
+def test_merged_phase_rows_are_filled_before_validation(tmp_path, monkeypatch):
+    openpyxl = pytest.importorskip('openpyxl')
+    monkeypatch.chdir(tmp_path)
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(['المرحلة', 'الصف الدراسي', 'المادة الدراسية', 'عدد الحصص'])
+    sheet.append([None, 'الأول', 'التجويد', 2])            # لا مرحلة فوقه
+    sheet.append(['المتوسطة', 'الأول', 'الرياضيات', 5])
+    sheet.append([None, None, 'العلوم', 4])                # تحت خلايا مدمجة
+    workbook.save('plans.xlsx')
+
+    rows = load_rows('plans.xlsx')
+    assert [(r.phase, r.grade) for r in rows[1:]] == [('المتوسطة', 'الأول')] * 2
+    report = validate_rows(rows, rule_ids=['missing_phase', 'missing_grade'])
+    assert findings(report) == [(2, 'missing_phase', ERROR)]
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from helpers import make_school
+from timetable_solver import solve, solve_many
+
+
+def test_best_of_parallel_starts():
+    data = make_school(classes=3)
+    best, stats = solve_many(data, starts=4, workers=2, time_limit=4, seed=10)
+    assert stats['completed'] + stats['skipped'] == 4
+    assert stats['bestScore'] == best.stats['score'] <= stats['worstScore']
+    assert best.unplaced == []
+
+
+def test_start_is_reproducible_by_seed():
+    data = make_school(classes=3)
+    first = solve(data, seed=7, time_limit=1)
+    assert solve(data, seed=7, time_limit=1).timetable == first.timetable
+    assert first.stats['seed'] == 7
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+from helpers import make_school
+from occupancy import split_key
+from swap_search import SwapSearch
+from timetable_solver import solve
+
+
+def solved_school():
+    data = make_school()
+    return data, solve(data, seed=1, time_limit=1).timetable
+
+
+def test_proposals_are_valid_and_apply_keeps_every_lesson():
+    data, timetable = solved_school()
+    search = SwapSearch(data, timetable)
+    key = next(iter(sorted(timetable)))
+    teacher_id, day, period = split_key(key)
+    target = next((d, p) for d in data['options']['activeDays'] for p in range(1, 8)
+                  if (d, p) != (day, period) and f"{teacher_id}-{d}-{p}" not in timetable)
+    proposals = search.propose(key, *target)
+    assert proposals
+    assert [len(proposal.moves) for proposal in proposals] == sorted(len(proposal.moves) for proposal in proposals)
+
+    result = search.apply(proposals[0])
+    assert len(result) == len(timetable)
+    assert f"{teacher_id}-{target[0]}-{target[1]}" in result
+    classes = [(entry['classId'], key.split('-', 1)[1]) for key, entry in result.items()]
+    assert len(set(classes)) == len(classes)
+
+
+def test_invalid_lessons_are_kept_and_block_their_slot():
+    data, timetable = solved_school()
+    # الحصة تصبح مستثناة لمعلمها بعد التوليد
+    key = next(key for key in sorted(timetable) if key.startswith('tmath-'))
+    _, day, period = split_key(key)
+    data['settings']['teacherConstraints'] = [{'teacherId': 'tmath', 'excludedSlots': {day: [period]}}]
+
+    search = SwapSearch(data, timetable)
+    assert search.invalid == [key]
+    assert search.timetable() == timetable
+
+    # لا يقترح نقل حصة أخرى لنفس الفصل إلى وقت الحصة غير الصالحة
+    class_id = timetable[key]['classId']
+    other = next(k for k, entry in sorted(timetable.items())
+                 if entry['classId'] == class_id and not k.startswith('tmath-'))
+    assert search.propose(other, day, period) == []
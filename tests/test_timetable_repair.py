@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from helpers import make_school
+from occupancy import split_key
+from timetable_repair import apply_delta, repair
+from timetable_solver import solve
+
+
+@pytest.fixture
+def school():
+    data = make_school(classes=3)
+    return data, solve(data, seed=0, time_limit=1).timetable
+
+
+def test_unchanged_input_keeps_every_lesson(school):
+    data, timetable = school
+    result = repair(data, timetable, seed=0)
+    assert result.timetable == timetable
+    assert result.removed == result.added == [] and result.unplaced == []
+
+
+def test_excluded_slot_moves_only_the_broken_lessons(school):
+    data, timetable = school
+    key = next(key for key in sorted(timetable) if key.startswith('tmath-'))
+    _, day, period = split_key(key)
+    edited = apply_delta(data, {'type': 'teacherConstraint',
+                                'constraint': {'teacherId': 'tmath', 'excludedSlots': {day: [period]}}})
+    result = repair(edited, timetable, seed=0)
+    assert result.unplaced == []
+    assert key not in result.timetable and len(result.timetable) == len(timetable)
+    assert result.stats['invalid'] == 1
+    # الحصص التي لم تنقل تبقى في أماكنها
+    assert result.stats['unchanged'] == len(timetable) - len(result.removed)
+    assert len(result.removed) == len(result.added) < len(timetable) // 2
+
+
+def test_remove_class_and_waiting_entries_are_kept(school):
+    data, timetable = school
+    waiting_key = next(f"tmath-{day}-{period}" for day in data['options']['activeDays'] for period in range(1, 8)
+                       if f"tmath-{day}-{period}" not in timetable)
+    current = dict(timetable, **{waiting_key: {'teacherId': 'tmath', 'type': 'waiting'}})
+    result = repair(apply_delta(data, [{'type': 'removeClass', 'classId': 'c0'}]), current, seed=0)
+    assert all(entry.get('classId') != 'c0' for entry in result.timetable.values())
+    assert result.timetable[waiting_key] == {'teacherId': 'tmath', 'type': 'waiting'}
+    assert len(result.removed) == sum(1 for entry in timetable.values() if entry['classId'] == 'c0')
+
+
+def test_unknown_delta_type():
+    with pytest.raises(ValueError):
+        apply_delta(make_school(), {'type': 'renameSchool'})
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+from helpers import make_school
+from occupancy import split_key
+from timetable_solver import Problem, Solver, count_violations, solve
+
+
+def teacher_slots(timetable, teacher_id):
+    return [split_key(key)[1:] for key, entry in timetable.items() if entry['teacherId'] == teacher_id]
+
+
+def test_solve_places_every_lesson_without_clashes():
+    data = make_school(classes=3)
+    solution = solve(data, seed=0, time_limit=1)
+    assert solution.unplaced == []
+    assert len(solution.timetable) == 3 * (5 + 4 + 6)
+    classes = [(entry['classId'], split_key(key)[1:]) for key, entry in solution.timetable.items()]
+    assert len(set(classes)) == len(classes)
+
+
+def test_daily_cap_spreads_over_available_days_only():
+    data = make_school(classes=3, subjects=(('math', 7),))
+    data['teachers'][0]['quotaLimit'] = 20
+    data['settings']['teacherConstraints'] = [{'teacherId': 'tmath', 'excludedSlots': {'sunday': list(range(1, 8))}}]
+    problem = Problem(data)
+    assert problem.teacher_daily_max[0] == [6] * 5
+
+    solution = solve(data, seed=0, time_limit=1, problem=problem)
+    assert solution.unplaced == []
+    assert all(day != 'sunday' for day, _ in teacher_slots(solution.timetable, 'tmath'))
+
+
+def test_daily_minimum_ignores_free_days():
+    data = make_school(classes=1, subjects=(('math', 2),))
+    data['settings']['teacherConstraints'] = [{'teacherId': 'tmath', 'dailyLimits': {
+        'sunday': {'min': 2}, 'monday': {'min': 2}}}]
+    problem = Problem(data)
+    solver = Solver(problem)
+    solver.place(0, problem.slot('sunday', 1))
+    solver.place(1, problem.slot('sunday', 2))
+    # الأحد مكتمل والإثنين خال: لا مخالفة في الطريقتين
+    assert solver.teacher_penalty(0) == 0
+    assert count_violations(problem, solver.grid()) == 0
+
+    solver.remove(1)
+    solver.place(1, problem.slot('monday', 1))
+    assert solver.teacher_penalty(0) > 0
+    assert count_violations(problem, solver.grid()) == 2
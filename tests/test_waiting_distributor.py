@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+from helpers import DAYS
+from waiting_distributor import distribute_waiting
+
+TEACHERS = [{'id': f"t{i}"} for i in range(4)]
+
+
+def lessons(teacher_id, slots):
+    return {f"{teacher_id}-{day}-{period}": {'teacherId': teacher_id, 'classId': 'c1', 'subjectId': 's1', 'type': 'lesson'}
+            for day, period in slots}
+
+
+def test_auto_without_active_days_returns():
+    result = distribute_waiting({}, [{'id': 't1'}], [], {'substitution': {'method': 'auto'}}, [], 7)
+    assert result.added == [] and result.stats['added'] == 0
+
+
+def test_auto_stops_when_quota_is_used():
+    settings = {'substitution': {'method': 'auto', 'maxTotalQuota': 3, 'maxDailyTotal': 1}}
+    result = distribute_waiting({}, TEACHERS, [], settings, DAYS, 7)
+    assert result.stats['added'] == 12
+    assert result.stats['minWaiting'] == result.stats['maxWaiting'] == 3
+
+
+def test_fixed_skips_busy_teachers_and_reports_shortage():
+    timetable = lessons('t0', [('sunday', 1), ('sunday', 2)])
+    settings = {'substitution': {'method': 'fixed', 'fixedPerPeriod': 4, 'maxDailyTotal': 7}}
+    result = distribute_waiting(timetable, TEACHERS, [], settings, ['sunday'], 3)
+    assert 't0-sunday-1' not in result.added and 't0-sunday-3' in result.added
+    assert result.shortages == [('sunday', 1, 1), ('sunday', 2, 1)]
+    assert all(result.timetable[key] == timetable[key] for key in timetable)
+
+
+def test_admin_waiting_quota_caps_their_duties():
+    admins = [{'id': 'a1', 'waitingQuota': 1}]
+    settings = {'substitution': {'method': 'fixed', 'fixedPerPeriod': 1}}
+    result = distribute_waiting({}, [], admins, settings, ['sunday'], 3)
+    assert result.added == ['a1-sunday-1']
+    assert result.stats['shortage'] == 2
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Incremental repair of an existing timetable after a small edit.
+
+The frontend can only regenerate from scratch. Here the current
+TimetableData is replayed onto the edited input (same JSON as
+timetable_solver.py). Every lesson that is still valid keeps its slot.
+Lessons that became invalid are ripped up: the slot is now excluded, the
+teacher changed, or the class or subject was removed. New lessons come
+from a new Assignment or a longer subject list. Both go to the
+min-conflicts repair of timetable_solver, which may only move lessons in a
+bounded neighbourhood: lessons of the same classes and teachers (radius
+1), then of the classes and teachers those share (radius 2), and so on.
+Everything outside the neighbourhood is left exactly as it was.
+
+A delta is applied to the input before repairing; several can be given:
+
+    {"type": "teacherConstraint", "constraint": TeacherConstraint}
+    {"type": "assignment", "assignment": Assignment}
+    {"type": "removeClass", "classId": "..."}
+    {"type": "classSubjects", "classId": "...", "subjectIds": [...]}
+
+    python timetable_repair.py input.json --delta edit.json -o timetable.json
+    python timetable_repair.py input.json --timetable current.json --delta edit.json
+
+Without --timetable the current timetable is input.settings.timetable.
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+from occupancy import split_key
+from timetable_solver import Problem, Solver, load_input, write_json
+
+DEFAULT_TIME_LIMIT = 0.5
+DEFAULT_MAX_RADIUS = 3
+
+
+class RepairResult(NamedTuple):
+    timetable: Dict[str, dict]
+    removed: List[str]             # مفاتيح حذفت أو تغير محتواها
+    added: List[str]               # مفاتيح جديدة أو تغير محتواها
+    unplaced: List[tuple]          # (classId, subjectId, teacherId)
+    stats: dict
+
+
+# ===== تطبيق التعديلات على المدخلات =====
+
+def _replace(items, item, same):
+    return [existing for existing in items if not same(existing)] + [item]
+
+
+def _teacher_constraint(data, delta):
+    settings = dict(data.get('settings') or {})
+    constraint = delta['constraint']
+    settings['teacherConstraints'] = _replace(
+        settings.get('teacherConstraints') or [], constraint,
+        lambda tc: tc['teacherId'] == constraint['teacherId'])
+    return dict(data, settings=settings)
+
+
+def _assignment(data, delta):
+    assignment = delta['assignment']
+    assignments = _replace(
+        data.get('assignments') or [], assignment,
+        lambda a: (a['classId'], a['subjectId']) == (assignment['classId'], assignment['subjectId']))
+    return dict(data, assignments=assignments)
+
+
+def _remove_class(data, delta):
+    class_id = delta['classId']
+    return dict(data,
+                classes=[cls for cls in data.get('classes') or [] if cls['id'] != class_id],
+                assignments=[a for a in data.get('assignments') or [] if a['classId'] != class_id])
+
+
+def _class_subjects(data, delta):
+    classes = [dict(cls, subjectIds=list(delta['subjectIds'])) if cls['id'] == delta['classId'] else cls
+               for cls in data.get('classes') or []]
+    return dict(data, classes=classes)
+
+
+DELTAS = {
+    'teacherConstraint': _teacher_constraint,
+    'assignment': _assignment,
+    'removeClass': _remove_class,
+    'classSubjects': _class_subjects,
+}
+
+
+def apply_delta(data, delta):
+    """Return a copy of the solver input with one delta (or a list of deltas) applied."""
+    for item in delta if isinstance(delta, list) else [delta]:
+        handler = DELTAS.get(item.get('type'))
+        if handler is None:
+            raise ValueError(f"نوع تعديل غير معروف: {item.get('type')!r} (المتاح: {', '.join(DELTAS)})")
+        data = handler(data, item)
+    return data
+
+
+# ===== الإصلاح =====
+
+def replay(solver, timetable):
+    """
+    Place the lessons of `timetable` that are still valid. Returns
+    (invalid lesson keys, other entries): waiting duties and other
+    non-lesson entries are carried over unchanged.
+    """
+    p = solver.p
+    by_ids = defaultdict(list)
+    for i, lesson in enumerate(p.lessons):
+        by_ids[p.lesson_ids(lesson)].append(i)
+
+    invalid, others = [], {}
+    for key, entry in timetable.items():
+        if entry.get('type', 'lesson') != 'lesson':
+            others[key] = entry
+            continue
+        teacher_id, day, period = split_key(key)
+        candidates = by_ids.get((entry.get('classId'), entry.get('subjectId'), teacher_id))
+        if not candidates or day not in p.day_index or not 1 <= period <= p.periods:
+            invalid.append(key)
+            continue
+        i = candidates.pop()
+        slot = p.slot(day, period)
+        if solver.domain(p.lessons[i]) >> slot & 1:
+            solver.place(i, slot)
+        else:
+            # الدرس باق لكن مكانه لم يعد صالحاً: يعاد توزيعه
+            candidates.append(i)
+            invalid.append(key)
+    return invalid, others
+
+
+def neighbourhood(solver, pending, radius):
+    """Placed lessons sharing a class or a teacher with `pending`, grown `radius` times."""
+    p = solver.p
+    classes = {p.lessons[i].cls for i in pending}
+    teachers = {p.lessons[i].teacher for i in pending}
+    movable = set()
+    for _ in range(radius):
+        movable = {i for i, slot in enumerate(solver.slot_of)
+                   if slot >= 0 and (p.lessons[i].cls in classes or p.lessons[i].teacher in teachers)}
+        classes |= {p.lessons[i].cls for i in movable}
+        teachers |= {p.lessons[i].teacher for i in movable}
+    return movable
+
+
+def repair(data, timetable, time_limit=DEFAULT_TIME_LIMIT, max_radius=DEFAULT_MAX_RADIUS, seed=None):
+    # type: (dict, Dict[str, dict], float, int, int) -> RepairResult
+    """Re-solve only what the edit broke; see the module docstring."""
+    started = time.perf_counter()
+    deadline = started + time_limit
+    problem = Problem(data)
+    solver = Solver(problem, seed)
+    invalid, others = replay(solver, timetable)
+    pending = [i for i, slot in enumerate(solver.slot_of) if slot < 0]
+    displaced = len(pending)
+
+    radius = 0
+    while pending and radius < max_radius and time.perf_counter() < deadline:
+        radius += 1
+        solver.movable = neighbourhood(solver, pending, radius) | set(pending)
+        # كل نطاق يأخذ حصته من الوقت المتبقي حتى لا يستهلك الأول كل الوقت
+        remaining = deadline - time.perf_counter()
+        pending = solver.repair(pending, time.perf_counter() + remaining / (max_radius - radius + 1))
+
+    new_timetable = solver.timetable()
+    for key, entry in others.items():
+        # انتظار في حصة أصبحت درساً يحذف
+        new_timetable.setdefault(key, entry)
+    removed = [key for key, entry in timetable.items() if new_timetable.get(key) != entry]
+    added = [key for key, entry in new_timetable.items() if timetable.get(key) != entry]
+
+    stats = {
+        'lessons': len(problem.lessons),
+        'invalid': len(invalid),
+        'displaced': displaced,
+        'radius': radius,
+        'unchanged': sum(1 for key, entry in new_timetable.items() if timetable.get(key) == entry),
+        'removed': len(removed),
+        'added': len(added),
+        'unplaced': len(pending),
+        'seconds': round(time.perf_counter() - started, 3),
+    }
+    return RepairResult(new_timetable, removed, added,
+                        [problem.lesson_ids(problem.lessons[i]) for i in pending], stats)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="إصلاح الجدول الحالي بعد تعديل صغير بدون إعادة التوليد")
+    parser.add_argument('input', help="ملف JSON بمدخلات generateSchedule بعد التعديل أو قبله مع --delta")
+    parser.add_argument('--timetable', help="الجدول الحالي (الافتراضي: settings.timetable في ملف المدخلات)")
+    parser.add_argument('--delta', action='append', default=[], help="ملف JSON بتعديل أو قائمة تعديلات")
+    parser.add_argument('-o', '--output', help="ملف TimetableData (الافتراضي: الطباعة)")
+    parser.add_argument('--time-limit', type=float, default=DEFAULT_TIME_LIMIT)
+    parser.add_argument('--max-radius', type=int, default=DEFAULT_MAX_RADIUS, help="أقصى اتساع لمنطقة الدروس القابلة للنقل")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    data = load_input(args.input)
+    current = load_input(args.timetable) if args.timetable else (data.get('settings') or {}).get('timetable') or {}
+    for path in args.delta:
+        data = apply_delta(data, load_input(path))
+
+    result = repair(data, current, args.time_limit, args.max_radius, args.seed)
+    write_json(result.timetable, args.output)
+    stats = result.stats
+    print(f"✓ بدون تغيير: {stats['unchanged']} | غير صالحة: {stats['invalid']} | محذوفة: {stats['removed']} | "
+          f"مضافة: {stats['added']} | غير موزعة: {stats['unplaced']} | النطاق: {stats['radius']} | "
+          f"{stats['seconds']} ث", file=sys.stderr)
+    for class_id, subject_id, teacher_id in result.unplaced[:20]:
+        print(f"  ✗ الفصل {class_id} | المادة {subject_id} | المعلم {teacher_id}", file=sys.stderr)
+    sys.exit(0 if not result.unplaced else 2)
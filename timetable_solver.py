@@ -0,0 +1,678 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Headless timetable solver with the same input and output as generateSchedule()
+(utils/scheduleGenerator.ts).
+
+Input is one JSON object holding generateSchedule's arguments:
+
+    {
+      "teachers": [Teacher], "subjects": [Subject], "classes": [ClassInfo],
+      "settings": ScheduleSettingsData,
+      "options": {"activeDays": [...], "periodsPerDay": 7, "weekDays": 5},
+      "assignments": [Assignment],
+      "isBypassingConflicts": false,
+      "existingTimetable": TimetableData
+    }
+
+and the result is TimetableData keyed `${teacherId}-${day}-${period}`.
+
+The same rules decide which subjects a class takes and which teacher
+teaches them (an Assignment per class and subject, no fallback teacher).
+Instead of filling the slots once in random order, every lesson is a
+variable whose domain is a bitset of slots. Teacher and class occupancy are
+also bitsets, one integer per teacher and per class with bit
+`day * periodsPerDay + period - 1`, so "is this slot free for both" is one
+AND. The most constrained lessons are placed first. Lessons that do not fit
+are then placed by ejecting the lessons that block them (min-conflicts with a
+tabu list). The best state seen is kept, so a longer --time-limit can only
+reduce the number of unplaced lessons.
+
+--starts N runs N randomized solves in a process pool within the one
+--time-limit budget. Each result is scored on unplaced lessons, teacher
+constraint violations (dailyLimits, maxFirstPeriods/maxLastPeriods,
+maxConsecutive) and teacher gaps, and the best is written.
+
+    python timetable_solver.py input.json -o timetable.json --time-limit 5
+    python timetable_solver.py input.json -o timetable.json --starts 16 -j 8 --time-limit 20
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from occupancy import OccupancyGrid, slot_key
+
+DEFAULT_QUOTA = 24     # كما في scheduleGenerator.ts: t.quotaLimit || 24
+
+# أوزان المقارنة بين الحلول: درس غير موزع أسوأ من أي عدد معقول من المخالفات والفجوات
+UNFILLED_WEIGHT = 1000
+VIOLATION_WEIGHT = 10
+GAP_WEIGHT = 1
+
+
+class Lesson(NamedTuple):
+    cls: int               # فهرس الفصل في Problem.classes
+    subject: str
+    teacher: int           # فهرس المعلم في Problem.teachers
+
+
+class Score(NamedTuple):
+    unfilled: int          # دروس لم توزع
+    violations: int        # الحدود اليومية، الحصص الأولى/الأخيرة، التتابع
+    gaps: int              # فراغات بين حصص المعلم في اليوم
+
+    @property
+    def total(self):
+        return UNFILLED_WEIGHT * self.unfilled + VIOLATION_WEIGHT * self.violations + GAP_WEIGHT * self.gaps
+
+
+class Solution(NamedTuple):
+    timetable: Dict[str, dict]
+    unplaced: List[tuple]          # (classId, subjectId, teacherId)
+    stats: dict
+
+
+def daily_limit_violations(load, limit, periods):
+    # اليوم الخالي من الحصص لا يعد أقل من الحد الأدنى
+    return (load > (limit.get('max') or periods)) + (0 < load < (limit.get('min') or 0))
+
+
+def max_daily_for_subject(periods, week_days):
+    # getMaxDailyPeriodsForSubject، مع رفعه إذا كان النصاب لا يتسع في حصتين يومياً
+    return max(1 if periods <= week_days else 2, math.ceil(periods / max(week_days, 1)))
+
+
+class Problem:
+    """Indexed, read-only view of one generateSchedule() input."""
+
+    def __init__(self, data):
+        options = data.get('options') or {}
+        settings = data.get('settings') or {}
+        self.days = list(options.get('activeDays') or [])
+        self.periods = int(options.get('periodsPerDay') or 0)
+        self.week_days = int(options.get('weekDays') or len(self.days))
+        self.bypass = bool(data.get('isBypassingConflicts'))
+        self.n_slots = len(self.days) * self.periods
+        self.day_index = {day: d for d, day in enumerate(self.days)}
+        self.day_masks = [((1 << self.periods) - 1) << (d * self.periods) for d in range(len(self.days))]
+
+        self.teachers = list(data.get('teachers') or [])
+        self.classes = list(data.get('classes') or [])
+        self.subjects = {subject['id']: subject for subject in data.get('subjects') or []}
+        self.teacher_index = {teacher['id']: t for t, teacher in enumerate(self.teachers)}
+        self.class_index = {cls['id']: c for c, cls in enumerate(self.classes)}
+
+        assignments = data.get('assignments') or []
+        # آخر إسناد يغلب كما في Map.set
+        teacher_for = {(a['classId'], a['subjectId']): a['teacherId'] for a in assignments}
+        assigned_subjects = defaultdict(set)
+        for a in assignments:
+            assigned_subjects[a['classId']].add(a['subjectId'])
+
+        self.class_open = [self._class_open(cls) for cls in self.classes]
+        self.lessons = []
+        self.unassigned = []       # (classId, subjectId): مادة بلا معلم مسند
+        for c, cls in enumerate(self.classes):
+            for subject in self._class_subjects(cls, assigned_subjects[cls['id']]):
+                teacher = self.teacher_index.get(teacher_for.get((cls['id'], subject['id'])))
+                if teacher is None:
+                    self.unassigned.append((cls['id'], subject['id']))
+                    continue
+                periods = int(subject.get('periodsPerClass') or 0)
+                self.lessons.extend(Lesson(c, subject['id'], teacher) for _ in range(periods))
+
+        constraints = {tc['teacherId']: tc for tc in settings.get('teacherConstraints') or []}
+        blocked = self._blocked_grid(settings, data.get('existingTimetable') or {})
+        teacher_load = defaultdict(int)
+        for lesson in self.lessons:
+            teacher_load[lesson.teacher] += 1
+
+        self.teacher_allowed = []
+        self.teacher_daily_max = []
+        self.teacher_constraints = [constraints.get(teacher['id']) for teacher in self.teachers]
+        for t, teacher in enumerate(self.teachers):
+            constraint = self.teacher_constraints[t]
+            self.teacher_allowed.append(self._teacher_allowed(constraint) & ~blocked.week_mask(teacher_id=teacher['id']))
+            self.teacher_daily_max.append(self._teacher_daily_max(teacher, constraint, teacher_load[t], self.teacher_allowed[t]))
+
+        self.subject_allowed = {}
+        self.subject_double = set()
+        self.subject_preferred = {}
+        subject_constraints = {sc['subjectId']: sc for sc in settings.get('subjectConstraints') or []}
+        for subject_id in self.subjects:
+            sc = subject_constraints.get(subject_id) or {}
+            self.subject_allowed[subject_id] = self._period_mask(
+                [p for p in range(1, self.periods + 1) if p not in (sc.get('excludedPeriods') or [])])
+            self.subject_preferred[subject_id] = self._period_mask(sc.get('preferredPeriods') or [])
+            if sc.get('enableDoublePeriods'):
+                self.subject_double.add(subject_id)
+        self.subject_daily_max = {
+            subject_id: max_daily_for_subject(int(subject.get('periodsPerClass') or 0), self.week_days)
+            for subject_id, subject in self.subjects.items()
+        }
+
+    def lesson_ids(self, lesson):
+        return self.classes[lesson.cls]['id'], lesson.subject, self.teachers[lesson.teacher]['id']
+
+    def slot(self, day, period):
+        return self.day_index[day] * self.periods + period - 1
+
+    def slot_day_period(self, slot):
+        return self.days[slot // self.periods], slot % self.periods + 1
+
+    def _period_mask(self, periods):
+        # نفس الحصص في كل الأيام
+        mask = 0
+        for period in periods:
+            if 1 <= period <= self.periods:
+                for d in range(len(self.days)):
+                    mask |= 1 << (d * self.periods + period - 1)
+        return mask
+
+    def _class_open(self, cls):
+        counts = cls.get('customPeriodCounts') or {}
+        mask = 0
+        for d, day in enumerate(self.days):
+            count = min(int(counts.get(day, self.periods)), self.periods)
+            mask |= ((1 << count) - 1) << (d * self.periods)
+        return mask
+
+    def _class_subjects(self, cls, assigned):
+        # نفس ترتيب الأولوية في generateSchedule: subjectIds ثم المرحلة/الصف مع المواد المسندة
+        subjects = list(self.subjects.values())
+        if cls.get('subjectIds'):
+            wanted = set(cls['subjectIds'])
+            return [s for s in subjects if s['id'] in wanted]
+        valid = [s for s in subjects
+                 if cls.get('phase') in (s.get('phases') or [])
+                 and (not s.get('targetGrades') or cls.get('grade') in s['targetGrades'])]
+        seen = {s['id'] for s in valid}
+        valid += [s for s in subjects if s['id'] in assigned and s['id'] not in seen]
+        return valid
+
+    def _blocked_grid(self, settings, existing):
+        """Teacher slots taken by the existing timetable or by meetings."""
+        grid = OccupancyGrid.from_timetable(existing, self.days, self.periods,
+                                            teacher_ids=[teacher['id'] for teacher in self.teachers])
+        for meeting in settings.get('meetings') or []:
+            if meeting.get('day') in self.day_index and 1 <= meeting.get('period', 0) <= self.periods:
+                for teacher_id in meeting.get('teacherIds') or []:
+                    if teacher_id in grid.teacher_index:
+                        grid.occupy(teacher_id, meeting['day'], meeting['period'])
+        return grid
+
+    def _teacher_allowed(self, constraint):
+        allowed = (1 << self.n_slots) - 1
+        if constraint is None or self.bypass:
+            # تجاوز التعارضات يتجاهل الحصص المستثناة كما في scheduleGenerator.ts
+            return allowed
+        for day, periods in (constraint.get('excludedSlots') or {}).items():
+            if day in self.day_index:
+                for period in periods:
+                    if 1 <= period <= self.periods:
+                        allowed &= ~(1 << self.slot(day, period))
+        if constraint.get('earlyExitMode') != 'auto':
+            for day, last in (constraint.get('earlyExit') or {}).items():
+                if day in self.day_index and last < self.periods:
+                    d = self.day_index[day]
+                    allowed &= ~((((1 << self.periods) - 1) >> last << last) << (d * self.periods))
+        return allowed
+
+    def _teacher_daily_max(self, teacher, constraint, lessons, allowed):
+        if self.bypass:
+            return [self.periods] * len(self.days)
+        # التوزيع المتوازن: ceil(النصاب / عدد الأيام المتاحة للمعلم)، ولا يقل عن ما تحتاجه حصصه المسندة فعلاً
+        days = max(sum(1 for day_bits in self.day_masks if allowed & day_bits), 1)
+        balanced = max(math.ceil((teacher.get('quotaLimit') or DEFAULT_QUOTA) / days), math.ceil(lessons / days))
+        limits = (constraint or {}).get('dailyLimits') or {}
+        return [min(balanced, limits[day]['max']) if day in limits and limits[day].get('max') else balanced
+                for day in self.days]
+
+
+class Solver:
+    """Mutable placement state over a Problem; all occupancy is integer bitsets."""
+
+    def __init__(self, problem, seed=None):
+        self.p = problem
+        self.rng = random.Random(seed)
+        self.slot_of = [-1] * len(problem.lessons)
+        self.teacher_busy = [0] * len(problem.teachers)
+        self.class_busy = [0] * len(problem.classes)
+        self.class_subject = defaultdict(int)      # (class, subject) -> mask
+        self.at_class = {}                         # (class, slot) -> lesson
+        self.at_teacher = {}                       # (teacher, slot) -> lesson
+        self.movable = None                        # الدروس التي يجوز إخراجها؛ None = الكل
+
+    # ---- state ----
+
+    def place(self, i, slot):
+        lesson = self.p.lessons[i]
+        bit = 1 << slot
+        self.slot_of[i] = slot
+        self.teacher_busy[lesson.teacher] |= bit
+        self.class_busy[lesson.cls] |= bit
+        self.class_subject[lesson.cls, lesson.subject] |= bit
+        self.at_class[lesson.cls, slot] = i
+        self.at_teacher[lesson.teacher, slot] = i
+
+    def remove(self, i):
+        lesson = self.p.lessons[i]
+        slot = self.slot_of[i]
+        bit = ~(1 << slot)
+        self.slot_of[i] = -1
+        self.teacher_busy[lesson.teacher] &= bit
+        self.class_busy[lesson.cls] &= bit
+        self.class_subject[lesson.cls, lesson.subject] &= bit
+        del self.at_class[lesson.cls, slot]
+        del self.at_teacher[lesson.teacher, slot]
+
+    def restore(self, slots):
+        for i, slot in enumerate(self.slot_of):
+            if slot >= 0:
+                self.remove(i)
+        for i, slot in enumerate(slots):
+            if slot >= 0:
+                self.place(i, slot)
+
+    # ---- domains ----
+
+    def static_domain(self, lesson):
+        p = self.p
+        return p.class_open[lesson.cls] & p.teacher_allowed[lesson.teacher] & p.subject_allowed[lesson.subject]
+
+    def day_mask(self, lesson):
+        """Days on which the teacher's and the subject's daily limits still allow one more lesson."""
+        p = self.p
+        teacher_busy = self.teacher_busy[lesson.teacher]
+        subject_busy = self.class_subject[lesson.cls, lesson.subject]
+        limits = p.teacher_daily_max[lesson.teacher]
+        subject_max = p.subject_daily_max[lesson.subject]
+        mask = 0
+        for d, day_bits in enumerate(p.day_masks):
+            if (teacher_busy & day_bits).bit_count() < limits[d] and (subject_busy & day_bits).bit_count() < subject_max:
+                mask |= day_bits
+        return mask
+
+    def domain(self, lesson):
+        free = ~(self.teacher_busy[lesson.teacher] | self.class_busy[lesson.cls])
+        return self.static_domain(lesson) & free & self.day_mask(lesson)
+
+    def score(self, lesson, slot):
+        """Lower is better: spread a subject over the week, keep teachers' days compact."""
+        p = self.p
+        day_bits = p.day_masks[slot // p.periods]
+        same_day = (self.class_subject[lesson.cls, lesson.subject] & day_bits).bit_count()
+        neighbours = ((1 << slot + 1) | (1 << slot >> 1)) & day_bits
+        score = 4 * same_day + (self.teacher_busy[lesson.teacher] & day_bits).bit_count()
+        if lesson.subject in p.subject_double and self.class_subject[lesson.cls, lesson.subject] & neighbours:
+            score -= 6
+        if self.teacher_busy[lesson.teacher] & neighbours:
+            score -= 1
+        if p.subject_preferred[lesson.subject] >> slot & 1:
+            score -= 3
+        return score + self.rng.random()
+
+    def teacher_penalty(self, t):
+        """
+        VIOLATION_WEIGHT * violations + GAP_WEIGHT * gaps for one teacher,
+        the per-teacher form of count_violations() for scoring single moves.
+        """
+        p = self.p
+        constraint = p.teacher_constraints[t] or {}
+        limits = constraint.get('dailyLimits') or {}
+        run_limit = constraint.get('maxConsecutive') or p.periods
+        busy = self.teacher_busy[t]
+        full = (1 << p.periods) - 1
+        violations = gaps = first = last = 0
+        for d, day in enumerate(p.days):
+            word = busy >> (d * p.periods) & full
+            if not word:
+                continue
+            load = word.bit_count()
+            gaps += word.bit_length() - (word & -word).bit_length() + 1 - load
+            first += word & 1
+            last += word >> (p.periods - 1) & 1
+            run = word
+            for shift in range(1, run_limit + 1):
+                run &= word >> shift
+            violations += run != 0
+            if day in limits:
+                violations += daily_limit_violations(load, limits[day], p.periods)
+        if constraint.get('maxFirstPeriods') is not None:
+            violations += max(0, first - constraint['maxFirstPeriods'])
+        if constraint.get('maxLastPeriods') is not None:
+            violations += max(0, last - constraint['maxLastPeriods'])
+        return VIOLATION_WEIGHT * violations + GAP_WEIGHT * gaps
+
+    def best_slot(self, i, mask):
+        lesson = self.p.lessons[i]
+        best, best_score = -1, None
+        while mask:
+            low = mask & -mask
+            slot = low.bit_length() - 1
+            mask ^= low
+            score = self.score(lesson, slot)
+            if best_score is None or score < best_score:
+                best, best_score = slot, score
+        return best
+
+    # ---- search ----
+
+    def construct(self):
+        """Place the most constrained lessons first; return the unplaced lesson indexes."""
+        p = self.p
+        teacher_lessons = defaultdict(int)
+        for lesson in p.lessons:
+            teacher_lessons[lesson.teacher] += 1
+
+        def tightness(i):
+            lesson = p.lessons[i]
+            return self.static_domain(lesson).bit_count() - teacher_lessons[lesson.teacher], self.rng.random()
+
+        unplaced = []
+        for i in sorted(range(len(p.lessons)), key=tightness):
+            slot = self.best_slot(i, self.domain(p.lessons[i]))
+            if slot >= 0:
+                self.place(i, slot)
+            else:
+                unplaced.append(i)
+        return unplaced
+
+    def repair(self, unplaced, deadline, tabu_tenure=20, max_iterations=None):
+        """
+        Min-conflicts: put an unplaced lesson in a slot of its static domain,
+        ejecting the class's and the teacher's lesson in that slot, then try to
+        re-place the ejected lessons directly. Recently moved lessons are tabu.
+        Returns the best (fewest unplaced) list found; the state is left there.
+        """
+        p = self.p
+        best_slots, best_unplaced = list(self.slot_of), list(unplaced)
+        moved_at = defaultdict(lambda: -tabu_tenure - 1)
+        pending = list(unplaced)
+        iteration = stalled = 0
+
+        while pending and stalled <= len(pending) and time.perf_counter() < deadline:
+            if max_iterations is not None and iteration >= max_iterations:
+                break
+            if all(self.class_busy[p.lessons[j].cls] == p.class_open[p.lessons[j].cls] for j in pending):
+                # كل الدروس المعلقة لفصول ممتلئة: أي نقل يبدل درساً بدرس
+                break
+            iteration += 1
+            i = pending.pop(self.rng.randrange(len(pending)))
+            lesson = p.lessons[i]
+
+            slot = self.best_slot(i, self.domain(lesson))
+            if slot < 0:
+                slot = self.ejection_slot(i, self.static_domain(lesson), moved_at, iteration, tabu_tenure)
+                if slot < 0:
+                    pending.append(i)
+                    stalled += 1
+                    continue
+                for j in self.blockers(lesson, slot):
+                    self.remove(j)
+                    moved_at[j] = iteration
+                    pending.append(j)
+
+            self.place(i, slot)
+            moved_at[i] = iteration
+            stalled = 0
+            # إعادة الدروس المخرجة مباشرة إن وجدت مكاناً
+            for j in list(pending):
+                free = self.best_slot(j, self.domain(p.lessons[j]))
+                if free >= 0:
+                    self.place(j, free)
+                    pending.remove(j)
+
+            if len(pending) < len(best_unplaced):
+                best_slots, best_unplaced = list(self.slot_of), list(pending)
+
+        if len(pending) > len(best_unplaced):
+            self.restore(best_slots)
+            return best_unplaced
+        return pending
+
+    def blockers(self, lesson, slot):
+        """
+        Lessons that must leave before `lesson` fits in `slot`: the class's and
+        the teacher's lesson in that slot, plus one lesson of the same day when
+        the subject's or the teacher's daily limit is already reached.
+        """
+        p = self.p
+        found = {self.at_class.get((lesson.cls, slot)), self.at_teacher.get((lesson.teacher, slot))} - {None}
+        day_bits = p.day_masks[slot // p.periods]
+        freed = 0
+        for j in found:
+            freed |= 1 << self.slot_of[j]
+
+        subject_day = self.class_subject[lesson.cls, lesson.subject] & day_bits & ~freed
+        if subject_day.bit_count() >= p.subject_daily_max[lesson.subject]:
+            extra = subject_day.bit_length() - 1
+            found.add(self.at_class[lesson.cls, extra])
+            freed |= 1 << extra
+
+        teacher_day = self.teacher_busy[lesson.teacher] & day_bits & ~freed
+        if teacher_day.bit_count() >= p.teacher_daily_max[lesson.teacher][slot // p.periods]:
+            found.add(self.at_teacher[lesson.teacher, teacher_day.bit_length() - 1])
+        return found
+
+    def ejection_slot(self, i, candidates, moved_at, iteration, tabu_tenure):
+        """Slot in `candidates` whose blocking lessons are fewest, movable and not tabu, or -1."""
+        lesson = self.p.lessons[i]
+        best, best_cost = -1, None
+        while candidates:
+            low = candidates & -candidates
+            slot = low.bit_length() - 1
+            candidates ^= low
+            blockers = self.blockers(lesson, slot)
+            if any(iteration - moved_at[j] <= tabu_tenure for j in blockers):
+                continue
+            if self.movable is not None and not blockers <= self.movable:
+                continue
+            cost = len(blockers) + self.rng.random()
+            if best_cost is None or cost < best_cost:
+                best, best_cost = slot, cost
+        return best
+
+    def timetable(self):
+        p = self.p
+        result = {}
+        for i, slot in enumerate(self.slot_of):
+            if slot < 0:
+                continue
+            lesson = p.lessons[i]
+            teacher_id = p.teachers[lesson.teacher]['id']
+            day, period = p.slot_day_period(slot)
+            result[slot_key(teacher_id, day, period)] = {
+                'teacherId': teacher_id,
+                'subjectId': lesson.subject,
+                'classId': p.classes[lesson.cls]['id'],
+                'type': 'lesson',
+            }
+        return result
+
+    def grid(self):
+        """The current placement as an OccupancyGrid (lessons only)."""
+        p = self.p
+        grid = OccupancyGrid([teacher['id'] for teacher in p.teachers], [cls['id'] for cls in p.classes],
+                             p.days, p.periods)
+        for i, slot in enumerate(self.slot_of):
+            if slot >= 0:
+                lesson = p.lessons[i]
+                day, period = p.slot_day_period(slot)
+                grid.occupy(p.teachers[lesson.teacher]['id'], day, period, p.classes[lesson.cls]['id'])
+        return grid
+
+
+def count_violations(problem, grid):
+    """
+    Teacher-constraint violations in a placement: days above dailyLimits.max
+    or below .min (a day without lessons is not below it), first/last periods above maxFirstPeriods/maxLastPeriods,
+    and days with a run longer than maxConsecutive.
+    """
+    loads = grid.teacher_daily_load()
+    first = grid.edge_load(1)
+    last = grid.edge_load(problem.periods)
+    consecutive = [problem.periods] * len(problem.teachers)
+    violations = 0
+    for t, constraint in enumerate(problem.teacher_constraints):
+        if not constraint:
+            continue
+        for day, limit in (constraint.get('dailyLimits') or {}).items():
+            d = problem.day_index.get(day)
+            if d is None:
+                continue
+            violations += daily_limit_violations(int(loads[t, d]), limit, problem.periods)
+        if constraint.get('maxFirstPeriods') is not None:
+            violations += max(0, int(first[t]) - constraint['maxFirstPeriods'])
+        if constraint.get('maxLastPeriods') is not None:
+            violations += max(0, int(last[t]) - constraint['maxLastPeriods'])
+        if constraint.get('maxConsecutive'):
+            consecutive[t] = constraint['maxConsecutive']
+    return violations + int(grid.runs_over(consecutive).sum())
+
+
+def score_solution(problem, grid, unplaced):
+    return Score(unplaced, count_violations(problem, grid), int(grid.gaps().sum()))
+
+
+def solve(data, seed=None, time_limit=5.0, problem=None):
+    # type: (dict, Optional[int], float, Optional[Problem]) -> Solution
+    """Build a timetable for one generateSchedule() input."""
+    started = time.perf_counter()
+    problem = problem or Problem(data)
+    solver = Solver(problem, seed)
+    unplaced = solver.construct()
+    constructed = len(unplaced)
+    if unplaced:
+        unplaced = solver.repair(unplaced, started + time_limit)
+
+    open_slots = sum(mask.bit_count() for mask in problem.class_open)
+    grid = solver.grid()
+    score = score_solution(problem, grid, len(unplaced))
+    stats = {
+        'lessons': len(problem.lessons),
+        'placed': len(problem.lessons) - len(unplaced),
+        'unplaced': len(unplaced),
+        'unplacedAfterConstruction': constructed,
+        'unassignedSubjects': len(problem.unassigned),
+        'emptyClassSlots': open_slots - (len(problem.lessons) - len(unplaced)),
+        'teacherGaps': score.gaps,
+        'violations': score.violations,
+        'score': score.total,
+        'maxTeacherDailyLoad': int(grid.teacher_daily_load().max(initial=0)),
+        'seed': seed,
+        'seconds': round(time.perf_counter() - started, 3),
+    }
+    return Solution(solver.timetable(), [problem.lesson_ids(problem.lessons[i]) for i in unplaced], stats)
+
+
+# ===== عدة بدايات عشوائية متوازية =====
+
+_worker_problem = None
+
+
+def _init_worker(data):
+    # تبنى المسألة مرة واحدة لكل عملية، لا لكل بداية
+    global _worker_problem
+    _worker_problem = Problem(data)
+
+
+def _run_start(seed, deadline, per_start):
+    remaining = min(deadline - time.time(), per_start)
+    if remaining <= 0:
+        return seed, None
+    return seed, solve(None, seed, remaining, problem=_worker_problem)
+
+
+def solve_many(data, starts=8, workers=None, time_limit=10.0, seed=0):
+    # type: (dict, int, Optional[int], float, int) -> Tuple[Solution, dict]
+    """
+    Run `starts` independent randomized solves (seeds seed .. seed+starts-1)
+    in a process pool sharing one wall-clock budget, and return the best
+    solution by Score.total with statistics over all starts. The budget is
+    split evenly between the rounds of starts (starts / workers); a start
+    that begins after the budget is spent is skipped.
+    """
+    started = time.perf_counter()
+    deadline = time.time() + time_limit
+    workers = workers or os.cpu_count() or 1
+    per_start = time_limit / math.ceil(starts / workers)
+    solutions = []
+    skipped = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data,)) as pool:
+        futures = [pool.submit(_run_start, seed + k, deadline, per_start) for k in range(starts)]
+        for future in as_completed(futures):
+            start_seed, solution = future.result()
+            if solution is None:
+                skipped += 1
+            else:
+                solutions.append(solution)
+
+    if not solutions:
+        raise TimeoutError("انتهى الوقت قبل اكتمال أي محاولة")
+    solutions.sort(key=lambda solution: (solution.stats['score'], solution.stats['seed']))
+    scores = [solution.stats['score'] for solution in solutions]
+    stats = {
+        'starts': starts,
+        'completed': len(solutions),
+        'skipped': skipped,
+        'bestSeed': solutions[0].stats['seed'],
+        'bestScore': scores[0],
+        'worstScore': scores[-1],
+        'meanScore': round(sum(scores) / len(scores), 1),
+        'unplaced': [solution.stats['unplaced'] for solution in solutions],
+        'seconds': round(time.perf_counter() - started, 3),
+    }
+    return solutions[0], stats
+
+
+def load_input(path):
+    if path == '-':
+        return json.load(sys.stdin)
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json(data, path):
+    if not path or path == '-':
+        json.dump(data, sys.stdout, ensure_ascii=False)
+        sys.stdout.write('\n')
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="توليد الجدول المدرسي بدون واجهة (نفس مدخلات generateSchedule)")
+    parser.add_argument('input', help="ملف JSON بمدخلات generateSchedule، أو - للقراءة من stdin")
+    parser.add_argument('-o', '--output', help="ملف TimetableData (الافتراضي: الطباعة)")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--time-limit', type=float, default=5.0, help="الحد الأقصى بالثواني لمرحلة الإصلاح")
+    parser.add_argument('--starts', type=int, default=1, help="عدد البدايات العشوائية المتوازية (يختار أفضلها)")
+    parser.add_argument('-j', '--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    data = load_input(args.input)
+    if args.starts > 1:
+        solution, runs = solve_many(data, args.starts, args.workers, args.time_limit, args.seed or 0)
+        print(f"✓ {runs['completed']}/{runs['starts']} محاولة | أفضل نتيجة: {runs['bestScore']} "
+              f"(البذرة {runs['bestSeed']}) | المتوسط: {runs['meanScore']} | أسوأ: {runs['worstScore']} | "
+              f"{runs['seconds']} ث", file=sys.stderr)
+    else:
+        solution = solve(data, args.seed, args.time_limit)
+    write_json(solution.timetable, args.output)
+    stats = solution.stats
+    print(f"✓ {stats['placed']}/{stats['lessons']} حصة | غير موزعة: {stats['unplaced']} | "
+          f"مواد بلا معلم: {stats['unassignedSubjects']} | فجوات المعلمين: {stats['teacherGaps']} | "
+          f"مخالفات: {stats['violations']} | {stats['seconds']} ث", file=sys.stderr)
+    for class_id, subject_id, teacher_id in solution.unplaced[:20]:
+        print(f"  ✗ الفصل {class_id} | المادة {subject_id} | المعلم {teacher_id}", file=sys.stderr)
+    sys.exit(0 if not solution.unplaced else 2)
@@ -2,6 +2,7 @@
 // Validation, deadlock detection, and distribution logic
 
 import { Subject, Teacher, SubjectConstraint, TeacherConstraint, ScheduleSettingsData, SharedSchool } from '../types';
+import { STUDY_PLAN_STATS, PLAN_STATS_WEEK_DAYS } from '../study_plan_stats';
 
 export interface ValidationWarning {
   id: string;
@@ -27,21 +28,34 @@ const getDayArabic = (day: string) => {
 
 // ======== Subject Auto-Constraints ========
 
-export function getMaxDailyPeriodsForSubject(periodsPerClass: number, weekDays: number): number {
+// مواد الخطط الدراسية تقرأ من الجدول المحسوب مسبقاً (study_plan_stats.ts)،
+// وتحسب مباشرة إذا عُدّل نصابها أو اختلف عدد أيام الأسبوع أو لم تكن من خطة
+function lookupPlanStats(subjectId: string | undefined, periodsPerClass: number, weekDays: number) {
+  if (!subjectId || weekDays !== PLAN_STATS_WEEK_DAYS) return undefined;
+  const split = subjectId.lastIndexOf('_');
+  const row = STUDY_PLAN_STATS[subjectId.slice(0, split)]?.subjects[subjectId.slice(split + 1)];
+  return row && row[0] === periodsPerClass ? row : undefined;
+}
+
+export function getMaxDailyPeriodsForSubject(periodsPerClass: number, weekDays: number, subjectId?: string): number {
+  const stats = lookupPlanStats(subjectId, periodsPerClass, weekDays);
+  if (stats) return stats[3];
   return periodsPerClass <= weekDays ? 1 : 2;
 }
 
 export const MAX_SAME_SLOT_PER_WEEK = 2;
 
-export function calculateQuotaDistribution(periodsPerClass: number, weekDays: number): { singleDays: number; doubleDays: number } {
+export function calculateQuotaDistribution(periodsPerClass: number, weekDays: number, subjectId?: string): { singleDays: number; doubleDays: number } {
+  const stats = lookupPlanStats(subjectId, periodsPerClass, weekDays);
+  if (stats) return { singleDays: stats[1], doubleDays: stats[2] };
   if (periodsPerClass <= weekDays) return { singleDays: periodsPerClass, doubleDays: 0 };
   const doubleDays = periodsPerClass - weekDays;
   const singleDays = weekDays - doubleDays;
   return { singleDays: Math.max(0, singleDays), doubleDays: Math.max(0, doubleDays) };
 }
 
-export function describeDistribution(periodsPerClass: number, weekDays: number): string {
-  const { singleDays, doubleDays } = calculateQuotaDistribution(periodsPerClass, weekDays);
+export function describeDistribution(periodsPerClass: number, weekDays: number, subjectId?: string): string {
+  const { singleDays, doubleDays } = calculateQuotaDistribution(periodsPerClass, weekDays, subjectId);
   if (doubleDays === 0) return `${singleDays} أيام × حصة واحدة`;
   const parts: string[] = [];
   if (singleDays > 0) parts.push(`${singleDays} ${singleDays === 1 ? 'يوم' : 'أيام'} × 1`);
@@ -78,7 +92,7 @@ export function validateAllConstraints(
     const subject = subjects.find(s => s.id === sc.subjectId);
     if (!subject) continue;
     const availableSlots = periodsPerDay - sc.excludedPeriods.length;
-    const maxDaily = getMaxDailyPeriodsForSubject(subject.periodsPerClass, weekDays);
+    const maxDaily = getMaxDailyPeriodsForSubject(subject.periodsPerClass, weekDays, subject.id);
     if (availableSlots < maxDaily) {
       warnings.push({
         id: `subj-excl-${sc.subjectId}`, level: 'error',
@@ -0,0 +1,67 @@
+// مولد تلقائياً من specialization_rules.json بواسطة: python specializations.py
+// لا تعدل هذا الملف يدوياً، عدّل ملف القواعد ثم أعد التوليد
+
+/** [specializationId, keywords] ordered by priority (first rule wins). */
+export const SPECIALIZATION_RULES: [string, string[]][] = [
+  ["1", ["قرآن", "إسلامي", "اسلامي", "إسلام", "اسلام", "دين", "توحيد", "فقه", "حديث", "تفسير", "تجويد"]],
+  ["18", ["تفكير", "تفكر"]],
+  ["2", ["عربية", "عربي", "لغوية", "لغتي", "نحو", "بلاغة"]],
+  ["10", ["كيمياء"]],
+  ["12", ["فيزياء"]],
+  ["11", ["أحياء"]],
+  ["20", ["أرض"]],
+  ["7", ["رقمية", "رقمي", "حاسب", "بيانات", "إنترنت", "تقنية"]],
+  ["3", ["رياضيات", "جبر"]],
+  ["4", ["علوم", "بيئة"]],
+  ["5", ["نجليز", "English", "صيني"]],
+  ["19", ["نفسية", "علم النفس"]],
+  ["6", ["اجتماعي", "تاريخ", "جغرافيا", "وطنية"]],
+  ["8", ["فنية", "فنون", "فني"]],
+  ["9", ["بدني", "لياقة", "رياضة", "التربية الصحية"]],
+  ["13", ["مالية", "أعمال", "اقتصاد", "إدارة", "إدارية"]],
+  ["22", ["هندسة"]],
+  ["24", ["مكتب", "مصادر"]],
+  ["14", ["فكرية"]],
+  ["15", ["صعوب"]],
+  ["16", ["توحد"]],
+  ["17", ["أسرية", "مهارات", "حياتية", "مهار"]],
+  ["99", ["بحرية"]],
+];
+
+const escapeRegExp = (s: string) => s.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+
+// Same folding as arabic_text.fold(): NFKC, no tatweel/diacritics, أإآٱ→ا، ى→ي، ة→ه
+export const foldArabic = (s: string): string =>
+  s.normalize('NFKC')
+    .replace(/[\u0640\u064B-\u065F\u0670\u06D6-\u06ED]/g, '')
+    .replace(/[أإآٱ]/g, 'ا')
+    .replace(/ى/g, 'ي')
+    .replace(/ة/g, 'ه')
+    .split(/\s+/).filter(Boolean).join(' ');
+
+// Lookahead per position: the first group that matches is the highest-priority rule there
+const RULES_PATTERN = new RegExp(
+  '(?=' + SPECIALIZATION_RULES.map(([, words]) => `(${words.map(w => escapeRegExp(foldArabic(w))).join('|')})`).join('|') + ')',
+  'g'
+);
+
+const cache = new Map<string, string | undefined>();
+
+/**
+ * Classify a subject or specialization name in one scan.
+ * Returns undefined when no rule matches.
+ */
+export function classifySpecialization(name: string): string | undefined {
+  if (cache.has(name)) return cache.get(name);
+
+  let best = -1;
+  for (const match of foldArabic(name).matchAll(RULES_PATTERN)) {
+    const index = match.findIndex((group, i) => i > 0 && group !== undefined) - 1;
+    if (index >= 0 && (best < 0 || index < best)) best = index;
+    if (best === 0) break;
+  }
+
+  const result = best >= 0 ? SPECIALIZATION_RULES[best][0] : undefined;
+  cache.set(name, result);
+  return result;
+}
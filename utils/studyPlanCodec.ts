@@ -0,0 +1,35 @@
+import { Phase, Subject } from '../types';
+
+/**
+ * Compact study-plan encoding of the `study_plan_chunks/` modules written by
+ * `generate_study_plans.py --split`; decoded by the loaders in `study_plan_chunks/index.ts`.
+ *
+ * Every string (plan keys, subject names, departments, phase names,
+ * specialization ids) is stored once in a string table; plans refer to it by index:
+ *   plan    = [keyIndex, phaseIndex, departmentIndex, subjects]
+ *   subject = [idSuffix, nameIndex, periodsPerClass, ...specializationIdIndexes]
+ * The subject id is rebuilt as `${key}_${idSuffix}`.
+ */
+export type EncodedSubject = [number | string, number, number, ...number[]];
+export type EncodedPlan = [number, number, number, EncodedSubject[]];
+
+export function decodeStudyPlans(strings: string[], plans: EncodedPlan[]): Record<string, Subject[]> {
+  const result: Record<string, Subject[]> = {};
+
+  for (const [keyIndex, phaseIndex, departmentIndex, subjects] of plans) {
+    const key = strings[keyIndex];
+    const phase = Phase[strings[phaseIndex] as keyof typeof Phase];
+    const department = strings[departmentIndex];
+
+    result[key] = subjects.map(([idSuffix, nameIndex, periodsPerClass, ...specIndexes]) => ({
+      id: `${key}_${idSuffix}`,
+      name: strings[nameIndex],
+      specializationIds: specIndexes.map(i => strings[i]),
+      periodsPerClass,
+      phases: [phase],
+      department,
+    }));
+  }
+
+  return result;
+}
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Round-trip check: do study_plans.ts and study_plans_config.ts still match
+the workbook?
+
+The generated TS is read with a small tokenizer (one compiled pattern for
+strings, numbers, identifiers and punctuation) and a recursive reader for
+the object/array literals, so field order, spacing or line breaks inside a
+plan do not matter. Each plan is reduced to a short hash over its subject
+names and periodsPerClass; the same hash is built from the workbook rows
+(plan_cache), and only plans whose hashes differ are compared in detail and
+reported. specializationIds are checked against the ids in constants.ts,
+and with --classifier against specializations.classify().
+
+    python verify_plans.py                      # الخطط الدراسية 1447هـ.xlsx
+    python verify_plans.py other.xlsx --classifier
+
+Exit status is 1 when anything differs, so it can run as a pre-commit hook.
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+import time
+
+from generate_study_plans import CONFIG_FILE, EXCEL_FILE, PLANS_FILE, build_plans, is_manual_id, read_text
+from plan_cache import load_plan_rows
+
+CONSTANTS_FILE = "constants.ts"
+
+TOKEN_RE = re.compile(r"""
+    (?P<skip>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+  | (?P<number>-?\d+(?:\.\d+)?)
+  | (?P<name>[A-Za-z_$][\w$]*(?:\.[A-Za-z_$][\w$]*)*)
+  | (?P<punct>[{}\[\]:,=<>;|?()])
+""", re.VERBOSE | re.DOTALL)
+
+ESCAPE_RE = re.compile(r"\\(.)")
+
+
+class TSSyntaxError(ValueError):
+    pass
+
+
+def tokenize(text, start=0):
+    """Yield (kind, value) tokens from `start`, skipping whitespace and comments."""
+    position = start
+    end = len(text)
+    while position < end:
+        match = TOKEN_RE.match(text, position)
+        if match is None:
+            raise TSSyntaxError(f"رمز غير متوقع عند الموضع {position}: {text[position:position + 20]!r}")
+        position = match.end()
+        kind = match.lastgroup
+        if kind == 'skip':
+            continue
+        value = match.group()
+        if kind == 'string':
+            value = ESCAPE_RE.sub(r"\1", value[1:-1])
+        elif kind == 'number':
+            value = float(value) if '.' in value else int(value)
+        yield kind, value
+
+
+class LiteralReader:
+    """Reads one JS object/array literal from a token stream into dict/list."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+
+    def next(self):
+        try:
+            return next(self.tokens)
+        except StopIteration:
+            raise TSSyntaxError("نهاية الملف قبل اكتمال الكائن")
+
+    def value(self, token=None):
+        kind, value = token or self.next()
+        if kind == 'punct' and value == '{':
+            return self.object()
+        if kind == 'punct' and value == '[':
+            return self.array()
+        if kind in ('string', 'number', 'name'):
+            # المعرفات مثل Phase.HIGH تبقى نصاً
+            return value
+        raise TSSyntaxError(f"قيمة غير متوقعة: {value!r}")
+
+    def object(self):
+        result = {}
+        while True:
+            kind, key = self.next()
+            if key == '}':
+                return result
+            if kind not in ('string', 'name', 'number'):
+                raise TSSyntaxError(f"مفتاح غير متوقع: {key!r}")
+            if self.next() != ('punct', ':'):
+                raise TSSyntaxError(f"متوقع ':' بعد {key!r}")
+            result[key] = self.value()
+            kind, value = self.next()
+            if value == '}':
+                return result
+            if value != ',':
+                raise TSSyntaxError(f"متوقع ',' أو '}}' بعد {key!r}")
+
+    def array(self):
+        result = []
+        while True:
+            token = self.next()
+            if token[1] == ']':
+                return result
+            result.append(self.value(token))
+            kind, value = self.next()
+            if value == ']':
+                return result
+            if value != ',':
+                raise TSSyntaxError("متوقع ',' أو ']' في المصفوفة")
+
+
+def read_export(text, name):
+    """Return the literal assigned to `export const <name>` in a TS file."""
+    match = re.search(rf"\bconst\s+{re.escape(name)}\b[^=]*=", text)
+    if match is None:
+        raise TSSyntaxError(f"لم يعثر على {name}")
+    return LiteralReader(tokenize(text, match.end())).value()
+
+
+def plan_hash(subjects):
+    # (اسم المادة، عدد الحصص) بالترتيب؛ الحصص الفارغة تولد 0 في الملف
+    digest = hashlib.blake2b(digest_size=8)
+    for name, periods in subjects:
+        digest.update(f"{name}\x1f{periods or 0}\x1e".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def ts_subjects(key, plan):
+    # المواد المضافة يدوياً (مثل <key>_0) ليست في Excel ويبقيها المولد كما هي
+    return [(subject['name'], subject['periodsPerClass']) for subject in plan
+            if not is_manual_id(key, subject['id'])]
+
+
+def first_difference(expected, actual):
+    for i, (want, got) in enumerate(zip(expected, actual), start=1):
+        if (want[0], want[1] or 0) != (got[0], got[1] or 0):
+            return f"المادة {i}: الملف {got[0]!r} ({got[1]}) | Excel {want[0]!r} ({want[1] or 0})"
+    return f"عدد المواد: الملف {len(actual)} | Excel {len(expected)}"
+
+
+def config_keys(config):
+    """Every plan key referenced anywhere in STUDY_PLANS_CONFIG."""
+    keys = []
+    stack = [config]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            for entry in node.get('plans', ()):
+                keys.append(entry['key'])
+            stack.extend(reversed(node.get('subDepartments', []) + node.get('departments', [])))
+    return keys
+
+
+def verify(excel_file=EXCEL_FILE, plans_file=PLANS_FILE, config_file=CONFIG_FILE, classifier=False):
+    """Return a list of (marker, key, detail) for every plan that differs."""
+    plans_ts = read_export(read_text(plans_file), 'STUDY_PLANS')
+    workbook = build_plans(load_plan_rows(excel_file))
+    problems = []
+
+    expected_hashes = {key: plan_hash(plan['subjects']) for key, plan in workbook.items()}
+    for key, plan in plans_ts.items():
+        if key not in expected_hashes:
+            problems.append(('-', key, "غير موجودة في Excel"))
+            continue
+        actual = ts_subjects(key, plan)
+        if plan_hash(actual) != expected_hashes[key]:
+            problems.append(('~', key, first_difference(workbook[key]['subjects'], actual)))
+    for key in workbook:
+        if key not in plans_ts:
+            problems.append(('+', key, "موجودة في Excel فقط"))
+
+    known_ids = {entry['id'] for entry in read_export(read_text(CONSTANTS_FILE), 'INITIAL_SPECIALIZATIONS')}
+    if classifier:
+        from specializations import specialization_ids
+    for key, plan in plans_ts.items():
+        for subject in plan:
+            ids = subject.get('specializationIds', [])
+            unknown = [spec_id for spec_id in ids if spec_id not in known_ids]
+            if unknown:
+                problems.append(('!', key, f"{subject['name']!r}: تخصص غير معروف {unknown}"))
+            elif classifier and ids != specialization_ids(subject['name']):
+                problems.append(('?', key, f"{subject['name']!r}: {ids} والمصنف {specialization_ids(subject['name'])}"))
+
+    if config_file:
+        referenced = config_keys(read_export(read_text(config_file), 'STUDY_PLANS_CONFIG'))
+        listed = set(referenced)
+        for key in referenced:
+            if key not in plans_ts:
+                problems.append(('-', key, f"في {config_file} وليست في {plans_file}"))
+        for key in plans_ts:
+            if key not in listed:
+                problems.append(('+', key, f"ليست في {config_file}"))
+    return problems
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="مطابقة study_plans.ts و study_plans_config.ts مع ملف Excel")
+    parser.add_argument('workbook', nargs='?', default=EXCEL_FILE)
+    parser.add_argument('--plans', default=PLANS_FILE)
+    parser.add_argument('--config', default=CONFIG_FILE, help="'' لتخطي فحص ملف الإعدادات")
+    parser.add_argument('--classifier', action='store_true',
+                        help="مقارنة specializationIds مع المصنف (التعديلات اليدوية تظهر كفروقات)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    problems = verify(args.workbook, args.plans, args.config, args.classifier)
+    for marker, key, detail in problems:
+        print(f"{marker} {key}: {detail}")
+    elapsed = time.perf_counter() - started
+    status = "✓ متطابقة" if not problems else f"✗ {len(problems)} فرق"
+    print(f"{status} ({elapsed:.2f} ث)", file=sys.stderr)
+    sys.exit(1 if problems else 0)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Waiting-duty (انتظار) distribution with the same rules as distributeWaiting()
+(utils/waitingDistributor.ts).
+
+distributeWaiting() rescans the whole timetable for every candidate's load
+in every day and period. Here the timetable is read once into two
+occupancy.OccupancyGrid layers, lessons and waiting. These are unpacked
+into teacher x day x period bool arrays. Free slots, each candidate's
+remaining weekly quota (maxTotalQuota) and each candidate's remaining
+daily quota (maxDailyTotal) are then array expressions over all
+candidates at once.
+
+Slots are filled in layers: the first layer gives every slot one waiting
+teacher, the second gives it two, and so on. Within a layer the slots with
+the fewest eligible candidates go first. Each slot takes the candidate of
+minimum cost (weekly load, then load on that day), so duties go to the
+least loaded staff and spread over the week.
+
+- fixed: layers up to substitution.fixedPerPeriod. A slot that has no
+  eligible candidate tries one exchange: a free candidate who is at quota
+  hands one of their new waiting slots to someone else and takes this one.
+- auto: layers continue until nobody has quota left, the TS behaviour of
+  "fill the gaps up to each teacher's limit", but evenly across periods.
+- manual: nothing is added.
+
+Admins are candidates with no lessons, as in the TS; their waitingQuota,
+when set, caps their waiting periods. Existing waiting entries count and
+are kept.
+
+Input is the solver's JSON (timetable_solver.py) plus "admins"; the
+timetable is input.timetable or input.settings.timetable.
+
+    python waiting_distributor.py input.json -o timetable.json
+    python waiting_distributor.py input.json --method fixed --per-period 5
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+from occupancy import OccupancyGrid, slot_key
+from timetable_solver import load_input, write_json
+
+DEFAULT_MAX_TOTAL = 24      # كما في waitingDistributor.ts
+DEFAULT_MAX_DAILY = 5
+
+
+class WaitingResult(NamedTuple):
+    timetable: Dict[str, dict]
+    added: List[str]
+    shortages: List[Tuple[str, int, int]]   # (اليوم، الحصة، العدد الناقص) في الطريقة المحددة
+    stats: dict
+
+
+class WaitingDistributor:
+    """Lesson and waiting matrices for one timetable, filled in place by fill()."""
+
+    def __init__(self, timetable, teachers, admins, substitution, days, periods_per_day):
+        substitution = substitution or {}
+        self.days = list(days)
+        self.periods = periods_per_day
+        self.max_total = substitution.get('maxTotalQuota') or DEFAULT_MAX_TOTAL
+        self.max_daily = substitution.get('maxDailyTotal') or DEFAULT_MAX_DAILY
+        self.ids = [teacher['id'] for teacher in teachers] + [admin['id'] for admin in admins]
+        self.n = len(self.ids)
+
+        lessons = {key: entry for key, entry in timetable.items() if entry.get('type') != 'waiting'}
+        waiting = {key: entry for key, entry in timetable.items() if entry.get('type') == 'waiting'}
+        # أصحاب المفاتيح غير المعروفين يضافون بعد المرشحين ولا يدخلون التوزيع
+        self.grids = [OccupancyGrid.from_timetable(layer, self.days, periods_per_day, teacher_ids=self.ids)
+                      for layer in (lessons, waiting)]
+        lesson_bits, waiting_bits = (self._unpack(grid.teachers[:self.n]) for grid in self.grids)
+
+        self.busy = lesson_bits | waiting_bits                      # (المرشح، اليوم، الحصة)
+        self.waiting = waiting_bits
+        self.added = np.zeros_like(self.busy)                       # ما أضافه هذا التوزيع ويجوز نقله
+        self.daily = self.busy.sum(axis=2)                          # (المرشح، اليوم)
+        self.total = self.daily.sum(axis=1)
+        self.cap = np.full(self.n, self.max_total, dtype=np.int64)
+        for a, admin in enumerate(admins, start=len(teachers)):
+            if admin.get('waitingQuota') is not None:
+                self.cap[a] = min(self.max_total, self.total[a] + int(admin['waitingQuota']))
+
+    def _unpack(self, words):
+        periods = np.arange(self.periods, dtype=np.uint64)
+        return ((words[:, :, None] >> periods) & np.uint64(1)).astype(bool)
+
+    # ---- الأهلية والتكلفة: متجهة على كل المرشحين ----
+
+    def eligible(self, d, p):
+        return ~self.busy[:, d, p] & (self.total < self.cap) & (self.daily[:, d] < self.max_daily)
+
+    def cost(self, d):
+        # النصاب الأسبوعي أولاً ثم حمل اليوم
+        return self.total * (self.periods + 1) + self.daily[:, d]
+
+    def cheapest(self, mask, d):
+        return int(np.argmin(np.where(mask, self.cost(d), np.iinfo(np.int64).max)))
+
+    def coverage(self):
+        return self.waiting.sum(axis=0)
+
+    def assign(self, t, d, p):
+        self.busy[t, d, p] = self.waiting[t, d, p] = self.added[t, d, p] = True
+        self.daily[t, d] += 1
+        self.total[t] += 1
+
+    def release(self, t, d, p):
+        self.busy[t, d, p] = self.waiting[t, d, p] = self.added[t, d, p] = False
+        self.daily[t, d] -= 1
+        self.total[t] -= 1
+
+    # ---- التوزيع ----
+
+    def fill(self, target=None):
+        """Fill layers up to `target` waiting per slot (None: until nobody has quota left)."""
+        if self.coverage().size == 0:
+            return
+        layer = 0
+        while target is None or layer < target:
+            layer += 1
+            eligible = ~self.busy & (self.total < self.cap)[:, None, None] & (self.daily < self.max_daily)[:, :, None]
+            if target is None and not eligible.any():
+                # لم يبق لأحد نصاب
+                break
+            need = self.coverage() < layer
+            if not need.any():
+                continue
+            counts = np.where(need, eligible.sum(axis=0), -1).ravel()
+            order = np.argsort(counts, kind='stable')
+            progress = False
+            for slot in order[np.searchsorted(counts[order], 0):]:
+                d, p = divmod(int(slot), self.periods)
+                mask = self.eligible(d, p)
+                if mask.any():
+                    self.assign(self.cheapest(mask, d), d, p)
+                    progress = True
+                elif target is not None and self.exchange(d, p):
+                    progress = True
+            if not progress:
+                break
+
+    def exchange(self, d, p):
+        """
+        Give slot (d, p) to a free candidate who is at quota, by moving one of
+        their added waiting slots to another eligible candidate.
+        """
+        free = ~self.busy[:, d, p] & ~self.eligible(d, p)
+        for x in np.nonzero(free)[0][np.argsort(self.cost(d)[free], kind='stable')]:
+            sources = self.added[x].copy()
+            if self.daily[x, d] >= self.max_daily:
+                # بلغ حده اليومي: يجب أن يتخلى عن حصة في اليوم نفسه
+                sources[np.arange(len(self.days)) != d] = False
+            for d2, p2 in zip(*np.nonzero(sources)):
+                mask = self.eligible(d2, p2)
+                mask[x] = False
+                if mask.any():
+                    self.release(x, d2, p2)
+                    self.assign(self.cheapest(mask, d2), d2, p2)
+                    self.assign(x, d, p)
+                    return True
+        return False
+
+    def new_entries(self):
+        for t, d, p in zip(*np.nonzero(self.added)):
+            yield slot_key(self.ids[t], self.days[d], int(p) + 1)
+
+
+def distribute_waiting(timetable, teachers, admins, settings, days, periods_per_day, method=None, per_period=None):
+    # type: (Dict[str, dict], list, list, dict, List[str], int, str, int) -> WaitingResult
+    """Return the timetable with waiting duties added; see the module docstring."""
+    started = time.perf_counter()
+    substitution = dict((settings or {}).get('substitution') or {})
+    method = method or substitution.get('method') or 'manual'
+    target = per_period if per_period is not None else (substitution.get('fixedPerPeriod') or 0)
+
+    distributor = WaitingDistributor(timetable, teachers, admins, substitution, days, periods_per_day)
+    if method == 'fixed' and target > 0:
+        distributor.fill(target)
+    elif method == 'auto':
+        distributor.fill()
+
+    added = sorted(distributor.new_entries())
+    new_timetable = dict(timetable)
+    for key in added:
+        new_timetable[key] = {'teacherId': key.rsplit('-', 2)[0], 'type': 'waiting'}
+
+    coverage = distributor.coverage()
+    shortages = []
+    if method == 'fixed':
+        for d, p in zip(*np.nonzero(coverage < target)):
+            shortages.append((distributor.days[d], int(p) + 1, int(target - coverage[d, p])))
+    waiting = distributor.waiting.sum(axis=(1, 2))
+    stats = {
+        'method': method,
+        'candidates': distributor.n,
+        'added': len(added),
+        'minPerPeriod': int(coverage.min()) if coverage.size else 0,
+        'maxPerPeriod': int(coverage.max(initial=0)),
+        'minWaiting': int(waiting.min()) if waiting.size else 0,
+        'maxWaiting': int(waiting.max(initial=0)),
+        'maxTotalLoad': int(distributor.total.max(initial=0)),
+        'shortage': sum(missing for _, _, missing in shortages),
+        'seconds': round(time.perf_counter() - started, 3),
+    }
+    return WaitingResult(new_timetable, added, shortages, stats)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="توزيع حصص الانتظار على فراغات المعلمين والإداريين")
+    parser.add_argument('input', help="ملف JSON بمدخلات المولد مع admins، أو - للقراءة من stdin")
+    parser.add_argument('--timetable', help="الجدول الحالي (الافتراضي: timetable أو settings.timetable)")
+    parser.add_argument('-o', '--output', help="ملف TimetableData (الافتراضي: الطباعة)")
+    parser.add_argument('--method', choices=('auto', 'fixed', 'manual'), help="الافتراضي: substitution.method")
+    parser.add_argument('--per-period', type=int, help="عدد المنتظرين لكل حصة في الطريقة المحددة")
+    args = parser.parse_args()
+
+    data = load_input(args.input)
+    settings = data.get('settings') or {}
+    options = data.get('options') or {}
+    current = load_input(args.timetable) if args.timetable else data.get('timetable') or settings.get('timetable') or {}
+    result = distribute_waiting(current, data.get('teachers') or [], data.get('admins') or [], settings,
+                                options.get('activeDays') or [], int(options.get('periodsPerDay') or 0),
+                                args.method, args.per_period)
+    write_json(result.timetable, args.output)
+    stats = result.stats
+    print(f"✓ {stats['added']} حصة انتظار ({stats['method']}) | لكل حصة: {stats['minPerPeriod']}-{stats['maxPerPeriod']} | "
+          f"لكل مرشح: {stats['minWaiting']}-{stats['maxWaiting']} | نقص: {stats['shortage']} | "
+          f"{stats['seconds']} ث", file=sys.stderr)
+    for day, period, missing in result.shortages[:20]:
+        print(f"  ✗ {day} الحصة {period}: ينقص {missing}", file=sys.stderr)
+    sys.exit(0 if not result.shortages else 2)